@@ -27,14 +27,15 @@ Implementation Notes
 
 """
 
+import array as _array
 import math as _math
-import re as _re
+import struct as _struct
 import time as _time
 
 from micropython import const
 
 try:
-    from typing import Any, List, Optional, Sequence, Tuple, Union
+    from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 except ImportError:
     pass
 
@@ -45,6 +46,7 @@ __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_DateTime.git"
 MINYEAR = const(1)
 MAXYEAR = const(9999)
 _MAXORDINAL = const(3652059)
+_EPOCH_ORDINAL = const(719163)  # 1970-01-01
 _DI400Y = const(146097)
 _DI100Y = const(36524)
 _DI4Y = const(1461)
@@ -68,6 +70,31 @@ _MONTHNAMES = (
     "Dec",
 )
 _DAYNAMES = (None, "Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_FULL_MONTHNAMES = (
+    None,
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+_FULL_DAYNAMES = (
+    None,
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
 
 _INVALID_ISO_ERROR = "Invalid isoformat string: '{}'"
 
@@ -181,14 +208,39 @@ def _days_before_year(year: int) -> int:
     return year * 365 + year // 4 - year // 100 + year // 400
 
 
+# _days_before_year() for every year 0..MAXYEAR + 1 while use_ordinal_table()
+# is enabled, otherwise empty. Filled and emptied in place.
+_YEAR_STARTS = []
+
+
 def _ymd2ord(year: int, month: int, day: int) -> int:
     "year, month, day -> ordinal, considering 01-Jan-0001 as day 1."
     assert 1 <= month <= 12, "month must be in 1..12"
+    if _YEAR_STARTS:
+        before = _YEAR_STARTS[year]
+        if month > 2 and _YEAR_STARTS[year + 1] - before == 366:
+            before += 1
+        return before + _DAYS_BEFORE_MONTH[month] + day
     dim = _days_in_month(year, month)
     assert 1 <= day <= dim, f"day must be in 1..{dim}"
     return _days_before_year(year) + _days_before_month(year, month) + day
 
 
+def _split_timestamp(t: float) -> Tuple[int, int]:
+    "POSIX timestamp -> (whole seconds, microseconds), rounded half to even."
+    if isinstance(t, float):
+        frac, t = _math.modf(t)
+        us = round(frac * 1e6)
+        if us >= 1000000:
+            t += 1
+            us -= 1000000
+        elif us < 0:
+            t -= 1
+            us += 1000000
+        return int(t), us
+    return t, 0
+
+
 def _build_struct_time(
     tm_year: int,
     tm_month: int,
@@ -226,6 +278,607 @@ def _format_time(hh: int, mm: int, ss: int, us: int, timespec: str = "auto") ->
     return fmt.format(hh, mm, ss, us)
 
 
+# Utility functions - binary encoding
+# Each class packs into a fixed number of big-endian bytes, its packed_size,
+# through _pack(buffer, offset) and reads them back with _unpack(buffer,
+# offset, ...). The helpers below walk a buffer for the bulk variants.
+def _check_buffer(buffer: Any, offset: int, size: int) -> None:
+    if offset < 0 or offset + size > len(buffer):
+        raise ValueError(f"buffer too small for {size} bytes at offset {offset}")
+
+
+def _pack_items(cls: type, buffer: Any, offset: int, items: Iterable[Any]) -> int:
+    "Pack items of cls one after another from offset -> offset past the last."
+    size = cls.packed_size
+    pack = cls._pack
+    for item in items:
+        if not isinstance(item, cls):
+            raise TypeError(f"expected {cls.__name__}, not {type(item).__name__}")
+        _check_buffer(buffer, offset, size)
+        pack(item, buffer, offset)
+        offset += size
+    return offset
+
+
+def _unpack_items(cls: type, buffer: Any, offset: int, count: int, *args: Any) -> list:
+    "Read count consecutive items of cls starting at offset."
+    size = cls.packed_size
+    _check_buffer(buffer, offset, count * size)
+    unpack = cls._unpack
+    return [unpack(buffer, offset + i * size, *args) for i in range(count)]
+
+
+class _LRUCache:
+    """A small mapping that holds at most maxsize entries and evicts the
+    least recently used one when full. Works without OrderedDict or functools.
+
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._entries = {}
+        self._tick = 0
+
+    def get(self, key: Any) -> Any:
+        "Return the value cached for key, or None."
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._tick += 1
+        entry[0] = self._tick
+        return entry[1]
+
+    def put(self, key: Any, value: Any) -> None:
+        "Cache value for key, evicting the least recently used entry if full."
+        entries = self._entries
+        if key not in entries and len(entries) >= self._maxsize:
+            del entries[min(entries, key=lambda k: entries[k][0])]
+        self._tick += 1
+        entries[key] = [self._tick, value]
+
+    def pop(self, key: Any) -> None:
+        "Drop the entry for key, if there is one."
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        "Drop every cached entry."
+        self._entries.clear()
+
+
+# Utility functions - strftime
+# Emitters receive the (year, month, day, hour, minute, second, microsecond)
+# fields of the object being formatted plus the object consulted for %z/%Z
+# (None for dates), and return the text for one directive.
+def _strftime_weekday(f: Tuple[int, ...]) -> int:
+    "Fields -> day of the week, where Monday is 0 and Sunday is 6."
+    return (_ymd2ord(f[0], f[1], f[2]) + 6) % 7
+
+
+def _strftime_yday(f: Tuple[int, ...]) -> int:
+    "Fields -> day of the year, where January 1st is 1."
+    return _days_before_month(f[0], f[1]) + f[2]
+
+
+def _strftime_offset(tzobj: Any) -> str:
+    if tzobj is None:
+        return ""
+    return _format_offset(tzobj.utcoffset()).replace(":", "")
+
+
+def _strftime_tzname(tzobj: Any) -> str:
+    if tzobj is None:
+        return ""
+    return tzobj.tzname() or ""
+
+
+_STRFTIME_EMITTERS = {
+    "a": lambda f, tz: _DAYNAMES[_strftime_weekday(f) + 1],
+    "A": lambda f, tz: _FULL_DAYNAMES[_strftime_weekday(f) + 1],
+    "b": lambda f, tz: _MONTHNAMES[f[1]],
+    "B": lambda f, tz: _FULL_MONTHNAMES[f[1]],
+    "c": lambda f, tz: (
+        f"{_DAYNAMES[_strftime_weekday(f) + 1]} {_MONTHNAMES[f[1]]} {f[2]:2d} "
+        f"{f[3]:02d}:{f[4]:02d}:{f[5]:02d} {f[0]:04d}"
+    ),
+    "d": lambda f, tz: f"{f[2]:02d}",
+    "e": lambda f, tz: f"{f[2]:2d}",
+    "f": lambda f, tz: f"{f[6]:06d}",
+    "H": lambda f, tz: f"{f[3]:02d}",
+    "I": lambda f, tz: f"{f[3] % 12 or 12:02d}",
+    "j": lambda f, tz: f"{_strftime_yday(f):03d}",
+    "m": lambda f, tz: f"{f[1]:02d}",
+    "M": lambda f, tz: f"{f[4]:02d}",
+    "p": lambda f, tz: "AM" if f[3] < 12 else "PM",
+    "S": lambda f, tz: f"{f[5]:02d}",
+    "u": lambda f, tz: str(_strftime_weekday(f) + 1),
+    "U": lambda f, tz: f"{(_strftime_yday(f) + 6 - (_strftime_weekday(f) + 1) % 7) // 7:02d}",
+    "w": lambda f, tz: str((_strftime_weekday(f) + 1) % 7),
+    "W": lambda f, tz: f"{(_strftime_yday(f) + 6 - _strftime_weekday(f)) // 7:02d}",
+    "x": lambda f, tz: f"{f[1]:02d}/{f[2]:02d}/{f[0] % 100:02d}",
+    "X": lambda f, tz: f"{f[3]:02d}:{f[4]:02d}:{f[5]:02d}",
+    "y": lambda f, tz: f"{f[0] % 100:02d}",
+    "Y": lambda f, tz: f"{f[0]:04d}",
+    "z": lambda f, tz: _strftime_offset(tz),
+    "Z": lambda f, tz: _strftime_tzname(tz),
+}
+_STRFTIME_CACHE = _LRUCache(16)
+
+
+def _compile_strftime(fmt: str) -> tuple:
+    """Format string -> plan of literal strings and emitters.
+
+    Unknown directives and a trailing ``%`` are kept as literal text.
+    """
+    plan = []
+    literal = ""
+    pos = 0
+    end = len(fmt)
+    while pos < end:
+        percent = fmt.find("%", pos)
+        if percent < 0 or percent + 1 == end:
+            literal += fmt[pos:]
+            break
+        literal += fmt[pos:percent]
+        directive = fmt[percent + 1]
+        emitter = _STRFTIME_EMITTERS.get(directive)
+        if emitter is None:
+            literal += "%" if directive == "%" else fmt[percent : percent + 2]
+        else:
+            if literal:
+                plan.append(literal)
+                literal = ""
+            plan.append(emitter)
+        pos = percent + 2
+    if literal:
+        plan.append(literal)
+    return tuple(plan)
+
+
+def _strftime(fmt: str, fields: Tuple[int, ...], tzobj: Any) -> str:
+    "Format fields with a plan compiled once per format string and cached."
+    if not isinstance(fmt, str):
+        raise TypeError(f"must be str, not {type(fmt).__name__}")
+    plan = _STRFTIME_CACHE.get(fmt)
+    if plan is None:
+        plan = _compile_strftime(fmt)
+        _STRFTIME_CACHE.put(fmt, plan)
+    return "".join([part if part.__class__ is str else part(fields, tzobj) for part in plan])
+
+
+# Utility functions - strptime
+# A compiled parse plan is a tuple of (kind, arg, slot) steps. Parsed values
+# go into a list of fields: year, month, day, hour, minute, second and
+# microsecond, followed by the slots below.
+_STRPTIME_LITERAL = const(0)
+_STRPTIME_SPACE = const(1)
+_STRPTIME_NUMBER = const(2)
+_STRPTIME_FIXED = const(3)
+_STRPTIME_FRACTION = const(4)
+_STRPTIME_NAME = const(5)
+_STRPTIME_OFFSET = const(6)
+_STRPTIME_AMPM = const(7)
+_STRPTIME_YDAY = const(8)
+_STRPTIME_YEAR2 = const(9)
+_STRPTIME_HOUR12 = const(10)
+_STRPTIME_TZ = const(11)
+_STRPTIME_UNUSED = const(12)
+_STRPTIME_NAME_MAX = const(9)  # September, Wednesday
+
+
+def _strptime_names(*tables: Sequence[Optional[str]]) -> dict:
+    "Name tables -> {lowercase name: index} for their non-None entries."
+    names = {}
+    for table in tables:
+        for i, name in enumerate(table):
+            if name is not None:
+                names[name.lower()] = i
+    return names
+
+
+# directive -> (kind, field or name table, (maximum width, lowest value, highest
+# value) of a number or field to store a name in)
+_STRPTIME_DIRECTIVES = {
+    "Y": (_STRPTIME_FIXED, 0, (4, MINYEAR, MAXYEAR)),
+    "y": (_STRPTIME_FIXED, _STRPTIME_YEAR2, (2, 0, 99)),
+    "m": (_STRPTIME_NUMBER, 1, (2, 1, 12)),
+    "d": (_STRPTIME_NUMBER, 2, (2, 1, 31)),
+    "H": (_STRPTIME_NUMBER, 3, (2, 0, 23)),
+    "I": (_STRPTIME_NUMBER, _STRPTIME_HOUR12, (2, 1, 12)),
+    "M": (_STRPTIME_NUMBER, 4, (2, 0, 59)),
+    "S": (_STRPTIME_NUMBER, 5, (2, 0, 59)),
+    "j": (_STRPTIME_NUMBER, _STRPTIME_YDAY, (3, 1, 366)),
+    "f": (_STRPTIME_FRACTION, 6, (6, 0, 999999)),
+    "b": (_STRPTIME_NAME, _strptime_names(_MONTHNAMES, _FULL_MONTHNAMES), 1),
+    "a": (_STRPTIME_NAME, _strptime_names(_DAYNAMES, _FULL_DAYNAMES), None),
+    "p": (_STRPTIME_NAME, {"am": 0, "pm": 12}, _STRPTIME_AMPM),
+    "z": (_STRPTIME_OFFSET, None, _STRPTIME_TZ),
+}
+_STRPTIME_DIRECTIVES["B"] = _STRPTIME_DIRECTIVES["b"]
+_STRPTIME_DIRECTIVES["A"] = _STRPTIME_DIRECTIVES["a"]
+_STRPTIME_CACHE = _LRUCache(16)
+
+# Fixed offset timezones shared by timezone.intern() and the parsers.
+_TIMEZONE_CACHE = _LRUCache(32)
+
+
+def _compile_strptime(fmt: str) -> tuple:
+    "Format string -> tuple of parse steps."
+    plan = []
+    literal = ""
+    pos = 0
+    end = len(fmt)
+    while pos < end:
+        char = fmt[pos]
+        step = None
+        if char.isspace():
+            while pos < end and fmt[pos].isspace():
+                pos += 1
+            step = (_STRPTIME_SPACE, None, None)
+        elif char == "%":
+            if pos + 1 == end:
+                raise ValueError(f"stray % in format '{fmt}'")
+            directive = fmt[pos + 1]
+            pos += 2
+            if directive == "%":
+                literal += "%"
+                continue
+            step = _STRPTIME_DIRECTIVES.get(directive)
+            if step is None:
+                raise ValueError(f"'{directive}' is a bad directive in format '%{directive}'")
+        else:
+            literal += char
+            pos += 1
+            continue
+        if literal:
+            plan.append((_STRPTIME_LITERAL, literal, len(literal)))
+            literal = ""
+        plan.append(step)
+    if literal:
+        plan.append((_STRPTIME_LITERAL, literal, len(literal)))
+    # As in CPython, the year comes from whichever of %Y and %y is last, and
+    # the hour from whichever of %H and %I is: earlier ones are parsed unused.
+    for group in ((0, _STRPTIME_YEAR2), (3, _STRPTIME_HOUR12)):
+        found = [
+            i
+            for i, (kind, arg, _) in enumerate(plan)
+            if _STRPTIME_NUMBER <= kind <= _STRPTIME_FIXED and arg in group
+        ]
+        for i in found[:-1]:
+            plan[i] = (plan[i][0], _STRPTIME_UNUSED, plan[i][2])
+    # A number only needs to try fewer digits when the next step could take
+    # the digits it leaves, otherwise the longest one in range is final.
+    for i, (kind, arg, slot) in enumerate(plan):
+        if _STRPTIME_NUMBER <= kind <= _STRPTIME_FRACTION:
+            after, text, _ = plan[i + 1] if i + 1 < len(plan) else (None, None, None)
+            if after == _STRPTIME_LITERAL:
+                retry = text[0].isdigit()
+            else:
+                retry = after is not None and _STRPTIME_NUMBER <= after <= _STRPTIME_FRACTION
+            plan[i] = (kind, arg, slot + (retry,))
+    return tuple(plan)
+
+
+def _strptime_offset(string: str, pos: int, end: int) -> List[Tuple[int, int]]:
+    """End positions and values in microseconds of the UTC offsets, Z or
+    +HH[:]MM[[:]SS[.ffffff]], that string has at pos -> longest first.
+
+    """
+    if string.startswith("Z", pos):
+        return [(pos + 1, 0)]
+    if pos >= end or string[pos] not in {"+", "-"}:
+        return []
+    sign = -1 if string[pos] == "-" else 1
+    sep = ":" if string.startswith(":", pos + 3) else ""
+    pos += 3 + len(sep)
+    try:
+        seconds = _iso_digits(string, pos - 2 - len(sep), 2, end) * 3600
+        if string[pos] > "5":
+            return []
+        seconds += _iso_digits(string, pos, 2, end) * 60
+    except (ValueError, IndexError):
+        return []
+    pos += 2
+    choices = [(pos, sign * seconds * 1000000)]
+    if string.startswith(sep, pos) and string[pos + len(sep) : pos + len(sep) + 1] <= "5":
+        try:
+            seconds += _iso_digits(string, pos + len(sep), 2, end)
+        except ValueError:
+            return choices
+        pos += len(sep) + 2
+        choices.append((pos, sign * seconds * 1000000))
+        if string.startswith(".", pos):
+            fraction = 0
+            for digits in range(1, 7):
+                digit = (
+                    _ISO_CHARS.get(string[pos + digits], _ISO_COLON) if pos + digits < end else 10
+                )
+                if digit > 9:
+                    break
+                fraction = fraction * 10 + digit
+                choices.append(
+                    (pos + digits + 1, sign * (seconds * 1000000 + fraction * 10 ** (6 - digits)))
+                )
+    choices.reverse()
+    return choices
+
+
+def _strptime_name(string: str, pos: int, end: int, names: dict) -> List[Tuple[int, int]]:
+    """End positions and values of the names in names that string has at pos
+    -> longest first.
+
+    """
+    stop = pos
+    while stop < end and stop - pos < _STRPTIME_NAME_MAX and string[stop].isalpha():
+        stop += 1
+    word = string[pos:stop].lower()
+    return [
+        (pos + size, names[word[:size]]) for size in range(len(word), 0, -1) if word[:size] in names
+    ]
+
+
+def _strptime_number(
+    string: str, pos: int, end: int, kind: int, width: int, low: int, high: int
+) -> List[Tuple[int, int]]:
+    """End positions and values of the numbers in low..high that string has at
+    pos, up to width digits (exactly width for _STRPTIME_FIXED) -> longest first.
+
+    """
+    chars = _ISO_CHARS
+    choices = []
+    value = digits = 0
+    while digits < width and pos < end:
+        digit = chars.get(string[pos], _ISO_COLON)
+        if digit > 9:
+            break
+        value = value * 10 + digit
+        digits += 1
+        pos += 1
+        number = value * 10 ** (width - digits) if kind == _STRPTIME_FRACTION else value
+        if low <= number <= high and (kind != _STRPTIME_FIXED or digits == width):
+            choices.append((pos, number))
+    choices.reverse()
+    return choices
+
+
+def _strptime_scan(string: str, plan: tuple, fields: list, first: int = 0, pos: int = 0) -> int:
+    """Run a parse plan from its first-th step over string at pos, storing into
+    fields -> end position. Where a number, name or UTC offset could end at
+    several places, the longest one letting the rest of the plan match wins,
+    as with CPython's regular expressions.
+
+    """
+    chars = _ISO_CHARS
+    end = len(string)
+    for step in range(first, len(plan)):
+        kind, arg, slot = plan[step]
+        if kind == _STRPTIME_LITERAL:
+            if not string.startswith(arg, pos):
+                raise ValueError()
+            pos += slot
+            continue
+        if kind == _STRPTIME_SPACE:
+            while pos < end and string[pos].isspace():
+                pos += 1
+            continue
+        if kind == _STRPTIME_NAME:
+            choices = _strptime_name(string, pos, end, arg)
+        elif kind == _STRPTIME_OFFSET:
+            choices = _strptime_offset(string, pos, end)
+        else:
+            width, low, high, retry = slot
+            if not retry:
+                # Common case: the longest number is final if it is in range.
+                value = digits = 0
+                while digits < width and pos + digits < end:
+                    digit = chars.get(string[pos + digits], _ISO_COLON)
+                    if digit > 9:
+                        break
+                    value = value * 10 + digit
+                    digits += 1
+                if kind == _STRPTIME_FRACTION:
+                    value *= 10 ** (width - digits)
+                if digits and low <= value <= high and (kind != _STRPTIME_FIXED or digits == width):
+                    fields[arg] = value
+                    pos += digits
+                    continue
+            choices = _strptime_number(string, pos, end, kind, width, low, high)
+            if not retry:
+                del choices[1:]
+            slot = arg
+        if not choices:
+            raise ValueError()
+        for stop, value in choices[:-1]:
+            if slot is not None:
+                fields[slot] = value
+            try:
+                return _strptime_scan(string, plan, fields, step + 1, stop)
+            except (ValueError, KeyError, IndexError):
+                pass
+        pos, value = choices[-1]
+        if slot is not None:
+            fields[slot] = value
+    return pos
+
+
+def _strptime(string: str, fmt: str) -> Tuple[int, ...]:
+    """Parse string against a plan compiled once per fmt and cached -> (year,
+    month, day, hour, minute, second, microsecond, offset), where offset is the
+    UTC offset in microseconds or None.
+
+    """
+    if not isinstance(string, str) or not isinstance(fmt, str):
+        raise TypeError("strptime() argument must be str")
+    plan = _STRPTIME_CACHE.get(fmt)
+    if plan is None:
+        plan = _compile_strptime(fmt)
+        _STRPTIME_CACHE.put(fmt, plan)
+    fields = [1900, 1, 1, 0, 0, 0, 0, 0, None, None, None, None, None]
+    try:
+        pos = _strptime_scan(string, plan, fields)
+    except (ValueError, KeyError, IndexError):
+        raise ValueError(f"time data {string!r} does not match format {fmt!r}") from None
+    if pos != len(string):
+        raise ValueError(f"unconverted data remains: {string[pos:]}")
+
+    year, month, day, hour = fields[0], fields[1], fields[2], fields[3]
+    if fields[_STRPTIME_YEAR2] is not None:
+        year = fields[_STRPTIME_YEAR2] + (1900 if fields[_STRPTIME_YEAR2] >= 69 else 2000)
+    if fields[_STRPTIME_HOUR12] is not None:
+        hour = fields[_STRPTIME_HOUR12] % 12 + fields[_STRPTIME_AMPM]
+    yday = fields[_STRPTIME_YDAY]
+    if yday is not None:
+        if not 1 <= yday <= 365 + _is_leap(year):
+            raise ValueError(f"day of the year {yday} is out of range for {year}")
+        year, month, day = _ord2ymd(_days_before_year(year) + yday)
+    return year, month, day, hour, fields[4], fields[5], fields[6], fields[_STRPTIME_TZ]
+
+
+# Utility functions - ISO 8601 parsing
+# Character classes used by the ISO 8601 scanner: digits map to their value,
+# the separators we understand map to codes above 9, anything else is absent.
+# Keys exist both as characters and as byte values, so the same scanner reads
+# str as well as bytes, bytearray and memoryview buffers in place.
+_ISO_COLON = const(10)
+_ISO_DOT = const(11)
+_ISO_PLUS = const(12)
+_ISO_MINUS = const(13)
+_ISO_ZULU = const(14)
+_ISO_CHARS = {
+    "0": 0,
+    "1": 1,
+    "2": 2,
+    "3": 3,
+    "4": 4,
+    "5": 5,
+    "6": 6,
+    "7": 7,
+    "8": 8,
+    "9": 9,
+    ":": _ISO_COLON,
+    ".": _ISO_DOT,
+    "+": _ISO_PLUS,
+    "-": _ISO_MINUS,
+    "Z": _ISO_ZULU,
+}
+_ISO_CHARS.update({ord(char): code for char, code in _ISO_CHARS.items()})
+
+
+def _iso_window(iso: Union[str, bytes], offset: int, length: Optional[int]) -> int:
+    "Check the offset/length window onto iso -> end position of the window."
+    end = len(iso) if length is None else offset + length
+    if not 0 <= offset <= end <= len(iso):
+        raise ValueError("offset and length must lie within the string or buffer")
+    return end
+
+
+def _iso_error(iso: Union[str, bytes], pos: int, end: int) -> ValueError:
+    "Build the error for a window of iso that failed to parse."
+    if isinstance(iso, str):
+        text = iso[pos:end] if pos or end != len(iso) else iso
+    else:
+        text = "".join([chr(byte) for byte in iso[pos:end]])
+    return ValueError(_INVALID_ISO_ERROR.format(text))
+
+
+def _iso_digits(iso: Union[str, bytes], pos: int, count: int, end: int) -> int:
+    "Scan exactly count decimal digits starting at pos -> integer value."
+    if pos + count > end:
+        raise ValueError()
+    value = 0
+    chars = _ISO_CHARS
+    for i in range(pos, pos + count):
+        digit = chars.get(iso[i], _ISO_COLON)
+        if digit > 9:
+            raise ValueError()
+        value = value * 10 + digit
+    return value
+
+
+def _parse_isoformat_date(iso: Union[str, bytes], pos: int, end: int) -> Tuple[int, int, int]:
+    "Scan YYYY-MM-DD from iso[pos:end] -> (year, month, day)."
+    if end - pos != 10:
+        raise ValueError()
+    chars = _ISO_CHARS
+    if chars.get(iso[pos + 4]) != _ISO_MINUS or chars.get(iso[pos + 7]) != _ISO_MINUS:
+        raise ValueError()
+    return (
+        _iso_digits(iso, pos, 4, end),
+        _iso_digits(iso, pos + 5, 2, end),
+        _iso_digits(iso, pos + 8, 2, end),
+    )
+
+
+def _parse_isoformat_time(
+    iso: Union[str, bytes], pos: int, end: int
+) -> Tuple[int, int, int, int, Optional[int]]:
+    """Scan HH[:MM[:SS[.fff[fff]]]][Z|+HH:MM[:SS[.ffffff]]] from iso[pos:end].
+
+    Returns (hour, minute, second, microsecond, offset) where offset is the
+    signed UTC offset in microseconds, or None for a naive time.
+    """
+    chars = _ISO_CHARS
+    hour = _iso_digits(iso, pos, 2, end)
+    minute = second = microsecond = 0
+    offset = None
+    pos += 2
+    char = chars.get(iso[pos]) if pos < end else None
+    if char == _ISO_COLON:
+        minute = _iso_digits(iso, pos + 1, 2, end)
+        pos += 3
+        char = chars.get(iso[pos]) if pos < end else None
+        if char == _ISO_COLON:
+            second = _iso_digits(iso, pos + 1, 2, end)
+            pos += 3
+            char = chars.get(iso[pos]) if pos < end else None
+            if char == _ISO_DOT:
+                microsecond = _iso_digits(iso, pos + 1, 3, end) * 1000
+                pos += 4
+                char = chars.get(iso[pos]) if pos < end else None
+                if char is not None and char <= 9:
+                    microsecond += _iso_digits(iso, pos, 3, end)
+                    pos += 3
+                    char = chars.get(iso[pos]) if pos < end else None
+    if char == _ISO_ZULU:
+        offset = 0
+        pos += 1
+    elif char in {_ISO_PLUS, _ISO_MINUS}:
+        seconds = _iso_digits(iso, pos + 1, 2, end) * 3600
+        seconds += _iso_digits(iso, pos + 4, 2, end) * 60
+        if chars.get(iso[pos + 3]) != _ISO_COLON:
+            raise ValueError()
+        offset_us = 0
+        sign = char
+        pos += 6
+        if pos < end and chars.get(iso[pos]) == _ISO_COLON:
+            seconds += _iso_digits(iso, pos + 1, 2, end)
+            pos += 3
+            if pos < end and chars.get(iso[pos]) == _ISO_DOT:
+                offset_us = _iso_digits(iso, pos + 1, 6, end)
+                pos += 7
+        offset = seconds * 1000000 + offset_us
+        if sign == _ISO_MINUS:
+            offset = -offset
+    if pos != end:
+        raise ValueError()
+    return hour, minute, second, microsecond, offset
+
+
+def _iso_timezone(offset: Optional[int], zones: Optional[dict] = None) -> Optional["timezone"]:
+    """Signed offset in microseconds (or None) -> shared timezone for a parsed string.
+
+    When zones is given it maps offsets to the timezones already found for
+    the same batch of strings, which skips the shared cache for repeats.
+    """
+    if offset is None:
+        return None
+    if zones is None:
+        return timezone._intern(offset, "utcoffset")
+    tz = zones.get(offset)
+    if tz is None:
+        tz = zones[offset] = timezone._intern(offset, "utcoffset")
+    return tz
+
+
 # A 4-year cycle has an extra leap day over what we'd get from pasting
 # together 4 single years.
 assert _DI4Y == 4 * 365 + 1
@@ -263,6 +916,8 @@ def _ord2ymd(n: int) -> Tuple[int, int, int]:
     #     31 Dec  400         _DI400Y        _DI400Y -1
     #      1 Jan  401         _DI400Y +1     _DI400Y      400-year boundary
     n -= 1
+    if _YEAR_STARTS and 0 <= n < _MAXORDINAL:
+        return _ord2ymd_table(n)
     n400, n = divmod(n, _DI400Y)
     year = n400 * 400 + 1  # ..., -399, 1, 401, ...
 
@@ -302,9 +957,111 @@ def _ord2ymd(n: int) -> Tuple[int, int, int]:
     return year, month, n + 1
 
 
+def _ord2ymd_table(n: int) -> Tuple[int, int, int]:
+    "zero-based ordinal -> (year, month, day), using the year start table."
+    starts = _YEAR_STARTS
+    # The average year length makes this exact or one year off either way.
+    year = n * 400 // _DI400Y + 1
+    if starts[year] > n:
+        year -= 1
+    elif starts[year + 1] <= n:
+        year += 1
+    n -= starts[year]
+    leapyear = starts[year + 1] - starts[year] == 366
+    month = (n + 50) >> 5
+    preceding = _DAYS_BEFORE_MONTH[month] + (month > 2 and leapyear)
+    if preceding > n:  # estimate is too large
+        month -= 1
+        preceding -= _DAYS_IN_MONTH[month] + (month == 2 and leapyear)
+    return year, month, n - preceding + 1
+
+
+# Intervals [first, last, offset] of UTC seconds since the epoch over which
+# time.localtime() was seen to keep one UTC offset, oldest first. Probes up to
+# a day apart with the same offset are merged, the same assumption _mktime
+# makes about how far apart offset changes are.
+_LOCAL_OFFSETS = []
+_LOCAL_OFFSETS_MAX = const(16)
+_MAX_FOLD_SECONDS = const(86400)
+
+
+def _local_offset(u: int) -> int:
+    "UTC seconds since the epoch -> local UTC offset in seconds, learning it."
+    y, m, d, hh, mm, ss = _time.localtime(u)[:6]
+    offset = (_ymd2ord(y, m, d) - _EPOCH_ORDINAL) * 86400 + hh * 3600 + mm * 60 + ss - u
+    for interval in _LOCAL_OFFSETS:
+        if (
+            interval[2] == offset
+            and interval[0] - _MAX_FOLD_SECONDS <= u <= interval[1] + _MAX_FOLD_SECONDS
+        ):
+            interval[0] = min(interval[0], u)
+            interval[1] = max(interval[1], u)
+            return offset
+    if len(_LOCAL_OFFSETS) >= _LOCAL_OFFSETS_MAX:
+        del _LOCAL_OFFSETS[0]
+    _LOCAL_OFFSETS.append([u, u, offset])
+    return offset
+
+
+def clear_local_offset_cache() -> None:
+    """Forget the local UTC offsets learned by timestamp() on naive datetimes.
+    Call this after changing the system time zone, for example after
+    ``time.tzset()``.
+    """
+    del _LOCAL_OFFSETS[:]
+
+
+# How datetime.floor(), ceil() and round() pick a bucket boundary.
+_ROUND_FLOOR = const(0)
+_ROUND_CEIL = const(1)
+_ROUND_HALF_EVEN = const(2)
+
+
+def _round_us(value: int, delta: int, origin: int, mode: int) -> int:
+    "Snap value to origin + k * delta, all in microseconds, as mode says."
+    q, r = divmod(value - origin, delta)
+    if r and (
+        mode == _ROUND_CEIL
+        or (mode == _ROUND_HALF_EVEN and (2 * r > delta or (2 * r == delta and q & 1)))
+    ):
+        q += 1
+    return origin + q * delta
+
+
+def _bucket_args(delta: "timedelta", origin: Optional["datetime"]) -> Tuple[int, int]:
+    "Check floor()/ceil()/round() arguments -> (delta, origin) in microseconds."
+    if not isinstance(delta, timedelta):
+        raise TypeError("delta must be a timedelta")
+    step = delta._to_microseconds()
+    if step <= 0:
+        raise ValueError("delta must be positive")
+    if origin is None:
+        return step, _EPOCH_US
+    if not isinstance(origin, datetime):
+        raise TypeError("origin must be a datetime")
+    return step, origin._wall_us()
+
+
+def use_ordinal_table(enable: bool = True) -> None:
+    """Switch conversions between ordinals and (year, month, day) to a table of
+    the first day of every year from MINYEAR to MAXYEAR, instead of computing
+    them arithmetically. This makes toordinal(), weekday() and fromordinal()
+    faster, at the cost of a 10,000 entry list; boards short on memory should
+    leave it disabled, which is the default.
+
+    :param bool enable: build the table if True, release it if False
+    """
+    if not enable:
+        del _YEAR_STARTS[:]
+    elif not _YEAR_STARTS:
+        _YEAR_STARTS.extend(_days_before_year(year) for year in range(MAXYEAR + 2))
+
+
 class timedelta:
     """A timedelta object represents a duration, the difference between two dates or times."""
 
+    __slots__ = ("_days", "_seconds", "_microseconds", "_hashcode")
+
     def __new__(
         cls,
         days: int = 0,
@@ -315,6 +1072,22 @@ class timedelta:
         hours: int = 0,
         weeks: int = 0,
     ) -> "timedelta":
+        # Plain ints need no fraction handling: normalize them directly.
+        if (
+            days.__class__ is int
+            and seconds.__class__ is int
+            and microseconds.__class__ is int
+            and milliseconds.__class__ is int
+            and minutes.__class__ is int
+            and hours.__class__ is int
+            and weeks.__class__ is int
+        ):
+            return cls._create(
+                days + weeks * 7,
+                seconds + minutes * 60 + hours * 3600,
+                microseconds + milliseconds * 1000,
+            )
+
         # Check that all inputs are ints or floats.
         if not all(
             isinstance(i, (int, float))
@@ -410,6 +1183,28 @@ class timedelta:
         self._hashcode = -1
         return self
 
+    @classmethod
+    def _create(cls, d: int, s: int, us: int) -> "timedelta":
+        """Low-level creation from integer days, seconds and microseconds,
+        carrying out of range seconds and microseconds without any of the
+        float handling and checks of the public constructor.
+
+        """
+        if not 0 <= us < 1000000:
+            seconds, us = divmod(us, 1000000)
+            s += seconds
+        if not 0 <= s < 86400:
+            days, s = divmod(s, 86400)
+            d += days
+        if not -999999999 <= d <= 999999999:
+            raise OverflowError(f"timedelta # of days is too large: {d}")
+        self = object.__new__(cls)
+        self._days = d
+        self._seconds = s
+        self._microseconds = us
+        self._hashcode = -1
+        return self
+
     # Instance attributes (read-only)
     @property
     def days(self) -> int:
@@ -468,11 +1263,11 @@ class timedelta:
 
     # Supported operations
     def __neg__(self) -> "timedelta":
-        return timedelta(-self._days, -self._seconds, -self._microseconds)
+        return timedelta._create(-self._days, -self._seconds, -self._microseconds)
 
     def __add__(self, other: "timedelta") -> "timedelta":
         if isinstance(other, timedelta):
-            return timedelta(
+            return timedelta._create(
                 self._days + other._days,
                 self._seconds + other._seconds,
                 self._microseconds + other._microseconds,
@@ -481,7 +1276,7 @@ class timedelta:
 
     def __sub__(self, other: "timedelta") -> "timedelta":
         if isinstance(other, timedelta):
-            return timedelta(
+            return timedelta._create(
                 self._days - other._days,
                 self._seconds - other._seconds,
                 self._microseconds - other._microseconds,
@@ -497,30 +1292,32 @@ class timedelta:
         usec = self._to_microseconds()
         if isinstance(other, timedelta):
             return usec // other._to_microseconds()
-        return timedelta(0, 0, usec // other)
+        return timedelta._create(0, 0, usec // other)
 
     def __mod__(self, other: "timedelta") -> "timedelta":
         if isinstance(other, timedelta):
             r = self._to_microseconds() % other._to_microseconds()
-            return timedelta(0, 0, r)
+            return timedelta._create(0, 0, r)
         return NotImplemented
 
     def __divmod__(self, other: "timedelta") -> "timedelta":
         if isinstance(other, timedelta):
             q, r = divmod(self._to_microseconds(), other._to_microseconds())
-            return q, timedelta(0, 0, r)
+            return q, timedelta._create(0, 0, r)
         return NotImplemented
 
     def __mul__(self, other: float) -> "timedelta":
         if isinstance(other, int):
             # for CPython compatibility, we cannot use
             # our __class__ here, but need a real timedelta
-            return timedelta(self._days * other, self._seconds * other, self._microseconds * other)
+            return timedelta._create(
+                self._days * other, self._seconds * other, self._microseconds * other
+            )
         if isinstance(other, float):
             # a, b = other.as_integer_ratio()
             # return self * a / b
             usec = self._to_microseconds()
-            return timedelta(0, 0, round(usec * other))
+            return timedelta._create(0, 0, round(usec * other))
         return NotImplemented
 
     __rmul__ = __mul__
@@ -563,9 +1360,58 @@ class timedelta:
     def __bool__(self) -> bool:
         return self._days != 0 or self._seconds != 0 or self._microseconds != 0
 
+    # Binary encoding
+    # Signed 32-bit days, then seconds * 1000000 + microseconds in 40 bits.
+    packed_size = 9
+
+    def _pack(self, buffer: Any, offset: int) -> None:
+        us = self._seconds * 1000000 + self._microseconds
+        _struct.pack_into(">iBI", buffer, offset, self._days, us >> 32, us & 0xFFFFFFFF)
+
+    @classmethod
+    def _unpack(cls, b: Any, p: int) -> "timedelta":
+        days = (b[p] << 24) | (b[p + 1] << 16) | (b[p + 2] << 8) | b[p + 3]
+        if days & 0x80000000:
+            days -= 0x100000000
+        us = (b[p + 4] << 32) | (b[p + 5] << 24) | (b[p + 6] << 16) | (b[p + 7] << 8) | b[p + 8]
+        if us >= 86400000000:
+            raise ValueError("seconds out of range in packed timedelta")
+        if not -999999999 <= days <= 999999999:
+            raise ValueError("days out of range in packed timedelta")
+        return cls._create(days, 0, us)
+
+    def to_bytes(self) -> bytes:
+        "Return the packed_size byte encoding of the timedelta."
+        data = bytearray(self.packed_size)
+        self._pack(data, 0)
+        return bytes(data)
+
+    @classmethod
+    def from_bytes(cls, data: Any, offset: int = 0) -> "timedelta":
+        "Decode a timedelta written by to_bytes() or pack_into(), starting at offset."
+        _check_buffer(data, offset, cls.packed_size)
+        return cls._unpack(data, offset)
+
+    @classmethod
+    def pack_into(cls, buffer: Any, offset: int, items: Iterable["timedelta"]) -> int:
+        """Write timedeltas back to back into a bytearray or writable memoryview,
+        starting at offset. Returns the offset just past the last one.
+
+        """
+        return _pack_items(cls, buffer, offset, items)
+
+    @classmethod
+    def unpack_from(cls, buffer: Any, offset: int = 0, count: int = 1) -> List["timedelta"]:
+        "Read count timedeltas written by pack_into(), starting at offset."
+        return _unpack_items(cls, buffer, offset, count)
+
+    # Pickle support
     def _getstate(self) -> Tuple[int, int, int]:
         return (self._days, self._seconds, self._microseconds)
 
+    def __reduce__(self) -> tuple:
+        return (self.__class__, self._getstate())
+
 
 class tzinfo:
     """This is an abstract base class, meaning that this class should not
@@ -574,6 +1420,8 @@ class tzinfo:
 
     """
 
+    __slots__ = ()
+
     def utcoffset(self, dt: "datetime") -> timedelta:
         """Return offset of local time from UTC, as a timedelta
         object that is positive east of UTC.
@@ -588,7 +1436,8 @@ class tzinfo:
     def dst(self, dt: "datetime") -> None:
         """Return the DST setting correspinding to the datetime object dt, as a number.
 
-        DST usage is currently not implemented for this library.
+        The base class and fixed offset timezones return None, see ZoneInfo for
+        a tzinfo that implements it.
         """
         return None
 
@@ -613,19 +1462,27 @@ class date:
 
     """
 
-    def __new__(cls, year: int, month: int, day: int) -> "date":
+    __slots__ = ("_year", "_month", "_day", "_hashcode", "_ordinal")
+
+    def __new__(cls, year: int, month: Optional[int] = None, day: Optional[int] = None) -> "date":
         """Creates a new date object.
 
         :param int year: Year within range, MINYEAR <= year <= MAXYEAR
         :param int month: Month within range, 1 <= month <= 12
         :param int day: Day within range, 1 <= day <= number of days in the given month and year
         """
+        if month is None and isinstance(year, bytes) and len(year) == 4 and 1 <= year[2] <= 12:
+            # Pickle support
+            self = object.__new__(cls)
+            self._setstate(year)
+            return self
         _check_date_fields(year, month, day)
         self = object.__new__(cls)
         self._year = year
         self._month = month
         self._day = day
         self._hashcode = -1
+        self._ordinal = 0
         return self
 
     # Instance attributes (read-only)
@@ -662,19 +1519,40 @@ class date:
         if not ordinal >= 1:
             raise ValueError("ordinal must be >=1")
         y, m, d = _ord2ymd(ordinal)
-        return cls(y, m, d)
+        self = cls(y, m, d)
+        self._ordinal = ordinal
+        return self
 
     @classmethod
-    def fromisoformat(cls, date_string: str) -> "date":
+    def fromisoformat(
+        cls, date_string: Union[str, bytes], offset: int = 0, length: Optional[int] = None
+    ) -> "date":
         """Return a date object constructed from an ISO date format.
         Valid format is ``YYYY-MM-DD``
 
+        :param date_string: A str, or a bytes, bytearray or memoryview buffer
+            which is read in place without decoding or copying.
+        :param int offset: Index of the first character to parse.
+        :param int length: Number of characters to parse, default up to the end.
         """
-        match = _re.match(r"([0-9][0-9][0-9][0-9])-([0-9][0-9])-([0-9][0-9])$", date_string)
-        if match:
-            y, m, d = int(match.group(1)), int(match.group(2)), int(match.group(3))
-            return cls(y, m, d)
-        raise ValueError(_INVALID_ISO_ERROR.format(date_string))
+        end = _iso_window(date_string, offset, length)
+        try:
+            y, m, d = _parse_isoformat_date(date_string, offset, end)
+        except ValueError as error:
+            raise _iso_error(date_string, offset, end) from error
+        return cls(y, m, d)
+
+    @classmethod
+    def fromisoformat_many(cls, date_strings: Iterable[Union[str, bytes]]) -> Iterator["date"]:
+        """Parse each ``YYYY-MM-DD`` string of an iterable, yielding dates lazily."""
+        parse = _parse_isoformat_date
+        for date_string in date_strings:
+            end = len(date_string)
+            try:
+                y, m, d = parse(date_string, 0, end)
+            except ValueError as error:
+                raise _iso_error(date_string, 0, end) from error
+            yield cls(y, m, d)
 
     @classmethod
     def today(cls) -> "date":
@@ -707,7 +1585,11 @@ class date:
         """Return the proleptic Gregorian ordinal of the date, where January 1 of
         year 1 has ordinal 1.
         """
-        return _ymd2ord(self._year, self._month, self._day)
+        # Computed on first use and kept; 0 means not yet known.
+        ordinal = self._ordinal
+        if not ordinal:
+            ordinal = self._ordinal = _ymd2ord(self._year, self._month, self._day)
+        return ordinal
 
     def weekday(self) -> int:
         """Return the day of the week as an integer, where Monday is 0 and Sunday is 6."""
@@ -725,6 +1607,20 @@ class date:
     # For a date d, str(d) is equivalent to d.isoformat()
     __str__ = isoformat
 
+    def strftime(self, fmt: str) -> str:
+        """Return a string representing the date, controlled by an explicit format string.
+        Hours, minutes and seconds are 0 and ``%z``/``%Z`` are empty.
+
+        """
+        return _strftime(fmt, (self._year, self._month, self._day, 0, 0, 0, 0), None)
+
+    def __format__(self, fmt: str) -> str:
+        if not isinstance(fmt, str):
+            raise TypeError(f"must be str, not {type(fmt).__name__}")
+        if fmt:
+            return self.strftime(fmt)
+        return str(self)
+
     def __repr__(self) -> str:
         """Convert to formal string, for repr()."""
         return f"datetime.{self.__class__.__name__}({self._year}, {self._month}, {self._day})"
@@ -757,15 +1653,59 @@ class date:
 
     def _cmp(self, other: "date") -> int:
         assert isinstance(other, date)
-        y, m, d = self._year, self._month, self._day
-        y2, m2, d2 = other.year, other.month, other.day
-        return _cmp((y, m, d), (y2, m2, d2))
+        # Pack the fields into one integer (month < 16, day < 32) rather than
+        # building and comparing two tuples.
+        mine = (self._year << 9) | (self._month << 5) | self._day
+        theirs = (other._year << 9) | (other._month << 5) | other._day
+        return _cmp(mine, theirs)
+
+    def sort_key(self) -> int:
+        """Return an integer that orders dates the way the comparison operators
+        do: the proleptic Gregorian ordinal. ``sorted(dates, key=date.sort_key)``
+        avoids the rich comparison methods altogether.
+        """
+        return self.toordinal()
 
     def __hash__(self) -> int:
         if self._hashcode == -1:
-            self._hashcode = hash(self._getstate())
+            self._hashcode = hash(self.toordinal())
         return self._hashcode
 
+    # Binary encoding, the same 4 bytes as the pickle state
+    packed_size = 4
+
+    def _pack(self, buffer: Any, offset: int) -> None:
+        _struct.pack_into(">HBB", buffer, offset, self._year, self._month, self._day)
+
+    @classmethod
+    def _unpack(cls, b: Any, p: int) -> "date":
+        return cls((b[p] << 8) | b[p + 1], b[p + 2], b[p + 3])
+
+    def to_bytes(self) -> bytes:
+        "Return the packed_size byte encoding of the date."
+        data = bytearray(self.packed_size)
+        self._pack(data, 0)
+        return bytes(data)
+
+    @classmethod
+    def from_bytes(cls, data: Any, offset: int = 0) -> "date":
+        "Decode a date written by to_bytes() or pack_into(), starting at offset."
+        _check_buffer(data, offset, cls.packed_size)
+        return cls._unpack(data, offset)
+
+    @classmethod
+    def pack_into(cls, buffer: Any, offset: int, items: Iterable["date"]) -> int:
+        """Write items back to back into a bytearray or writable memoryview,
+        starting at offset. Returns the offset just past the last one.
+
+        """
+        return _pack_items(cls, buffer, offset, items)
+
+    @classmethod
+    def unpack_from(cls, buffer: Any, offset: int = 0, count: int = 1) -> List["date"]:
+        "Read count dates written by pack_into(), starting at offset."
+        return _unpack_items(cls, buffer, offset, count)
+
     # Pickle support
     def _getstate(self) -> Tuple[bytes]:
         yhi, ylo = divmod(self._year, 256)
@@ -774,6 +1714,11 @@ class date:
     def _setstate(self, string: bytes) -> None:
         yhi, ylo, self._month, self._day = string
         self._year = yhi * 256 + ylo
+        self._hashcode = -1
+        self._ordinal = 0
+
+    def __reduce__(self) -> tuple:
+        return (self.__class__, self._getstate())
 
 
 class timezone(tzinfo):
@@ -786,6 +1731,8 @@ class timezone(tzinfo):
 
     """
 
+    __slots__ = ("_offset", "_name")
+
     # Sentinel value to disallow None
     _Omitted = object()
 
@@ -806,8 +1753,6 @@ class timezone(tzinfo):
             )
         if offset.microseconds != 0 or offset.seconds % 60 != 0:
             raise ValueError("offset must be a timedelta representing a whole number of minutes")
-        cls._offset = offset
-        cls._name = name
         return cls._create(offset, name)
 
     @classmethod
@@ -818,6 +1763,37 @@ class timezone(tzinfo):
         self._name = name
         return self
 
+    @classmethod
+    def intern(cls, offset: timedelta, name: Optional[str] = None) -> "timezone":
+        """Return a shared timezone for offset and name, created on first use.
+
+        Datetimes built with the same interned timezone compare and subtract
+        through identity fast paths. The most recently used zones are kept,
+        up to a small fixed number.
+
+        :param timedelta offset: Offset from UTC, as for the constructor
+        :param str name: Optional name, as for the constructor
+        """
+        if not isinstance(offset, timedelta):
+            raise TypeError("offset must be a timedelta")
+        return cls._intern(offset._to_microseconds(), name)
+
+    @classmethod
+    def _intern(cls, offset: int, name: Optional[str] = None) -> "timezone":
+        "intern() for an offset given in microseconds."
+        key = (cls, offset, name)
+        tz = _TIMEZONE_CACHE.get(key)
+        if tz is None:
+            delta = timedelta(0, 0, offset)
+            tz = cls(delta) if name is None else cls(delta, name)
+            _TIMEZONE_CACHE.put(key, tz)
+        return tz
+
+    def __reduce__(self) -> tuple:
+        if self._name is None:
+            return (self.__class__, (self._offset,))
+        return (self.__class__, (self._offset, self._name))
+
     # Instance methods
     def utcoffset(self, dt: Optional["datetime"]) -> timedelta:
         if isinstance(dt, datetime) or dt is None:
@@ -872,6 +1848,17 @@ class time:
 
     """
 
+    __slots__ = (
+        "_hour",
+        "_minute",
+        "_second",
+        "_microsecond",
+        "_tzinfo",
+        "_fold",
+        "_hashcode",
+        "_sortkey",
+    )
+
     def __new__(
         cls,
         hour: int = 0,
@@ -882,6 +1869,11 @@ class time:
         *,
         fold: int = 0,
     ) -> "time":
+        if isinstance(hour, bytes) and len(hour) == 6 and hour[0] & 0x7F < 24:
+            # Pickle support, with the tzinfo passed in place of minute
+            self = object.__new__(cls)
+            self._setstate(hour, minute or None)
+            return self
         _check_time_fields(hour, minute, second, microsecond, fold)
         _check_tzinfo_arg(tzinfo)
         self = object.__new__(cls)
@@ -892,6 +1884,7 @@ class time:
         self._tzinfo = tzinfo
         self._fold = fold
         self._hashcode = -1
+        self._sortkey = None
         return self
 
     # Instance attributes (read-only)
@@ -927,94 +1920,41 @@ class time:
         """
         return self._tzinfo
 
-    @staticmethod
-    def _parse_iso_string(string_to_parse: str, segments: Sequence[str]) -> List[int]:
-        results = []
-
-        remaining_string = string_to_parse
-        for regex in segments:
-            match = _re.match(regex, remaining_string)
-            if match:
-                for grp in range(regex.count("(")):
-                    results.append(int(match.group(grp + 1)))
-                remaining_string = remaining_string[len(match.group(0)) :]
-            elif remaining_string:  # Only raise an error if we're not done yet
-                raise ValueError()
-        if remaining_string:
-            raise ValueError()
-        return results
-
     @classmethod
-    def fromisoformat(cls, time_string: str) -> "time":
+    def fromisoformat(
+        cls, time_string: Union[str, bytes], offset: int = 0, length: Optional[int] = None
+    ) -> "time":
         """Return a time object constructed from an ISO date format.
-        Valid format is ``HH[:MM[:SS[.fff[fff]]]][+HH:MM[:SS[.ffffff]]]``
+        Valid format is ``HH[:MM[:SS[.fff[fff]]]][Z|+HH:MM[:SS[.ffffff]]]``
 
+        :param time_string: A str, or a bytes, bytearray or memoryview buffer
+            which is read in place without decoding or copying.
+        :param int offset: Index of the first character to parse.
+        :param int length: Number of characters to parse, default up to the end.
         """
-        if time_string[-1] == "Z":
-            time_string = f"{time_string[:-1]}+00:00"
-        # Store the original string in an error message
-        original_string = time_string
-        match = _re.match(r"(.*)[\-\+]", time_string)
-        offset_string = None
-        if match:
-            offset_string = time_string[len(match.group(1)) :]
-            time_string = match.group(1)
-
-        time_segments = (
-            r"([0-9][0-9])",
-            r":([0-9][0-9])",
-            r":([0-9][0-9])",
-            r"\.([0-9][0-9][0-9])",
-            r"([0-9][0-9][0-9])",
-        )
-        offset_segments = (
-            r"([\-\+][0-9][0-9]):([0-9][0-9])",
-            r":([0-9][0-9])",
-            r"\.([0-9][0-9][0-9][0-9][0-9][0-9])",
-        )
-
+        end = _iso_window(time_string, offset, length)
         try:
-            results = cls._parse_iso_string(time_string, time_segments)
-            if len(results) < 1:
-                raise ValueError(_INVALID_ISO_ERROR.format(original_string))
-            if len(results) < len(time_segments):
-                results += [None] * (len(time_segments) - len(results))
-            if offset_string:
-                results += cls._parse_iso_string(offset_string, offset_segments)
+            hh, mm, ss, us, tzoff = _parse_isoformat_time(time_string, offset, end)
+            return cls(hh, mm, ss, us, _iso_timezone(tzoff))
         except ValueError as error:
-            raise ValueError(_INVALID_ISO_ERROR.format(original_string)) from error
-
-        hh = results[0]
-        mm = results[1] if len(results) >= 2 and results[1] is not None else 0
-        ss = results[2] if len(results) >= 3 and results[2] is not None else 0
-        us = 0
-        if len(results) >= 4 and results[3] is not None:
-            us += results[3] * 1000
-        if len(results) >= 5 and results[4] is not None:
-            us += results[4]
-        tz = None
-        if len(results) >= 7:
-            offset_hh = results[5]
-            multiplier = -1 if offset_hh < 0 else 1
-            offset_mm = results[6] * multiplier
-            offset_ss = (results[7] if len(results) >= 8 else 0) * multiplier
-            offset_us = (results[8] if len(results) >= 9 else 0) * multiplier
-            offset = timedelta(
-                hours=offset_hh,
-                minutes=offset_mm,
-                seconds=offset_ss,
-                microseconds=offset_us,
-            )
-            tz = timezone(offset, name="utcoffset")
+            raise _iso_error(time_string, offset, end) from error
 
-        result = cls(
-            hh,
-            mm,
-            ss,
-            us,
-            tz,
-        )
-        return result
+    @classmethod
+    def fromisoformat_many(cls, time_strings: Iterable[Union[str, bytes]]) -> Iterator["time"]:
+        """Parse each ISO format string of an iterable, yielding times lazily.
+        Strings carrying the same UTC offset share a single timezone object.
+
+        """
+        parse = _parse_isoformat_time
+        zones = {}
+        for time_string in time_strings:
+            end = len(time_string)
+            try:
+                hh, mm, ss, us, tzoff = parse(time_string, 0, end)
+                result = cls(hh, mm, ss, us, _iso_timezone(tzoff, zones))
+            except ValueError as error:
+                raise _iso_error(time_string, 0, end) from error
+            yield result
 
     # pylint: enable=too-many-locals
 
@@ -1089,51 +2029,33 @@ class time:
 
     def _cmp(self, other: "time", allow_mixed: bool = False) -> int:
         assert isinstance(other, time)
-        mytz = self._tzinfo
-        ottz = other.tzinfo
-        myoff = otoff = None
-
-        if mytz is ottz:
-            base_compare = True
-        else:
-            myoff = self.utcoffset()
-            otoff = other.utcoffset()
-            base_compare = myoff == otoff
-
-        if base_compare:
-            return _cmp(
-                (self._hour, self._minute, self._second, self._microsecond),
-                (other.hour, other.minute, other.second, other.microsecond),
-            )
-        if myoff is None or otoff is None:
-            if not allow_mixed:
-                raise TypeError("cannot compare naive and aware times")
-            return 2  # arbitrary non-zero value
-        myhhmm = self._hour * 60 + self._minute - myoff // timedelta(minutes=1)
-        othhmm = other.hour * 60 + other.minute - otoff // timedelta(minutes=1)
-        return _cmp(
-            (myhhmm, self._second, self._microsecond),
-            (othhmm, other.second, other.microsecond),
-        )
+        if self._tzinfo is not other._tzinfo:
+            if (self.utcoffset() is None) != (other.utcoffset() is None):
+                if not allow_mixed:
+                    raise TypeError("cannot compare naive and aware times")
+                return 2  # arbitrary non-zero value
+        return _cmp(self.sort_key(), other.sort_key())
+
+    def sort_key(self) -> int:
+        """Return an integer that orders times the way the comparison operators
+        do: microseconds since midnight, less the UTC offset for aware times.
+        The key is computed once and cached on the object.
+        """
+        key = self._sortkey
+        if key is None:
+            key = (
+                (self._hour * 60 + self._minute) * 60 + self._second
+            ) * 1000000 + self._microsecond
+            offset = self.utcoffset()
+            if offset is not None:
+                key -= offset._to_microseconds()
+            self._sortkey = key
+        return key
 
     def __hash__(self) -> int:
         """Hash."""
         if self._hashcode == -1:
-            t = self
-            tzoff = t.utcoffset()
-            if not tzoff:  # zero or None
-                self._hashcode = hash(t._getstate()[0])
-            else:
-                h, m = divmod(
-                    timedelta(hours=self.hour, minutes=self.minute) - tzoff,
-                    timedelta(hours=1),
-                )
-                assert not m % timedelta(minutes=1), "whole minute"
-                m //= timedelta(minutes=1)
-                if 0 <= h < 24:
-                    self._hashcode = hash(time(h, m, self.second, self.microsecond))
-                else:
-                    self._hashcode = hash((h, m, self.second, self.microsecond))
+            self._hashcode = hash(self.sort_key())
         return self._hashcode
 
     def _tzstr(self, sep: str = ":") -> Optional[str]:
@@ -1152,9 +2074,22 @@ class time:
             off = f"{sign}{hh:02d}{sep}{mm:02d}"
         return off
 
+    def strftime(self, fmt: str) -> str:
+        """Return a string representing the time, controlled by an explicit format string.
+        The date fields are those of 1900-01-01.
+
+        """
+        return _strftime(
+            fmt,
+            (1900, 1, 1, self._hour, self._minute, self._second, self._microsecond),
+            self,
+        )
+
     def __format__(self, fmt: str) -> str:
         if not isinstance(fmt, str):
             raise TypeError(f"must be str, not {type(fmt).__name__}")
+        if fmt:
+            return self.strftime(fmt)
         return str(self)
 
     def __repr__(self) -> str:
@@ -1171,6 +2106,53 @@ class time:
             s = f"{s[:-1]}, tzinfo={self._tzinfo!r})"
         return s
 
+    # Binary encoding, the 6 byte pickle state with fold in the top bit of
+    # the hour. The tzinfo is not encoded.
+    packed_size = 6
+
+    def _pack(self, buffer: Any, offset: int) -> None:
+        us = self._microsecond
+        h = self._hour | (self._fold << 7)
+        _struct.pack_into(
+            ">BBBBH", buffer, offset, h, self._minute, self._second, us >> 16, us & 0xFFFF
+        )
+
+    @classmethod
+    def _unpack(cls, b: Any, p: int, tz: Optional["tzinfo"] = None) -> "time":
+        h = b[p]
+        us = (b[p + 3] << 16) | (b[p + 4] << 8) | b[p + 5]
+        return cls(h & 0x7F, b[p + 1], b[p + 2], us, tz, fold=h >> 7)
+
+    def to_bytes(self) -> bytes:
+        "Return the packed_size byte encoding of the time, without its tzinfo."
+        data = bytearray(self.packed_size)
+        self._pack(data, 0)
+        return bytes(data)
+
+    @classmethod
+    def from_bytes(cls, data: Any, offset: int = 0, tz: Optional["tzinfo"] = None) -> "time":
+        """Decode a time written by to_bytes() or pack_into(), starting at
+        offset, and attach tz to it.
+
+        """
+        _check_buffer(data, offset, cls.packed_size)
+        return cls._unpack(data, offset, tz)
+
+    @classmethod
+    def pack_into(cls, buffer: Any, offset: int, items: Iterable["time"]) -> int:
+        """Write times back to back into a bytearray or writable memoryview,
+        starting at offset. Returns the offset just past the last one.
+
+        """
+        return _pack_items(cls, buffer, offset, items)
+
+    @classmethod
+    def unpack_from(
+        cls, buffer: Any, offset: int = 0, count: int = 1, tz: Optional["tzinfo"] = None
+    ) -> List["time"]:
+        "Read count times written by pack_into(), starting at offset, all in tz."
+        return _unpack_items(cls, buffer, offset, count, tz)
+
     # Pickle support
     def _getstate(self, protocol: int = 3) -> Tuple[bytes]:
         us2, us3 = divmod(self._microsecond, 256)
@@ -1183,6 +2165,24 @@ class time:
             return (basestate, self._tzinfo)
         return (basestate,)
 
+    def _setstate(self, string: bytes, tzinfo: Optional[tzinfo]) -> None:
+        if tzinfo is not None and not isinstance(tzinfo, _tzinfo_class):
+            raise TypeError("bad tzinfo state arg")
+        h, self._minute, self._second, us1, us2, us3 = string
+        self._hour = h & 0x7F
+        self._fold = h >> 7
+        self._microsecond = (((us1 << 8) | us2) << 8) | us3
+        self._tzinfo = tzinfo
+        self._hashcode = -1
+        self._sortkey = None
+
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        # fold is only stored for protocol 4 and up, as CPython does
+        return (self.__class__, self._getstate(protocol))
+
+    def __reduce__(self) -> tuple:
+        return self.__reduce_ex__(2)
+
 
 class datetime(date):
     """A datetime object is a single object containing all the information
@@ -1192,11 +2192,13 @@ class datetime(date):
 
     """
 
+    __slots__ = ("_hour", "_minute", "_second", "_microsecond", "_tzinfo", "_fold", "_sortkey")
+
     def __new__(
         cls,
         year: int,
-        month: int,
-        day: int,
+        month: Optional[int] = None,
+        day: Optional[int] = None,
         hour: int = 0,
         minute: int = 0,
         second: int = 0,
@@ -1205,6 +2207,11 @@ class datetime(date):
         *,
         fold: int = 0,
     ) -> "datetime":
+        if isinstance(year, bytes) and len(year) == 10 and 1 <= year[2] & 0x7F <= 12:
+            # Pickle support, with the tzinfo passed in place of month
+            self = object.__new__(cls)
+            self._setstate(year, month)
+            return self
         _check_date_fields(year, month, day)
         _check_time_fields(hour, minute, second, microsecond, fold)
         _check_tzinfo_arg(tzinfo)
@@ -1220,6 +2227,42 @@ class datetime(date):
         self._tzinfo = tzinfo
         self._fold = fold
         self._hashcode = -1
+        self._sortkey = None
+        self._ordinal = 0
+        return self
+
+    @classmethod
+    def _create(
+        cls,
+        year: int,
+        month: int,
+        day: int,
+        hour: int,
+        minute: int,
+        second: int,
+        microsecond: int,
+        tzinfo: Optional[tzinfo],
+        fold: int = 0,
+    ) -> "datetime":
+        """Low-level creation from fields already known to be valid. Subclasses
+        still go through their own constructor.
+
+        """
+        if cls is not datetime:
+            return cls(year, month, day, hour, minute, second, microsecond, tzinfo, fold=fold)
+        self = object.__new__(cls)
+        self._year = year
+        self._month = month
+        self._day = day
+        self._hour = hour
+        self._minute = minute
+        self._second = second
+        self._microsecond = microsecond
+        self._tzinfo = tzinfo
+        self._fold = fold
+        self._hashcode = -1
+        self._sortkey = None
+        self._ordinal = 0
         return self
 
     # Read-only instance attributes
@@ -1277,22 +2320,11 @@ class datetime(date):
         """Construct a datetime from a POSIX timestamp (like time.time()).
         A timezone info object may be passed in as well.
         """
-        if isinstance(t, float):
-            frac, t = _math.modf(t)
-            us = round(frac * 1e6)
-            if us >= 1000000:
-                t += 1
-                us -= 1000000
-            elif us < 0:
-                t -= 1
-                us += 1000000
-        else:
-            us = 0
-
+        seconds, us = _split_timestamp(t)
         if utc:
-            raise NotImplementedError("CircuitPython does not currently implement time.gmtime.")
-        converter = _time.localtime
-        struct_time = converter(t)
+            return cls._fromepoch(seconds, us, tz, [None, 0, None])
+
+        struct_time = _time.localtime(seconds)
         ss = min(struct_time[5], 59)  # clamp out leap seconds if the platform has them
         result = cls(
             struct_time[0],
@@ -1309,36 +2341,137 @@ class datetime(date):
         return result
 
     @classmethod
-    def fromtimestamp(cls, timestamp: float, tz: Optional["tzinfo"] = None) -> "datetime":
-        return cls._fromtimestamp(timestamp, tz is not None, tz)
+    def _fromepoch(cls, seconds: int, us: int, tz: Optional["tzinfo"], memo: list) -> "datetime":
+        """UTC seconds and microseconds since the epoch -> datetime in tz, or
+        naive in UTC, by arithmetic alone. memo holds [days, ordinal, (y, m, d)]
+        of the previous call and is reused while the day stays the same.
+
+        """
+        fixed = tz.__class__ is timezone
+        if fixed:
+            seconds += tz._offset._to_microseconds() // 1000000
+        days, seconds = divmod(seconds, 86400)
+        if days != memo[0]:
+            ordinal = days + _EPOCH_ORDINAL
+            if not 0 < ordinal <= _MAXORDINAL:
+                raise OverflowError("timestamp out of range")
+            memo[:] = days, ordinal, _ord2ymd(ordinal)
+        y, m, d = memo[2]
+        hour, seconds = divmod(seconds, 3600)
+        minute, second = divmod(seconds, 60)
+        result = cls._create(y, m, d, hour, minute, second, us, tz)
+        result._ordinal = memo[1]
+        if tz is None or fixed:
+            return result
+        return tz.fromutc(result)
 
     @classmethod
-    def fromisoformat(cls, date_string: str) -> "datetime":
-        """Return a datetime object constructed from an ISO date format.
-        Valid format is ``YYYY-MM-DD[*HH[:MM[:SS[.fff[fff]]]][+HH:MM[:SS[.ffffff]]]]``
+    def _fromwall(cls, value: int, tz: Optional["tzinfo"], memo: list) -> "datetime":
+        """Wall clock microseconds since 0001-01-01 -> datetime with tz attached,
+        reusing memo as _fromepoch() does.
 
         """
-        original_string = date_string
+        days, us = divmod(value, 86400000000)
+        if days != memo[0]:
+            if not 0 <= days < _MAXORDINAL:
+                raise OverflowError("date value out of range")
+            memo[:] = days, days + 1, _ord2ymd(days + 1)
+        y, m, d = memo[2]
+        seconds, us = divmod(us, 1000000)
+        hour, seconds = divmod(seconds, 3600)
+        minute, second = divmod(seconds, 60)
+        result = cls._create(y, m, d, hour, minute, second, us, tz)
+        result._ordinal = memo[1]
+        return result
 
-        time_string = None
-        try:
-            if len(date_string) > 10:
-                time_string = date_string[11:]
-                date_string = date_string[:10]
-                dateval = date.fromisoformat(date_string)
-                timeval = time.fromisoformat(time_string)
-            else:
-                dateval = date.fromisoformat(date_string)
-                timeval = time()
-        except ValueError as error:
-            raise ValueError(_INVALID_ISO_ERROR.format(original_string)) from error
+    @classmethod
+    def fromtimestamp(cls, timestamp: float, tz: Optional["tzinfo"] = None) -> "datetime":
+        """Return the local date and time corresponding to the POSIX timestamp,
+        or the date and time in tz if given. The latter is computed without
+        calling time.localtime() or time.gmtime().
 
-        return cls.combine(dateval, timeval)
+        """
+        _check_tzinfo_arg(tz)
+        return cls._fromtimestamp(timestamp, tz is not None, tz)
 
     @classmethod
-    def now(cls, timezone: Optional["tzinfo"] = None) -> "datetime":
-        """Return the current local date and time."""
-        return cls.fromtimestamp(_time.time(), tz=timezone)
+    def fromtimestamp_many(
+        cls, timestamps: Iterable[float], tz: Optional["tzinfo"] = None
+    ) -> Iterator["datetime"]:
+        """Convert each POSIX timestamp of an iterable, such as an array of
+        epoch seconds, like fromtimestamp(), yielding datetimes lazily.
+
+        With tz given the conversion is arithmetic, and consecutive timestamps
+        falling on the same day share the calendar computation.
+
+        """
+        _check_tzinfo_arg(tz)
+        if tz is None:
+            for timestamp in timestamps:
+                yield cls._fromtimestamp(timestamp, False, None)
+            return
+        memo = [None, 0, None]
+        for timestamp in timestamps:
+            seconds, us = _split_timestamp(timestamp)
+            yield cls._fromepoch(seconds, us, tz, memo)
+
+    @classmethod
+    def fromisoformat(
+        cls, date_string: Union[str, bytes], offset: int = 0, length: Optional[int] = None
+    ) -> "datetime":
+        """Return a datetime object constructed from an ISO date format.
+        Valid format is ``YYYY-MM-DD[*HH[:MM[:SS[.fff[fff]]]][Z|+HH:MM[:SS[.ffffff]]]]``
+
+        :param date_string: A str, or a bytes, bytearray or memoryview buffer
+            which is read in place without decoding or copying.
+        :param int offset: Index of the first character to parse.
+        :param int length: Number of characters to parse, default up to the end.
+        """
+        end = _iso_window(date_string, offset, length)
+        try:
+            y, m, d = _parse_isoformat_date(date_string, offset, min(end, offset + 10))
+            if end > offset + 10:
+                hh, mm, ss, us, tzoff = _parse_isoformat_time(date_string, offset + 11, end)
+                return cls(y, m, d, hh, mm, ss, us, _iso_timezone(tzoff))
+            return cls(y, m, d)
+        except ValueError as error:
+            raise _iso_error(date_string, offset, end) from error
+
+    @classmethod
+    def fromisoformat_many(cls, date_strings: Iterable[Union[str, bytes]]) -> Iterator["datetime"]:
+        """Parse each ISO format string of an iterable, yielding datetimes lazily.
+        Strings carrying the same UTC offset share a single timezone object.
+
+        """
+        parse_date = _parse_isoformat_date
+        parse_time = _parse_isoformat_time
+        zones = {}
+        for date_string in date_strings:
+            end = len(date_string)
+            try:
+                y, m, d = parse_date(date_string, 0, min(end, 10))
+                fields = parse_time(date_string, 11, end) if end > 10 else (0, 0, 0, 0, None)
+                hh, mm, ss, us, tzoff = fields
+                result = cls(y, m, d, hh, mm, ss, us, _iso_timezone(tzoff, zones))
+            except ValueError as error:
+                raise _iso_error(date_string, 0, end) from error
+            yield result
+
+    @classmethod
+    def strptime(cls, date_string: str, format: str) -> "datetime":
+        """Return a datetime corresponding to date_string, parsed according to format.
+        Supports ``%Y %y %m %d %H %I %M %S %f %j %b %B %a %A %p %z %%`` and
+        whitespace. Each format is compiled once and the plan cached.
+
+        """
+        y, m, d, hh, mm, ss, us, offset = _strptime(date_string, format)
+        tz = None if offset is None else timezone._intern(offset)
+        return cls(y, m, d, hh, mm, ss, us, tz)
+
+    @classmethod
+    def now(cls, timezone: Optional["tzinfo"] = None) -> "datetime":
+        """Return the current local date and time."""
+        return cls.fromtimestamp(_time.time(), tz=timezone)
 
     @classmethod
     def utcfromtimestamp(cls, timestamp: float) -> "datetime":
@@ -1372,13 +2505,32 @@ class datetime(date):
     # Instance methods
     def _mktime(self) -> int:
         """Return integer POSIX timestamp."""
-        epoch = datetime(1970, 1, 1)
-        max_fold_seconds = 24 * 3600
-        t = (self - epoch) // timedelta(0, 1)
+        max_fold_seconds = _MAX_FOLD_SECONDS
+        t = (self._wall_us() - _EPOCH_US) // 1000000
+
+        # Answer from a cached interval when the candidate and the day on the
+        # side where another solution could lie share one known offset.
+        fold = self._fold
+        for first, last, offset in _LOCAL_OFFSETS:
+            u = t - offset
+            if fold:
+                if first <= u and u + max_fold_seconds <= last:
+                    return u
+            elif first <= u - max_fold_seconds and u <= last:
+                return u
+
+        u = self._mktime_probe(t)
+        # Learn the day on the other side too, so the next day of nearby
+        # datetimes is found in the cache.
+        _local_offset(u + (max_fold_seconds, -max_fold_seconds)[fold])
+        return u
+
+    def _mktime_probe(self, t: int) -> int:
+        "Local seconds since the epoch -> POSIX timestamp, using time.localtime()."
+        max_fold_seconds = _MAX_FOLD_SECONDS
 
         def local(u):
-            y, m, d, hh, mm, ss = _time.localtime(u)[:6]
-            return (datetime(y, m, d, hh, mm, ss) - epoch) // timedelta(0, 1)
+            return u + _local_offset(u)
 
         # Our goal is to solve t = local(u) for u.
         a = local(t) - t
@@ -1456,20 +2608,23 @@ class datetime(date):
         _check_utc_offset("utcoffset", offset)
         return offset
 
-    def toordinal(self) -> int:
-        """Return the proleptic Gregorian ordinal of the date."""
-        return _ymd2ord(self._year, self._month, self._day)
+    def tzname(self) -> Optional[str]:
+        """If tzinfo is None, returns None, else returns self.tzinfo.tzname(self),
+        raising an exception if the latter doesn't return None or a string.
+
+        """
+        if self._tzinfo is None:
+            return None
+        name = self._tzinfo.tzname(self)
+        _check_tzname(name)
+        return name
 
     def timestamp(self) -> float:
         """Return POSIX timestamp as int, similar to the value returned by ``time.time()``."""
         if not self._tzinfo is None:
-            return (self - _EPOCH).total_seconds()
+            return timedelta._create(0, 0, self.sort_key() - _EPOCH_US).total_seconds()
         return self._mktime()
 
-    def weekday(self) -> int:
-        """Return the day of the week as an integer, where Monday is 0 and Sunday is 6."""
-        return (self.toordinal() + 6) % 7
-
     def ctime(self) -> str:
         "Return string representing the datetime."
         weekday = self.toordinal() % 7 or 7
@@ -1517,6 +2672,25 @@ class datetime(date):
         "Convert to string, for str()."
         return self.isoformat(sep=" ")
 
+    def strftime(self, fmt: str) -> str:
+        """Return a string representing the date and time, controlled by an
+        explicit format string.
+
+        """
+        return _strftime(
+            fmt,
+            (
+                self._year,
+                self._month,
+                self._day,
+                self._hour,
+                self._minute,
+                self._second,
+                self._microsecond,
+            ),
+            self,
+        )
+
     def replace(
         self,
         year: Optional[int] = None,
@@ -1555,6 +2729,74 @@ class datetime(date):
             fold = self._fold
         return type(self)(year, month, day, hour, minute, second, microsecond, tzinfo, fold=fold)
 
+    # Rounding to buckets of a fixed length. Buckets are laid out in wall
+    # clock time, from origin (default 1970-01-01 00:00) in steps of delta,
+    # and the result keeps the tzinfo, with fold reset to 0.
+    def floor(self, delta: timedelta, origin: Optional["datetime"] = None) -> "datetime":
+        """Return the start of the delta long bucket holding this datetime.
+
+        :param timedelta delta: The positive bucket length.
+        :param datetime origin: A bucket boundary. Only its wall clock time is used.
+        """
+        step, base = _bucket_args(delta, origin)
+        value = _round_us(self._wall_us(), step, base, _ROUND_FLOOR)
+        return self._fromwall(value, self._tzinfo, [None, 0, None])
+
+    def ceil(self, delta: timedelta, origin: Optional["datetime"] = None) -> "datetime":
+        """Return the first bucket boundary at or after this datetime, with
+        arguments as for floor().
+
+        """
+        step, base = _bucket_args(delta, origin)
+        value = _round_us(self._wall_us(), step, base, _ROUND_CEIL)
+        return self._fromwall(value, self._tzinfo, [None, 0, None])
+
+    def round(self, delta: timedelta, origin: Optional["datetime"] = None) -> "datetime":
+        """Return the nearest bucket boundary, the even numbered one on a tie,
+        with arguments as for floor().
+
+        """
+        step, base = _bucket_args(delta, origin)
+        value = _round_us(self._wall_us(), step, base, _ROUND_HALF_EVEN)
+        return self._fromwall(value, self._tzinfo, [None, 0, None])
+
+    @classmethod
+    def _round_many(
+        cls, datetimes: Iterable["datetime"], step: int, base: int, mode: int
+    ) -> Iterator["datetime"]:
+        memo = [None, 0, None]
+        for dt in datetimes:
+            value = _round_us(dt._wall_us(), step, base, mode)
+            yield cls._fromwall(value, dt._tzinfo, memo)
+
+    @classmethod
+    def floor_many(
+        cls, datetimes: Iterable["datetime"], delta: timedelta, origin: Optional["datetime"] = None
+    ) -> Iterator["datetime"]:
+        """floor() each datetime of an iterable, yielding results lazily. The
+        arguments are checked once, and consecutive results on the same day
+        share the calendar computation.
+
+        """
+        step, base = _bucket_args(delta, origin)
+        return cls._round_many(datetimes, step, base, _ROUND_FLOOR)
+
+    @classmethod
+    def ceil_many(
+        cls, datetimes: Iterable["datetime"], delta: timedelta, origin: Optional["datetime"] = None
+    ) -> Iterator["datetime"]:
+        "ceil() each datetime of an iterable, as floor_many() does."
+        step, base = _bucket_args(delta, origin)
+        return cls._round_many(datetimes, step, base, _ROUND_CEIL)
+
+    @classmethod
+    def round_many(
+        cls, datetimes: Iterable["datetime"], delta: timedelta, origin: Optional["datetime"] = None
+    ) -> Iterator["datetime"]:
+        "round() each datetime of an iterable, as floor_many() does."
+        step, base = _bucket_args(delta, origin)
+        return cls._round_many(datetimes, step, base, _ROUND_HALF_EVEN)
+
     # Comparisons of datetime objects.
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, datetime):
@@ -1584,72 +2826,76 @@ class datetime(date):
     def _cmp(self, other: "datetime", allow_mixed: bool = False) -> int:
         assert isinstance(other, datetime)
         mytz = self._tzinfo
-        ottz = other.tzinfo
-        myoff = otoff = None
+        ottz = other._tzinfo
 
         if mytz is ottz:
-            base_compare = True
+            if mytz is not None and mytz.__class__ is not timezone:
+                # A shared variable-offset zone compares local times, so the
+                # UTC based keys cannot be used.
+                return _cmp(self._wall_us(), other._wall_us())
         else:
-            myoff = self.utcoffset()
-            otoff = other.utcoffset()
-            # Assume that allow_mixed means that we are called from __eq__
+            myoff = self._utcoffset_us()
+            otoff = other._utcoffset_us()
+            # Assume that allow_mixed means that we are called from __eq__.
+            # A fixed-offset timezone gives the same offset for either fold.
             if allow_mixed:
-                if myoff != self.replace(fold=not self._fold).utcoffset():
-                    return 2
-                if otoff != other.replace(fold=not other.fold).utcoffset():
-                    return 2
-            base_compare = myoff == otoff
-
-        if base_compare:
-            return _cmp(
-                (
-                    self._year,
-                    self._month,
-                    self._day,
-                    self._hour,
-                    self._minute,
-                    self._second,
-                    self._microsecond,
-                ),
-                (
-                    other.year,
-                    other.month,
-                    other.day,
-                    other.hour,
-                    other.minute,
-                    other.second,
-                    other.microsecond,
-                ),
-            )
-        if myoff is None or otoff is None:
-            if not allow_mixed:
-                raise TypeError("cannot compare naive and aware datetimes")
-            return 2  # arbitrary non-zero value
-        diff = self - other  # this will take offsets into account
-        if diff.days < 0:
-            return -1
-        return 1 if diff else 0
+                if mytz.__class__ is not timezone and myoff is not None:
+                    if myoff != self.replace(fold=not self._fold)._utcoffset_us():
+                        return 2
+                if ottz.__class__ is not timezone and otoff is not None:
+                    if otoff != other.replace(fold=not other.fold)._utcoffset_us():
+                        return 2
+            if (myoff is None) != (otoff is None):
+                if not allow_mixed:
+                    raise TypeError("cannot compare naive and aware datetimes")
+                return 2  # arbitrary non-zero value
+        return _cmp(self.sort_key(), other.sort_key())
+
+    def sort_key(self) -> int:
+        """Return an integer that orders datetimes the way the comparison
+        operators do: microseconds since 0001-01-01 00:00 UTC for aware
+        datetimes, or since 0001-01-01 00:00 local time for naive ones. The key
+        is computed once and cached on the object, so
+        ``sorted(dts, key=datetime.sort_key)`` does no per-comparison work.
+        Keys of naive and aware datetimes are not comparable with each other.
+        """
+        key = self._sortkey
+        if key is None:
+            key = self._wall_us()
+            offset = self._utcoffset_us()
+            if offset is not None:
+                key -= offset
+            self._sortkey = key
+        return key
+
+    def _shift(self, days: int, seconds: int, microseconds: int) -> "datetime":
+        """Move by a duration given as integer parts, carrying in plain ints and
+        building only the resulting datetime.
+
+        """
+        us = self._microsecond + microseconds
+        secs = self._hour * 3600 + self._minute * 60 + self._second + seconds
+        if not 0 <= us < 1000000:
+            carry, us = divmod(us, 1000000)
+            secs += carry
+        if not 0 <= secs < 86400:
+            carry, secs = divmod(secs, 86400)
+            days += carry
+        ordinal = self.toordinal() + days
+        if not 0 < ordinal <= _MAXORDINAL:
+            raise OverflowError("result out of range")
+        y, m, d = _ord2ymd(ordinal)
+        hour, secs = divmod(secs, 3600)
+        minute, second = divmod(secs, 60)
+        result = type(self)._create(y, m, d, hour, minute, second, us, self._tzinfo)
+        result._ordinal = ordinal
+        return result
 
     def __add__(self, other: timedelta) -> "datetime":
         "Add a datetime and a timedelta."
         if not isinstance(other, timedelta):
             return NotImplemented
-        delta = timedelta(
-            self.toordinal(),
-            hours=self._hour,
-            minutes=self._minute,
-            seconds=self._second,
-            microseconds=self._microsecond,
-        )
-        delta += other
-        hour, rem = divmod(delta._seconds, 3600)
-        minute, second = divmod(rem, 60)
-        if 0 < delta._days <= _MAXORDINAL:
-            return type(self).combine(
-                date.fromordinal(delta._days),
-                time(hour, minute, second, delta._microseconds, tzinfo=self._tzinfo),
-            )
-        raise OverflowError("result out of range")
+        return self._shift(other._days, other._seconds, other._microseconds)
 
     __radd__ = __add__
 
@@ -1657,38 +2903,116 @@ class datetime(date):
         "Subtract two datetimes, or a datetime and a timedelta."
         if not isinstance(other, datetime):
             if isinstance(other, timedelta):
-                return self + -other
+                return self._shift(-other._days, -other._seconds, -other._microseconds)
             return NotImplemented
 
-        days1 = self.toordinal()
-        days2 = other.toordinal()
-        secs1 = self._second + self._minute * 60 + self._hour * 3600
-        secs2 = other._second + other._minute * 60 + other._hour * 3600
-        base = timedelta(days1 - days2, secs1 - secs2, self._microsecond - other._microsecond)
-        if self._tzinfo is other._tzinfo:
-            return base
-        myoff = self.utcoffset()
-        otoff = other.utcoffset()
-        if myoff == otoff:
-            return base
-        if myoff is None or otoff is None:
-            raise TypeError("cannot mix naive and timezone-aware time")
-        return base + otoff - myoff
+        days = self.toordinal() - other.toordinal()
+        secs = (
+            (self._hour - other._hour) * 3600
+            + (self._minute - other._minute) * 60
+            + self._second
+            - other._second
+        )
+        us = self._microsecond - other._microsecond
+        if self._tzinfo is not other._tzinfo:
+            myoff = self._utcoffset_us()
+            otoff = other._utcoffset_us()
+            if myoff != otoff:
+                if myoff is None or otoff is None:
+                    raise TypeError("cannot mix naive and timezone-aware time")
+                us += otoff - myoff
+        return timedelta._create(days, secs, us)
+
+    def _utcoffset_us(self) -> Optional[int]:
+        """UTC offset in integer microseconds, or None if naive. A fixed-offset
+        timezone is read directly, without calling utcoffset().
+
+        """
+        tz = self._tzinfo
+        if tz is None:
+            return None
+        if tz.__class__ is timezone:
+            return tz._offset._to_microseconds()
+        offset = self.utcoffset()
+        if offset is None:
+            return None
+        return offset._to_microseconds()
+
+    def _wall_us(self) -> int:
+        "Microseconds from 0001-01-01 00:00 to the local (wall clock) time."
+        return (
+            ((self.toordinal() - 1) * 86400 + self._hour * 3600 + self._minute * 60 + self._second)
+            * 1000000
+        ) + self._microsecond
 
     def __hash__(self) -> int:
         if self._hashcode == -1:
-            t = self
-            tzoff = t.utcoffset()
-            if tzoff is None:
-                self._hashcode = hash(t._getstate()[0])
-            else:
-                days = _ymd2ord(self.year, self.month, self.day)
-                seconds = self.hour * 3600 + self.minute * 60 + self.second
-                self._hashcode = hash(timedelta(days, seconds, self.microsecond) - tzoff)
+            # Both folds of an ambiguous local time hash alike, as they compare
+            # equal within their zone.
+            t = self.replace(fold=0) if self._fold else self
+            self._hashcode = hash(t.sort_key())
         return self._hashcode
 
-    def _getstate(self) -> Tuple[bytes]:
-        protocol = 3
+    # Binary encoding, the 10 byte pickle state with fold in the top bit of
+    # the month. The tzinfo is not encoded.
+    packed_size = 10
+
+    def _pack(self, buffer: Any, offset: int) -> None:
+        us = self._microsecond
+        _struct.pack_into(
+            ">HBBBBBBH",
+            buffer,
+            offset,
+            self._year,
+            self._month | (self._fold << 7),
+            self._day,
+            self._hour,
+            self._minute,
+            self._second,
+            us >> 16,
+            us & 0xFFFF,
+        )
+
+    @classmethod
+    def _unpack(cls, b: Any, p: int, tz: Optional["tzinfo"] = None) -> "datetime":
+        m = b[p + 2]
+        us = (b[p + 7] << 16) | (b[p + 8] << 8) | b[p + 9]
+        return cls(
+            (b[p] << 8) | b[p + 1],
+            m & 0x7F,
+            b[p + 3],
+            b[p + 4],
+            b[p + 5],
+            b[p + 6],
+            us,
+            tz,
+            fold=m >> 7,
+        )
+
+    def to_bytes(self) -> bytes:
+        "Return the packed_size byte encoding of the datetime, without its tzinfo."
+        data = bytearray(self.packed_size)
+        self._pack(data, 0)
+        return bytes(data)
+
+    @classmethod
+    def from_bytes(cls, data: Any, offset: int = 0, tz: Optional["tzinfo"] = None) -> "datetime":
+        """Decode a datetime written by to_bytes() or pack_into(), starting at
+        offset, and attach tz to it.
+
+        """
+        _check_buffer(data, offset, cls.packed_size)
+        return cls._unpack(data, offset, tz)
+
+    @classmethod
+    def unpack_from(
+        cls, buffer: Any, offset: int = 0, count: int = 1, tz: Optional["tzinfo"] = None
+    ) -> List["datetime"]:
+        "Read count datetimes written by pack_into(), starting at offset, all in tz."
+        return _unpack_items(cls, buffer, offset, count, tz)
+
+    # Pickle support
+    def _getstate(self, protocol: int = 3) -> Tuple[bytes]:
         yhi, ylo = divmod(self._year, 256)
         us2, us3 = divmod(self._microsecond, 256)
         us1, us2 = divmod(us2, 256)
@@ -1713,11 +3037,1542 @@ class datetime(date):
             return (basestate, self._tzinfo)
         return (basestate,)
 
+    def _setstate(self, string: bytes, tzinfo: Optional[tzinfo]) -> None:
+        if tzinfo is not None and not isinstance(tzinfo, _tzinfo_class):
+            raise TypeError("bad tzinfo state arg")
+        yhi, ylo, m, self._day, self._hour, self._minute, self._second, us1, us2, us3 = string
+        self._year = yhi * 256 + ylo
+        self._month = m & 0x7F
+        self._fold = m >> 7
+        self._microsecond = (((us1 << 8) | us2) << 8) | us3
+        self._tzinfo = tzinfo
+        self._hashcode = -1
+        self._sortkey = None
+        self._ordinal = 0
+
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        # fold is only stored for protocol 4 and up, as CPython does
+        return (self.__class__, self._getstate(protocol))
+
+    def __reduce__(self) -> tuple:
+        return self.__reduce_ex__(2)
+
+
+# Directories searched in order by ZoneInfo for compiled tzdata (TZif) files.
+TZPATH = [
+    "/zoneinfo",
+    "/usr/share/zoneinfo",
+    "/usr/lib/zoneinfo",
+    "/usr/share/lib/zoneinfo",
+    "/etc/zoneinfo",
+]
+
+
+def _bisect_right(values: Sequence[int], value: int) -> int:
+    "Index just past the last entry <= value in the sorted sequence values."
+    lo, hi = 0, len(values)
+    while lo < hi:
+        mid = (lo + hi) >> 1
+        if value < values[mid]:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+def _bisect_left(values: Sequence[int], value: int) -> int:
+    "Index of the first entry >= value in the sorted sequence values."
+    lo, hi = 0, len(values)
+    while lo < hi:
+        mid = (lo + hi) >> 1
+        if values[mid] < value:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def _posix_name(string: str, pos: int) -> Tuple[str, int]:
+    "Zone abbreviation at pos, either alphabetic or <quoted> -> (name, end)."
+    if string[pos] == "<":
+        end = string.index(">", pos)
+        return string[pos + 1 : end], end + 1
+    end = pos
+    while end < len(string) and string[end].isalpha():
+        end += 1
+    if end - pos < 3:
+        raise ValueError("abbreviation too short")
+    return string[pos:end], end
+
+
+def _posix_time(string: str, pos: int) -> Tuple[int, int]:
+    "[+|-]hh[:mm[:ss]] at pos -> (signed seconds, end)."
+    sign = 1
+    if string[pos] in "+-":
+        sign = -1 if string[pos] == "-" else 1
+        pos += 1
+    seconds = 0
+    for scale in (3600, 60, 1):
+        end = pos
+        while end < len(string) and string[end].isdigit():
+            end += 1
+        if end == pos or end - pos > 3:
+            raise ValueError("bad time")
+        seconds += int(string[pos:end]) * scale
+        pos = end
+        if pos >= len(string) or string[pos] != ":":
+            break
+        pos += 1
+    return sign * seconds, pos
+
+
+def _posix_rule(string: str) -> Tuple[str, int, int, int, int]:
+    """Mm.w.d, Jn or n, with an optional /time -> (kind, m or n, w, d, seconds)
+    where kind is "M", "J" or ""."""
+    rule, _, at = string.partition("/")
+    seconds = 7200
+    if at:
+        seconds, end = _posix_time(at, 0)
+        if end != len(at):
+            raise ValueError("bad transition time")
+    if rule[0] == "M":
+        month, week, weekday = (int(part) for part in rule[1:].split("."))
+        if not (1 <= month <= 12 and 1 <= week <= 5 and 0 <= weekday <= 6):
+            raise ValueError("bad M rule")
+        return "M", month, week, weekday, seconds
+    if rule[0] == "J":
+        day = int(rule[1:])
+        if not 1 <= day <= 365:
+            raise ValueError("bad J rule")
+        return "J", day, 0, 0, seconds
+    day = int(rule)
+    if not 0 <= day <= 365:
+        raise ValueError("bad day rule")
+    return "", day, 0, 0, seconds
+
+
+def _parse_posix_tz(string: str) -> tuple:
+    "POSIX TZ string -> (std name, std offset, dst name, dst offset, start, end)."
+    std_name, pos = _posix_name(string, 0)
+    std, pos = _posix_time(string, pos)
+    std = -std  # POSIX offsets are positive west of Greenwich
+    if pos == len(string):
+        return std_name, std, None, 0, None, None
+    dst_name, pos = _posix_name(string, pos)
+    dst = std + 3600
+    if pos < len(string) and string[pos] != ",":
+        dst, pos = _posix_time(string, pos)
+        dst = -dst
+    rules = string[pos + 1 :].split(",") if pos < len(string) else ["M3.2.0", "M11.1.0"]
+    start, end = rules  # exactly two rules
+    return std_name, std, dst_name, dst, _posix_rule(start), _posix_rule(end)
+
+
+# PosixTimeZone instances shared by rule string.
+_POSIX_TZ_CACHE = _LRUCache(8)
+
+
+class PosixTimeZone(tzinfo):
+    """A time zone described by a POSIX TZ rule string such as
+    ``"CET-1CEST,M3.5.0,M10.5.0/3"``, for devices that cannot carry tzdata.
+
+    DST transitions are computed arithmetically and cached for the last few
+    years used, so repeated lookups within a year only compare integers.
+    Offsets are rounded to whole minutes, as utcoffset() requires. A zone
+    with DST but no rules follows the United States rules. The last few rule
+    strings used map to shared instances, so unpickled and copied zones are
+    the same object and aware datetimes keep comparing by wall time.
+
+    :param str rule: POSIX TZ string
+    """
+
+    __slots__ = ("_rule", "_std", "_dst", "_start", "_end", "_years")
+
+    def __new__(cls, rule: str) -> "PosixTimeZone":
+        key = (cls, rule)
+        self = _POSIX_TZ_CACHE.get(key)
+        if self is not None:
+            return self
+        try:
+            std_name, std, dst_name, dst, start, end = _parse_posix_tz(rule)
+        except (ValueError, IndexError) as error:
+            raise ValueError(f"Invalid POSIX TZ string: {rule!r}") from error
+        std = (std + 30) // 60 * 60
+        dst = (dst + 30) // 60 * 60
+        self = object.__new__(cls)
+        self._rule = rule
+        self._std = (std, timedelta(0, std), timedelta(0), std_name)
+        self._dst = None
+        if dst_name is not None:
+            self._dst = (dst, timedelta(0, dst), timedelta(0, dst - std), dst_name)
+        self._start = start
+        self._end = end
+        self._years = _LRUCache(4)
+        _POSIX_TZ_CACHE.put(key, self)
+        return self
+
+    @staticmethod
+    def _instant(year: int, rule: tuple) -> int:
+        "Local seconds since the epoch at which rule falls in year."
+        kind, number, week, weekday, seconds = rule
+        if kind == "M":
+            first = _ymd2ord(year, number, 1)
+            # Ordinals are 1 on a Monday, so ordinal % 7 counts from Sunday.
+            day = (weekday - first) % 7 + (week - 1) * 7
+            if day >= _days_in_month(year, number):
+                day -= 7
+            ordinal = first + day
+        elif kind == "J":
+            ordinal = _ymd2ord(year, 1, 1) + number - 1 + (number >= 60 and _is_leap(year))
+        else:
+            ordinal = _ymd2ord(year, 1, 1) + number
+        return (ordinal - _EPOCH_ORDINAL) * 86400 + seconds
+
+    def _bounds(self, year: int) -> Tuple[int, int]:
+        "year -> UTC seconds since the epoch at which DST starts and ends."
+        bounds = self._years.get(year)
+        if bounds is None:
+            bounds = (
+                self._instant(year, self._start) - self._std[0],
+                self._instant(year, self._end) - self._dst[0],
+            )
+            self._years.put(year, bounds)
+        return bounds
+
+    def _find(self, dt: Optional["datetime"]) -> Optional[tuple]:
+        if dt is None:
+            return None if self._dst else self._std
+        if not isinstance(dt, datetime):
+            raise TypeError("argument must be a datetime instance or None")
+        if self._dst is None:
+            return self._std
+        std, dst = self._std[0], self._dst[0]
+        # As wall clock times, transitions fall after the gap or overlap they
+        # open for fold=0 and before it for fold=1.
+        shift = min(std, dst) if dt.fold else max(std, dst)
+        start, end = self._bounds(dt.year)
+        seconds = (dt._wall_us() - _EPOCH_US) // 1000000 - shift
+        if start < end:
+            return self._dst if start <= seconds < end else self._std
+        return self._std if end <= seconds < start else self._dst
+
+    def _find_utc(self, seconds: int, year: int) -> Tuple[tuple, bool]:
+        "UTC seconds since the epoch -> (offset info, fold)."
+        if self._dst is None:
+            return self._std, False
+        std, dst = self._std[0], self._dst[0]
+        start, end = self._bounds(year)
+        if start < end:
+            isdst = start <= seconds < end
+        else:
+            isdst = not end <= seconds < start
+        # The clocks go back when leaving DST, or entering a negative DST.
+        back, step = (end, dst - std) if dst > std else (start, std - dst)
+        return (self._dst if isdst else self._std), 0 <= seconds - back < step
+
+    def utcoffset(self, dt: Optional["datetime"]) -> Optional[timedelta]:
+        info = self._find(dt)
+        return None if info is None else info[1]
+
+    def dst(self, dt: Optional["datetime"]) -> Optional[timedelta]:
+        info = self._find(dt)
+        return None if info is None else info[2]
+
+    def tzname(self, dt: Optional["datetime"]) -> Optional[str]:
+        info = self._find(dt)
+        return None if info is None else info[3]
+
+    def fromutc(self, dt: "datetime") -> "datetime":
+        "datetime in UTC -> datetime in local time."
+        if not isinstance(dt, datetime):
+            raise TypeError("fromutc() requires a datetime argument")
+        if dt.tzinfo is not self:
+            raise ValueError("dt.tzinfo is not self")
+        seconds = (dt._wall_us() - _EPOCH_US) // 1000000
+        info, fold = self._find_utc(seconds, dt.year)
+        result = dt + info[1]
+        if fold:
+            return result.replace(fold=1)
+        return result
+
+    # Zones from the same rule string are equal, including ones evicted from the cache
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, PosixTimeZone):
+            return NotImplemented
+        return self._rule == other._rule
+
+    def __hash__(self) -> int:
+        return hash(self._rule)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._rule!r})"
+
+    def __reduce__(self) -> tuple:
+        return (self.__class__, (self._rule,))
+
+    def __str__(self) -> str:
+        return self._rule
+
+
+class ZoneInfoNotFoundError(KeyError):
+    """Raised when no TZif file for a ZoneInfo key is found in TZPATH."""
+
+
+class ZoneInfo(tzinfo):
+    """A time zone with the full history of offset changes of an IANA tzdata
+    zone, read from its compiled TZif (version 1 to 3) file.
+
+    ``ZoneInfo("Europe/Berlin")`` searches the directories of TZPATH and keeps
+    the last few zones loaded, so repeated keys are parsed once. Use
+    from_file() or from_bytes() to load a zone from elsewhere, bypassing the
+    cache.
+
+    Offsets are rounded to whole minutes, as utcoffset() requires. Datetimes
+    after the last transition of the file follow the POSIX TZ rule string in
+    its footer, or keep the final offset if there is none.
+    """
+
+    __slots__ = ("_key", "_utc", "_wall", "_wall_fold", "_indices", "_types", "_before", "_after")
+
+    _cache = _LRUCache(8)
+
+    def __new__(cls, key: str) -> "ZoneInfo":
+        zone = cls._cache.get((cls, key))
+        if zone is None:
+            zone = cls.no_cache(key)
+            cls._cache.put((cls, key), zone)
+        return zone
+
+    @classmethod
+    def no_cache(cls, key: str) -> "ZoneInfo":
+        """Load the zone named key from TZPATH without consulting or filling the
+        cache.
+
+        :param str key: Zone name such as ``"Europe/Berlin"``
+        """
+        if key.startswith("/") or ".." in key.split("/"):
+            raise ValueError(f"ZoneInfo keys must be relative paths, got: {key!r}")
+        for directory in TZPATH:
+            try:
+                with open(f"{directory}/{key}", "rb") as file:
+                    data = file.read()
+            except OSError:
+                continue
+            return cls.from_bytes(data, key)
+        raise ZoneInfoNotFoundError(f"No time zone found with key {key}")
+
+    @classmethod
+    def from_file(cls, file: Any, key: Optional[str] = None) -> "ZoneInfo":
+        """Load a zone from a binary file object holding TZif data."""
+        return cls.from_bytes(file.read(), key)
+
+    @classmethod
+    def from_bytes(cls, data: Any, key: Optional[str] = None) -> "ZoneInfo":
+        """Load a zone from TZif data already in memory, in a bytes, bytearray
+        or memoryview buffer.
+
+        """
+        self = object.__new__(cls)
+        self._key = key
+        self._load(data)
+        return self
+
+    @classmethod
+    def clear_cache(cls, *, only_keys: Optional[Iterable[str]] = None) -> None:
+        """Forget cached zones, all of them or only those named in only_keys."""
+        if only_keys is None:
+            cls._cache.clear()
+        else:
+            for key in only_keys:
+                cls._cache.pop((cls, key))
+
+    def _load(self, data: Any) -> None:
+        if bytes(data[:4]) != b"TZif":
+            raise ValueError("Invalid TZif file: magic not found")
+        header = ">6l"
+        counts = _struct.unpack_from(header, data, 20)
+        pos, size, code = 44, 4, "l"
+        if data[4] >= 0x32:  # version 2+ repeats the data with 64-bit times
+            utcnt, stdcnt, leapcnt, timecnt, typecnt, charcnt = counts
+            pos += timecnt * 5 + typecnt * 6 + charcnt + leapcnt * 8 + stdcnt + utcnt
+            counts = _struct.unpack_from(header, data, pos + 20)
+            pos, size, code = pos + 44, 8, "q"
+        utcnt, stdcnt, leapcnt, timecnt, typecnt, charcnt = counts
+
+        times = _struct.unpack_from(f">{timecnt}{code}", data, pos) if timecnt else ()
+        pos += timecnt * size
+        indices = bytes(data[pos : pos + timecnt])
+        pos += timecnt
+        raw = [_struct.unpack_from(">lBB", data, pos + 6 * i) for i in range(typecnt)]
+        abbrs = bytes(data[pos + 6 * typecnt : pos + 6 * typecnt + charcnt])
+        after = None
+        if size == 8:
+            pos += 6 * typecnt + charcnt + leapcnt * 12 + stdcnt + utcnt
+            footer = bytes(data[pos + 1 :])
+            footer = footer[: footer.index(b"\n")].decode()
+            if footer:
+                after = PosixTimeZone(footer)
+
+        # TZif only flags DST. Its amount is the step from the standard offset
+        # just before it or, failing that, just after it.
+        dst = [None] * typecnt
+        for i, index in enumerate(indices):
+            utoff, isdst, _ = raw[index]
+            if not isdst or dst[index] is not None:
+                continue
+            for j in (i - 1, i + 1):
+                if 0 <= j < timecnt and not raw[indices[j]][1]:
+                    dst[index] = utoff - raw[indices[j]][0]
+                    break
+        types = []
+        for index, (utoff, isdst, abbrind) in enumerate(raw):
+            amount = 0
+            if isdst:
+                amount = 3600 if dst[index] is None else dst[index]
+            utoff = (utoff + 30) // 60 * 60
+            amount = (amount + 30) // 60 * 60
+            name = abbrs[abbrind : abbrs.index(b"\0", abbrind)].decode()
+            types.append((utoff, timedelta(0, utoff), timedelta(0, amount), name))
+
+        before = types[0]
+        for info, (_, isdst, _) in zip(types, raw):
+            if not isdst:
+                before = info
+                break
+
+        # Wall clock time of each transition: _wall with the larger of the
+        # offsets on either side, so fold=0 stays on the earlier side of a gap or
+        # overlap, and _wall_fold with the smaller one.
+        wall = _array.array("q", times)
+        wall_fold = _array.array("q", times)
+        previous = before[0]
+        for i, index in enumerate(indices):
+            utoff = types[index][0]
+            wall[i] += max(previous, utoff)
+            wall_fold[i] += min(previous, utoff)
+            previous = utoff
+
+        self._utc = _array.array("q", times)
+        self._wall = wall
+        self._wall_fold = wall_fold
+        self._indices = indices
+        self._types = types
+        self._before = before
+        self._after = after
+
+    @property
+    def key(self) -> Optional[str]:
+        """The zone name passed to the constructor, or None."""
+        return self._key
+
+    def _find(self, dt: Optional["datetime"]) -> Optional[tuple]:
+        if dt is None:
+            return None if self._utc else self._before
+        if not isinstance(dt, datetime):
+            raise TypeError("argument must be a datetime instance or None")
+        seconds = (dt._wall_us() - _EPOCH_US) // 1000000
+        index = _bisect_right(self._wall_fold if dt.fold else self._wall, seconds)
+        if index == len(self._indices) and self._after is not None:
+            return self._after._find(dt)
+        if index:
+            return self._types[self._indices[index - 1]]
+        return self._before
+
+    def _find_utc(self, seconds: int, year: int) -> Tuple[tuple, bool]:
+        "UTC seconds since the epoch -> (offset info, fold)."
+        index = _bisect_right(self._utc, seconds)
+        if index == len(self._indices) and self._after is not None:
+            return self._after._find_utc(seconds, year)
+        if not index:
+            return self._before, False
+        info = self._types[self._indices[index - 1]]
+        previous = self._types[self._indices[index - 2]] if index > 1 else self._before
+        # Within an overlap when less time has passed since the clocks went
+        # back than the size of the step.
+        return info, previous[0] - info[0] > seconds - self._utc[index - 1]
+
+    def utcoffset(self, dt: Optional["datetime"]) -> Optional[timedelta]:
+        info = self._find(dt)
+        return None if info is None else info[1]
+
+    def dst(self, dt: Optional["datetime"]) -> Optional[timedelta]:
+        info = self._find(dt)
+        return None if info is None else info[2]
+
+    def tzname(self, dt: Optional["datetime"]) -> Optional[str]:
+        info = self._find(dt)
+        return None if info is None else info[3]
+
+    def fromutc(self, dt: "datetime") -> "datetime":
+        "datetime in UTC -> datetime in local time."
+        if not isinstance(dt, datetime):
+            raise TypeError("fromutc() requires a datetime argument")
+        if dt.tzinfo is not self:
+            raise ValueError("dt.tzinfo is not self")
+        seconds = (dt._wall_us() - _EPOCH_US) // 1000000
+        info, fold = self._find_utc(seconds, dt.year)
+        result = dt + info[1]
+        if fold:
+            return result.replace(fold=1)
+        return result
+
+    def __reduce__(self) -> tuple:
+        # Zones are pickled by key and reloaded from TZPATH when unpickled.
+        if self._key is None:
+            raise TypeError("cannot pickle a ZoneInfo without a key")
+        return (self.__class__, (self._key,))
+
+    def __repr__(self) -> str:
+        if self._key is None:
+            return f"{self.__class__.__name__}.from_file()"
+        return f"{self.__class__.__name__}(key={self._key!r})"
+
+    def __str__(self) -> str:
+        if self._key is None:
+            return repr(self)
+        return self._key
+
+
+class DatetimeArray:
+    """A compact sequence of datetimes sharing one tzinfo, stored as an
+    ``array.array('q')`` of microseconds since the epoch: UTC instants for an
+    aware array, wall clock times for a naive one (tzinfo None).
+
+    Arithmetic, comparisons, sorting and searching work on the integers;
+    datetime objects are only built when an element is indexed or iterated.
+
+    :param values: An iterable of datetimes, all naive when tzinfo is None and
+        all aware otherwise. Aware values are converted to tzinfo.
+    :param tzinfo: The timezone elements are returned in.
+    """
+
+    __slots__ = ("_us", "_tzinfo")
+
+    def __init__(self, values: Iterable["datetime"] = (), tzinfo: Optional["tzinfo"] = None):
+        _check_tzinfo_arg(tzinfo)
+        self._tzinfo = tzinfo
+        self._us = _array.array("q", [self._value(dt) for dt in values])
+
+    @classmethod
+    def from_microseconds(
+        cls, values: Iterable[int], tzinfo: Optional["tzinfo"] = None
+    ) -> "DatetimeArray":
+        """Wrap epoch microseconds without converting them. An ``array('q')``
+        is used as the backing store directly, without copying.
+
+        """
+        _check_tzinfo_arg(tzinfo)
+        self = object.__new__(cls)
+        self._tzinfo = tzinfo
+        if not isinstance(values, _array.array) or values.typecode != "q":
+            values = _array.array("q", values)
+        self._us = cls._check_range(values)
+        return self
+
+    @staticmethod
+    def _check_range(values: "_array.array") -> "_array.array":
+        if values and (min(values) < -_EPOCH_US or max(values) >= _MAX_US):
+            raise OverflowError("date value out of range")
+        return values
+
+    def _value(self, dt: "datetime") -> int:
+        "datetime -> epoch microseconds as stored in this array."
+        if not isinstance(dt, datetime):
+            raise TypeError(f"expected datetime, not {type(dt).__name__}")
+        offset = dt._utcoffset_us()
+        if (offset is None) != (self._tzinfo is None):
+            raise TypeError("cannot mix naive and timezone-aware time")
+        if offset is None:
+            return dt._wall_us() - _EPOCH_US
+        return dt.sort_key() - _EPOCH_US
+
+    def _values(self, other: Union["datetime", "DatetimeArray"]) -> Sequence[int]:
+        "Epoch microseconds of other, one per element of this array."
+        if isinstance(other, DatetimeArray):
+            if (other._tzinfo is None) != (self._tzinfo is None):
+                raise TypeError("cannot mix naive and timezone-aware time")
+            if len(other._us) != len(self._us):
+                raise ValueError("DatetimeArray lengths differ")
+            return other._us
+        return (self._value(other),) * len(self._us)
+
+    def _derive(self, values: Iterable[int]) -> "DatetimeArray":
+        result = object.__new__(self.__class__)
+        result._tzinfo = self._tzinfo
+        result._us = values
+        return result
+
+    @property
+    def microseconds(self) -> "_array.array":
+        "The backing ``array('q')`` of epoch microseconds."
+        return self._us
+
+    @property
+    def tzinfo(self) -> Optional["tzinfo"]:
+        "The timezone shared by all elements, or None for naive datetimes."
+        return self._tzinfo
+
+    def __len__(self) -> int:
+        return len(self._us)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union["datetime", "DatetimeArray"]:
+        if isinstance(index, slice):
+            return self._derive(self._us[index])
+        seconds, us = divmod(self._us[index], 1000000)
+        return datetime._fromepoch(seconds, us, self._tzinfo, [None, 0, None])
+
+    def __setitem__(self, index: int, dt: "datetime") -> None:
+        self._us[index] = self._value(dt)
+
+    def __iter__(self) -> Iterator["datetime"]:
+        tz = self._tzinfo
+        memo = [None, 0, None]
+        for value in self._us:
+            seconds, us = divmod(value, 1000000)
+            yield datetime._fromepoch(seconds, us, tz, memo)
+
+    def append(self, dt: "datetime") -> None:
+        "Add a datetime to the end of the array."
+        self._us.append(self._value(dt))
+
+    def extend(self, values: Iterable["datetime"]) -> None:
+        "Add each datetime of an iterable to the end of the array."
+        for dt in values:
+            self._us.append(self._value(dt))
+
+    # Arithmetic
+
+    def __add__(self, other: "timedelta") -> "DatetimeArray":
+        if not isinstance(other, timedelta):
+            return NotImplemented
+        delta = other._to_microseconds()
+        return self._derive(self._check_range(_array.array("q", [v + delta for v in self._us])))
+
+    __radd__ = __add__
+
+    def __sub__(
+        self, other: Union["timedelta", "datetime", "DatetimeArray"]
+    ) -> Union["DatetimeArray", List["timedelta"]]:
+        """Subtracting a timedelta shifts every element. Subtracting a datetime
+        or an array of the same length returns a list of timedeltas.
+
+        """
+        if isinstance(other, timedelta):
+            return self + -other
+        if not isinstance(other, (datetime, DatetimeArray)):
+            return NotImplemented
+        values = self._values(other)
+        return [timedelta._create(0, 0, a - b) for a, b in zip(self._us, values)]
+
+    # Rounding, as datetime.floor(), ceil() and round() do for each element
+
+    def _round(
+        self, delta: "timedelta", origin: Optional["datetime"], mode: int
+    ) -> "DatetimeArray":
+        step, base = _bucket_args(delta, origin)
+        tz = self._tzinfo
+        if tz is None or tz.__class__ is timezone:
+            # Wall clock time is a fixed shift of the stored values.
+            base -= _EPOCH_US if tz is None else _EPOCH_US + tz._offset._to_microseconds()
+            values = [_round_us(value, step, base, mode) for value in self._us]
+        else:
+            values = [self._value(dt) for dt in datetime._round_many(self, step, base, mode)]
+        return self._derive(self._check_range(_array.array("q", values)))
+
+    def floor(self, delta: "timedelta", origin: Optional["datetime"] = None) -> "DatetimeArray":
+        "Return a new array with every element floored to delta buckets."
+        return self._round(delta, origin, _ROUND_FLOOR)
+
+    def ceil(self, delta: "timedelta", origin: Optional["datetime"] = None) -> "DatetimeArray":
+        "Return a new array with every element ceiled to delta buckets."
+        return self._round(delta, origin, _ROUND_CEIL)
+
+    def round(self, delta: "timedelta", origin: Optional["datetime"] = None) -> "DatetimeArray":
+        "Return a new array with every element rounded to delta buckets."
+        return self._round(delta, origin, _ROUND_HALF_EVEN)
+
+    # Comparisons return one bool per element, as a list.
+
+    def _mask(self, other: Union["datetime", "DatetimeArray"], op: int) -> List[bool]:
+        values = self._values(other)
+        if op == 0:
+            return [a == b for a, b in zip(self._us, values)]
+        if op == 1:
+            return [a < b for a, b in zip(self._us, values)]
+        if op == 2:
+            return [a <= b for a, b in zip(self._us, values)]
+        if op == 3:
+            return [a > b for a, b in zip(self._us, values)]
+        return [a >= b for a, b in zip(self._us, values)]
+
+    def __eq__(self, other: Union["datetime", "DatetimeArray"]) -> List[bool]:
+        if not isinstance(other, (datetime, DatetimeArray)):
+            return NotImplemented
+        return self._mask(other, 0)
+
+    def __ne__(self, other: Union["datetime", "DatetimeArray"]) -> List[bool]:
+        if not isinstance(other, (datetime, DatetimeArray)):
+            return NotImplemented
+        return [not equal for equal in self._mask(other, 0)]
+
+    def __lt__(self, other: Union["datetime", "DatetimeArray"]) -> List[bool]:
+        return self._mask(other, 1)
+
+    def __le__(self, other: Union["datetime", "DatetimeArray"]) -> List[bool]:
+        return self._mask(other, 2)
+
+    def __gt__(self, other: Union["datetime", "DatetimeArray"]) -> List[bool]:
+        return self._mask(other, 3)
+
+    def __ge__(self, other: Union["datetime", "DatetimeArray"]) -> List[bool]:
+        return self._mask(other, 4)
+
+    __hash__ = None
+
+    # Ordering
+
+    def sort(self, reverse: bool = False) -> None:
+        "Sort the elements in place, earliest first unless reverse is true."
+        # Write back into the same buffer, which microseconds may have handed out.
+        self._us[:] = _array.array("q", sorted(self._us, reverse=reverse))
+
+    def searchsorted(self, dt: "datetime", side: str = "left") -> int:
+        """Index at which dt would be inserted to keep a sorted array sorted:
+        before any equal elements for side "left", after them for "right".
+
+        """
+        if side == "left":
+            return _bisect_left(self._us, self._value(dt))
+        if side == "right":
+            return _bisect_right(self._us, self._value(dt))
+        raise ValueError(f"side must be 'left' or 'right', not {side!r}")
+
+    # NumPy interoperability
+
+    @classmethod
+    def from_datetime64(cls, values: Any, tzinfo: Optional["tzinfo"] = None) -> "DatetimeArray":
+        """Build an array from a NumPy datetime64 array, whose values are taken
+        as UTC when tzinfo is given and as wall clock times otherwise.
+
+        """
+        _check_tzinfo_arg(tzinfo)
+        self = object.__new__(cls)
+        self._tzinfo = tzinfo
+        self._us = _array.array("q")
+        self._us.frombytes(_datetime64_us(values).tobytes())
+        cls._check_range(self._us)
+        return self
+
+    def to_datetime64(self) -> Any:
+        """Return the elements as a NumPy datetime64[us] array, in UTC for an
+        aware array.
+
+        """
+        return _numpy().array(self._us, dtype="int64").view("datetime64[us]")
+
+    # Conversions
+
+    def isoformat(self, sep: str = "T", timespec: str = "auto") -> List[str]:
+        "Return datetime.isoformat() of every element, as a list."
+        return [dt.isoformat(sep, timespec) for dt in self]
+
+    def tolist(self) -> List["datetime"]:
+        "Return the elements as a list of datetimes."
+        return list(self)
+
+    def __reduce__(self) -> tuple:
+        return (self.__class__.from_microseconds, (self._us, self._tzinfo))
+
+    def __repr__(self) -> str:
+        items = ", ".join(repr(dt) for dt in self)
+        if self._tzinfo is None:
+            return f"{self.__class__.__name__}([{items}])"
+        return f"{self.__class__.__name__}([{items}], tzinfo={self._tzinfo!r})"
+
+
+class date_range:
+    """An immutable sequence of dates from start up to, but not including,
+    stop, every step days. Like range, it has constant time len(), indexing,
+    membership tests and slicing, all worked out on ordinals.
+
+    :param date start: The first date.
+    :param date stop: The date the sequence stops before.
+    :param timedelta step: A non-zero, whole number of days. Defaults to one day.
+    """
+
+    __slots__ = ("_range",)
+
+    def __init__(self, start: "date", stop: "date", step: "timedelta" = timedelta(days=1)):
+        if isinstance(start, datetime) or isinstance(stop, datetime):
+            raise TypeError("date_range() takes dates, use datetime_range() for datetimes")
+        if not isinstance(start, date) or not isinstance(stop, date):
+            raise TypeError("start and stop must be dates")
+        if not isinstance(step, timedelta):
+            raise TypeError("step must be a timedelta")
+        if step._seconds or step._microseconds:
+            raise ValueError("step must be a whole number of days")
+        if not step:
+            raise ValueError("step must not be zero")
+        self._range = range(start.toordinal(), stop.toordinal(), step._days)
+
+    @classmethod
+    def _from_range(cls, ordinals: range) -> "date_range":
+        self = object.__new__(cls)
+        self._range = ordinals
+        return self
+
+    @staticmethod
+    def _date(year: int, month: int, day: int, ordinal: int) -> "date":
+        "date from fields and ordinal already known to be valid."
+        self = object.__new__(date)
+        self._year = year
+        self._month = month
+        self._day = day
+        self._hashcode = -1
+        self._ordinal = ordinal
+        return self
+
+    @property
+    def start(self) -> "date":
+        "The first date, or where an empty range would have started."
+        return date.fromordinal(self._range.start)
+
+    @property
+    def step(self) -> "timedelta":
+        "The distance between consecutive dates."
+        return timedelta._create(self._range.step, 0, 0)
+
+    def __len__(self) -> int:
+        return len(self._range)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union["date", "date_range"]:
+        if isinstance(index, slice):
+            return self._from_range(self._range[index])
+        ordinal = self._range[index]
+        return self._date(*_ord2ymd(ordinal), ordinal)
+
+    def __contains__(self, value: Any) -> bool:
+        if not isinstance(value, date) or isinstance(value, datetime):
+            return False
+        return value.toordinal() in self._range
+
+    def index(self, value: "date") -> int:
+        "Return the position of value, raising ValueError if it is not present."
+        if value not in self:
+            raise ValueError(f"{value!r} is not in range")
+        return self._range.index(value.toordinal())
+
+    def count(self, value: "date") -> int:
+        "Return 1 if value is in the range, 0 otherwise."
+        return int(value in self)
+
+    def __iter__(self) -> Iterator["date"]:
+        # Walk the calendar fields along, carrying into the next or previous
+        # month, instead of converting every ordinal. Steps longer than a
+        # month convert each ordinal.
+        ordinals = self._range
+        if not ordinals:
+            return
+        step = ordinals.step
+        if not -28 <= step <= 28:
+            for ordinal in ordinals:
+                yield self._date(*_ord2ymd(ordinal), ordinal)
+            return
+        ordinal = ordinals.start
+        y, m, d = _ord2ymd(ordinal)
+        for _ in range(len(ordinals) - 1):
+            yield self._date(y, m, d, ordinal)
+            ordinal += step
+            d += step
+            if d > 28 and d > _days_in_month(y, m):
+                d -= _days_in_month(y, m)
+                if m == 12:
+                    y += 1
+                    m = 1
+                else:
+                    m += 1
+            elif d < 1:
+                if m == 1:
+                    y -= 1
+                    m = 12
+                else:
+                    m -= 1
+                d += _days_in_month(y, m)
+        yield self._date(y, m, d, ordinal)
+
+    def __reversed__(self) -> Iterator["date"]:
+        return iter(self[::-1])
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, date_range):
+            return self._range == other._range
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._range)
+
+    def __repr__(self) -> str:
+        ordinals = self._range
+        stop = date.fromordinal(ordinals.stop) if 0 < ordinals.stop <= _MAXORDINAL else ...
+        return f"{self.__class__.__name__}({self.start!r}, {stop!r}, {self.step!r})"
+
+
+class datetime_range:
+    """An immutable sequence of datetimes from start up to, but not including,
+    stop, every step. Like range, it has constant time len(), indexing,
+    membership tests and slicing, all worked out on microseconds.
+
+    Like datetime + timedelta, the steps are taken in wall clock time, and
+    every item has the tzinfo of start.
+
+    :param datetime start: The first datetime.
+    :param datetime stop: The datetime the sequence stops before, with the
+        same tzinfo as start.
+    :param timedelta step: A non-zero timedelta.
+    """
+
+    __slots__ = ("_range", "_tzinfo")
+
+    def __init__(self, start: "datetime", stop: "datetime", step: "timedelta"):
+        if not isinstance(start, datetime) or not isinstance(stop, datetime):
+            raise TypeError("start and stop must be datetimes")
+        if not isinstance(step, timedelta):
+            raise TypeError("step must be a timedelta")
+        if not step:
+            raise ValueError("step must not be zero")
+        if start._tzinfo is not stop._tzinfo and start._tzinfo != stop._tzinfo:
+            raise ValueError("start and stop must have the same tzinfo")
+        self._tzinfo = start._tzinfo
+        self._range = range(start._wall_us(), stop._wall_us(), step._to_microseconds())
+
+    def _derive(self, values: range) -> "datetime_range":
+        result = object.__new__(self.__class__)
+        result._range = values
+        result._tzinfo = self._tzinfo
+        return result
+
+    def _datetime(self, value: int, memo: list) -> "datetime":
+        "Wall clock microseconds since 0001-01-01 -> datetime in the range's tzinfo."
+        return datetime._fromwall(value, self._tzinfo, memo)
+
+    def _key(self, value: Any) -> Optional[int]:
+        "Wall clock microseconds of value in the range's tzinfo, None if not comparable."
+        if not isinstance(value, datetime):
+            return None
+        tz = self._tzinfo
+        if value._tzinfo is tz or value._tzinfo == tz:
+            return value._wall_us()
+        if tz.__class__ is timezone and value._utcoffset_us() is not None:
+            return value.sort_key() + tz._offset._to_microseconds()
+        return None
+
+    @property
+    def start(self) -> "datetime":
+        "The first datetime, or where an empty range would have started."
+        return self._datetime(self._range.start, [None, 0, None])
+
+    @property
+    def step(self) -> "timedelta":
+        "The distance between consecutive datetimes."
+        return timedelta._create(0, 0, self._range.step)
+
+    @property
+    def tzinfo(self) -> Optional["tzinfo"]:
+        "The tzinfo of every item."
+        return self._tzinfo
+
+    def __len__(self) -> int:
+        return len(self._range)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union["datetime", "datetime_range"]:
+        if isinstance(index, slice):
+            return self._derive(self._range[index])
+        return self._datetime(self._range[index], [None, 0, None])
+
+    def __contains__(self, value: Any) -> bool:
+        key = self._key(value)
+        return key is not None and key in self._range
+
+    def index(self, value: "datetime") -> int:
+        "Return the position of value, raising ValueError if it is not present."
+        key = self._key(value)
+        if key is None or key not in self._range:
+            raise ValueError(f"{value!r} is not in range")
+        return self._range.index(key)
+
+    def count(self, value: "datetime") -> int:
+        "Return 1 if value is in the range, 0 otherwise."
+        return int(value in self)
+
+    def __iter__(self) -> Iterator["datetime"]:
+        # Consecutive items on the same day share the calendar computation.
+        memo = [None, 0, None]
+        for value in self._range:
+            yield self._datetime(value, memo)
+
+    def __reversed__(self) -> Iterator["datetime"]:
+        return iter(self[::-1])
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, datetime_range):
+            return self._range == other._range and self._tzinfo == other._tzinfo
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._range)
+
+    def __repr__(self) -> str:
+        values = self._range
+        stop = ...
+        if 0 <= values.stop < _MAXORDINAL * 86400000000:
+            stop = self._datetime(values.stop, [None, 0, None])
+        return f"{self.__class__.__name__}({self.start!r}, {stop!r}, {self.step!r})"
+
+
+class Aggregate:
+    """Statistics of the values that fell into one bucket of a Resampler:
+    ``count``, ``sum``, ``min``, ``max``, and ``first`` and ``last``, the values
+    with the earliest and latest datetimes (by arrival among equal ones).
+
+    """
+
+    __slots__ = (
+        "_start",
+        "_step",
+        "_tzinfo",
+        "_first_us",
+        "_last_us",
+        "count",
+        "sum",
+        "min",
+        "max",
+        "first",
+        "last",
+    )
+
+    @classmethod
+    def _create(
+        cls, start: int, step: int, tz: Optional["tzinfo"], key: int, value: Any
+    ) -> "Aggregate":
+        self = object.__new__(cls)
+        self._start = start
+        self._step = step
+        self._tzinfo = tz
+        self._first_us = self._last_us = key
+        self.count = 1
+        self.sum = self.min = self.max = self.first = self.last = value
+        return self
+
+    def _add(self, key: int, value: Any) -> None:
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        elif value > self.max:
+            self.max = value
+        if key < self._first_us:
+            self._first_us = key
+            self.first = value
+        if key >= self._last_us:
+            self._last_us = key
+            self.last = value
+
+    @property
+    def start(self) -> "datetime":
+        "The first datetime of the bucket."
+        return datetime._fromwall(self._start, self._tzinfo, [None, 0, None])
+
+    @property
+    def end(self) -> "datetime":
+        "The datetime the bucket ends before, the start of the next one."
+        return datetime._fromwall(self._start + self._step, self._tzinfo, [None, 0, None])
+
+    @property
+    def mean(self) -> float:
+        "The average of the values."
+        return self.sum / self.count
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(start={self.start!r}, count={self.count!r}, "
+            f"sum={self.sum!r}, min={self.min!r}, max={self.max!r}, "
+            f"first={self.first!r}, last={self.last!r})"
+        )
+
+
+class Resampler:
+    """Streaming aggregation of (datetime, value) pairs into buckets of a
+    fixed length, laid out as datetime.floor() does. Only the buckets still
+    open are kept, each as one Aggregate, keyed by integer bucket number.
+
+    A bucket closes once a datetime at least lateness past its end has been
+    seen; pairs arriving later than that for a closed bucket are dropped and
+    counted in dropped. Datetimes are bucketed by their wall clock time, so a
+    stream should share one tzinfo.
+
+    :param timedelta delta: The positive bucket length.
+    :param datetime origin: A bucket boundary, default 1970-01-01 00:00.
+    :param timedelta lateness: How long out of order pairs are waited for.
+    """
+
+    __slots__ = ("_step", "_base", "_lateness", "_open", "_watermark", "_closed", "_dropped")
+
+    def __init__(
+        self,
+        delta: "timedelta",
+        origin: Optional["datetime"] = None,
+        lateness: "timedelta" = timedelta(0),
+    ):
+        self._step, self._base = _bucket_args(delta, origin)
+        if not isinstance(lateness, timedelta):
+            raise TypeError("lateness must be a timedelta")
+        self._lateness = lateness._to_microseconds()
+        if self._lateness < 0:
+            raise ValueError("lateness must not be negative")
+        self._open = {}
+        self._watermark = None
+        self._closed = None
+        self._dropped = 0
+
+    @property
+    def dropped(self) -> int:
+        "Number of pairs that arrived after their bucket had closed."
+        return self._dropped
+
+    def __len__(self) -> int:
+        "Number of buckets still open."
+        return len(self._open)
+
+    def add(self, dt: "datetime", value: Any) -> List["Aggregate"]:
+        """Add one pair and return the buckets it closed, oldest first, usually
+        none.
+
+        """
+        if not isinstance(dt, datetime):
+            raise TypeError(f"expected datetime, not {type(dt).__name__}")
+        key = dt._wall_us()
+        bucket = (key - self._base) // self._step
+        closed = self._closed
+        if closed is not None and bucket <= closed:
+            self._dropped += 1
+            return []
+        aggregate = self._open.get(bucket)
+        if aggregate is None:
+            start = self._base + bucket * self._step
+            self._open[bucket] = Aggregate._create(start, self._step, dt._tzinfo, key, value)
+        else:
+            aggregate._add(key, value)
+        if self._watermark is not None and key <= self._watermark:
+            return []
+        self._watermark = key
+        # The last bucket that ends at least lateness before the watermark
+        limit = (key - self._lateness - self._base) // self._step - 1
+        if closed is not None and limit <= closed:
+            return []
+        return self._close(limit)
+
+    def feed(self, pairs: Iterable[Tuple["datetime", Any]]) -> Iterator["Aggregate"]:
+        "Add each (datetime, value) pair of an iterable, yielding buckets as they close."
+        for dt, value in pairs:
+            yield from self.add(dt, value)
+
+    def flush(self) -> List["Aggregate"]:
+        """Close and return every open bucket, oldest first, as at the end of a
+        stream. Pairs for these buckets arriving afterwards are dropped.
+
+        """
+        if not self._open:
+            return []
+        return self._close(max(self._open))
+
+    def _close(self, limit: int) -> List["Aggregate"]:
+        self._closed = limit
+        ready = sorted(bucket for bucket in self._open if bucket <= limit)
+        return [self._open.pop(bucket) for bucket in ready]
+
+
+# Cron schedules. Each field compiles to a bitset of allowed values, from
+# which lookup tables give the next or previous allowed value directly.
+_CRON_NONE = const(255)
+_CRON_MACROS = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+_CRON_MONTHS = {name.upper(): i for i, name in enumerate(_MONTHNAMES) if name}
+_CRON_DAYS = {name.upper(): i % 7 for i, name in enumerate(_DAYNAMES) if name}
+
+
+def _cron_value(text: str, names: Optional[dict], field: str) -> int:
+    if names and text.upper() in names:
+        return names[text.upper()]
+    try:
+        return int(text)
+    except ValueError:
+        raise ValueError(f"bad cron field {field!r}") from None
+
+
+def _cron_field(field: str, lo: int, hi: int, names: Optional[dict] = None) -> int:
+    "One comma separated cron field -> bitset of the values it allows."
+    bits = 0
+    for item in field.split(","):
+        base, slash, step = item.partition("/")
+        first, dash, last = base.partition("-")
+        step = _cron_value(step, None, field) if slash else 1
+        if base == "*":
+            first, last = lo, hi
+        else:
+            first = _cron_value(first, names, field)
+            last = _cron_value(last, names, field) if dash else hi if slash else first
+        if step < 1 or not lo <= first <= last <= hi:
+            raise ValueError(f"bad cron field {field!r}")
+        for value in range(first, last + 1, step):
+            bits |= 1 << value
+    return bits
+
+
+def _cron_table(bits: int, size: int, forward: bool) -> bytearray:
+    """Table of the next (forward) or previous allowed value at or past each
+    index 0..size - 1, _CRON_NONE where there is none.
+
+    """
+    table = bytearray(size)
+    found = _CRON_NONE
+    for i in range(size - 1, -1, -1) if forward else range(size):
+        if (bits >> i) & 1:
+            found = i
+        table[i] = found
+    return table
+
+
+class CronSchedule:
+    """A schedule in the five field cron syntax: minute, hour, day of month,
+    month and day of week. Fields take ``*``, values, ``a-b`` ranges, ``/n``
+    steps and comma separated lists, plus month and day names such as
+    ``JAN`` or ``MON``. Sunday is day 0 or 7. The ``@hourly``, ``@daily``,
+    ``@midnight``, ``@weekly``, ``@monthly``, ``@yearly`` and ``@annually``
+    shorthands are understood too.
+
+    As in Vixie cron, when both the day of month and the day of week are
+    restricted (do not start with ``*``), a day matching either one fires.
+
+    Fire times are wall clock times in the tzinfo of the datetime searched
+    from, and carry that tzinfo.
+
+    :param str expression: The cron expression.
+    """
+
+    __slots__ = (
+        "_expression",
+        "_minutes",
+        "_hours",
+        "_days",
+        "_months",
+        "_either",
+        "_weekdays",
+        "_next",
+        "_prev",
+    )
+
+    def __init__(self, expression: str):
+        fields = _CRON_MACROS.get(expression.strip().lower(), expression).split()
+        if len(fields) != 5:
+            raise ValueError(f"cron expression needs 5 fields: {expression!r}")
+        self._expression = expression
+        self._minutes = _cron_field(fields[0], 0, 59)
+        self._hours = _cron_field(fields[1], 0, 23)
+        days = _cron_field(fields[2], 1, 31)
+        self._months = _cron_field(fields[3], 1, 12, _CRON_MONTHS)
+        weekdays = _cron_field(fields[4], 0, 7, _CRON_DAYS)
+        if weekdays & 0x80:
+            weekdays = (weekdays | 1) & 0x7F
+        day_star = fields[2][0] == "*"
+        weekday_star = fields[4][0] == "*"
+        self._either = not day_star and not weekday_star
+        if weekday_star and not self._either:
+            # Only the day of month restricts: it must exist in some month.
+            if not any(
+                days & ((2 << _DAYS_IN_MONTH[m] + (m == 2)) - 2)
+                for m in range(1, 13)
+                if (self._months >> m) & 1
+            ):
+                raise ValueError(f"cron expression never fires: {expression!r}")
+        # Day bitsets of the days matching the schedule in a month starting
+        # on each weekday, Sunday first.
+        self._weekdays = []
+        for first in range(7):
+            by_weekday = 0
+            for day in range(1, 32):
+                if (weekdays >> ((first + day - 1) % 7)) & 1:
+                    by_weekday |= 1 << day
+            self._weekdays.append(days | by_weekday if self._either else days & by_weekday)
+        self._days = days
+        self._next = (
+            _cron_table(self._minutes, 61, True),
+            _cron_table(self._hours, 25, True),
+            _cron_table(self._months, 14, True),
+        )
+        self._prev = (
+            _cron_table(self._minutes, 60, False),
+            _cron_table(self._hours, 24, False),
+            _cron_table(self._months, 13, False),
+        )
+
+    @property
+    def expression(self) -> str:
+        "The expression the schedule was compiled from."
+        return self._expression
+
+    def _day_mask(self, year: int, month: int) -> int:
+        "Bitset of the days of month firing in the given month."
+        return self._weekdays[_ymd2ord(year, month, 1) % 7]
+
+    def matches(self, dt: "datetime") -> bool:
+        "Whether the schedule fires in the minute of dt."
+        return bool(
+            (self._minutes >> dt.minute) & 1
+            and (self._hours >> dt.hour) & 1
+            and (self._months >> dt.month) & 1
+            and (self._day_mask(dt.year, dt.month) >> dt.day) & 1
+        )
+
+    def next_after(self, dt: "datetime") -> Optional["datetime"]:
+        """Return the first fire time after dt, or None if there is none
+        before the end of year MAXYEAR.
+
+        """
+        if not isinstance(dt, datetime):
+            raise TypeError(f"expected datetime, not {type(dt).__name__}")
+        next_minute, next_hour, next_month = self._next
+        y, mo, d, h, mi = dt._year, dt._month, dt._day, dt._hour, dt._minute + 1
+        mask = mask_month = 0
+        while y <= MAXYEAR:
+            m = next_month[mo]
+            if m == _CRON_NONE:
+                y, mo, d, h, mi = y + 1, 1, 1, 0, 0
+                continue
+            if m != mo:
+                mo, d, h, mi = m, 1, 0, 0
+            dim = _days_in_month(y, mo)
+            if mask_month != y * 16 + mo:
+                mask_month = y * 16 + mo
+                mask = self._day_mask(y, mo)
+            if not (mask >> d) & 1:
+                d += 1
+                while d <= dim and not (mask >> d) & 1:
+                    d += 1
+                h = mi = 0
+            if d > dim:
+                mo, d, h, mi = mo + 1, 1, 0, 0
+                continue
+            hour = next_hour[h]
+            if hour == _CRON_NONE:
+                d, h, mi = d + 1, 0, 0
+                continue
+            if hour != h:
+                h, mi = hour, 0
+            minute = next_minute[mi]
+            if minute == _CRON_NONE:
+                h, mi = h + 1, 0
+                continue
+            return datetime._create(y, mo, d, h, minute, 0, 0, dt._tzinfo)
+        return None
+
+    def prev_before(self, dt: "datetime") -> Optional["datetime"]:
+        """Return the last fire time before dt, or None if there is none
+        after the start of year MINYEAR.
+
+        """
+        if not isinstance(dt, datetime):
+            raise TypeError(f"expected datetime, not {type(dt).__name__}")
+        prev_minute, prev_hour, prev_month = self._prev
+        y, mo, d, h, mi = dt._year, dt._month, dt._day, dt._hour, dt._minute
+        if not dt._second and not dt._microsecond:
+            mi -= 1
+        mask = mask_month = 0
+        while y >= MINYEAR:
+            m = prev_month[mo]
+            if m == _CRON_NONE:
+                y, mo, d, h, mi = y - 1, 12, 31, 23, 59
+                continue
+            if m != mo:
+                mo, d, h, mi = m, 31, 23, 59
+            dim = _days_in_month(y, mo)
+            if d > dim:
+                d, h, mi = dim, 23, 59
+            if mask_month != y * 16 + mo:
+                mask_month = y * 16 + mo
+                mask = self._day_mask(y, mo)
+            if d and not (mask >> d) & 1:
+                d -= 1
+                while d and not (mask >> d) & 1:
+                    d -= 1
+                h, mi = 23, 59
+            if not d:
+                mo, d, h, mi = mo - 1, 31, 23, 59
+                continue
+            hour = prev_hour[h] if h >= 0 else _CRON_NONE
+            if hour == _CRON_NONE:
+                d, h, mi = d - 1, 23, 59
+                continue
+            if hour != h:
+                h, mi = hour, 59
+            minute = prev_minute[mi] if mi >= 0 else _CRON_NONE
+            if minute == _CRON_NONE:
+                h, mi = h - 1, 59
+                continue
+            return datetime._create(y, mo, d, h, minute, 0, 0, dt._tzinfo)
+        return None
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, CronSchedule):
+            return (self._minutes, self._hours, self._months, self._weekdays) == (
+                other._minutes,
+                other._hours,
+                other._months,
+                other._weekdays,
+            )
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self._minutes, self._hours, self._months, tuple(self._weekdays)))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._expression!r})"
+
+
+# NumPy interoperability. NumPy is imported on first use only, as it is not
+# available on microcontrollers.
+def _numpy() -> Any:
+    import numpy  # noqa: PLC0415
+
+    return numpy
+
+
+def _datetime64_us(values: Any) -> Any:
+    "Any datetime64 array -> new contiguous int64 array of microseconds since the epoch."
+    np = _numpy()
+    values = np.asarray(values)
+    if values.dtype.kind != "M":
+        raise TypeError(f"expected a datetime64 array, not {values.dtype}")
+    us = np.ascontiguousarray(values.astype("datetime64[us]")).view("int64")
+    if us.size and (us.min() < -_EPOCH_US or us.max() >= _MAX_US):
+        raise OverflowError("date value out of range")
+    return us
+
+
+def _ord2ymd_numpy(np: Any, n: Any) -> Tuple[Any, Any, Any]:
+    "Array of ordinals -> arrays of (year, month, day), as _ord2ymd() does."
+    # A new array: callers keep using the ordinals they pass in.
+    n = n - 1  # noqa: PLR6104
+    n400, n = np.divmod(n, _DI400Y)
+    n100, n = np.divmod(n, _DI100Y)
+    n4, n = np.divmod(n, _DI4Y)
+    n1, n = np.divmod(n, 365)
+    year = n400 * 400 + n100 * 100 + n4 * 4 + n1 + 1
+    # December 31 at the end of a 4 or 400 year cycle
+    last = (n1 == 4) | (n100 == 4)
+    year -= last
+    leap = ((n1 == 3) & ((n4 != 24) | (n100 == 3))) | last
+    n = np.where(last, 365, n)
+    month = (n + 50) >> 5
+    before = np.array(_DAYS_BEFORE_MONTH[1:] + (365,), dtype="int64")
+    preceding = before[month - 1] + ((month > 2) & leap)
+    over = preceding > n
+    month -= over
+    preceding = np.where(over, before[month - 1] + ((month > 2) & leap), preceding)
+    return year, month, n - preceding + 1
+
+
+def to_datetime64(values: Union[Iterable["datetime"], "DatetimeArray"]) -> Any:
+    """Convert datetimes to a NumPy datetime64[us] array. Aware datetimes are
+    converted to UTC; naive ones keep their wall clock time.
+
+    :param values: A DatetimeArray, or an iterable of datetimes that are
+        either all naive or all aware.
+    """
+    if isinstance(values, DatetimeArray):
+        return values.to_datetime64()
+    us = []
+    aware = None
+    for dt in values:
+        if not isinstance(dt, datetime):
+            raise TypeError(f"expected datetime, not {type(dt).__name__}")
+        offset = dt._utcoffset_us()
+        if aware is None:
+            aware = offset is not None
+        elif aware != (offset is not None):
+            raise TypeError("cannot mix naive and timezone-aware time")
+        us.append((dt._wall_us() if offset is None else dt.sort_key()) - _EPOCH_US)
+    return _numpy().array(us, dtype="int64").view("datetime64[us]")
+
+
+def from_datetime64(values: Any, tz: Optional["tzinfo"] = None) -> List["datetime"]:
+    """Convert a NumPy datetime64 array to a list of datetimes, naive unless
+    tz is given, in which case the values are taken as UTC and converted to
+    tz. The calendar fields are computed for the whole array at once.
+
+    """
+    _check_tzinfo_arg(tz)
+    np = _numpy()
+    us = _datetime64_us(values).ravel()
+    fixed = tz.__class__ is timezone
+    if fixed:
+        us += tz._offset._to_microseconds()
+    days, us = np.divmod(us, 86400000000)
+    ordinal = days + _EPOCH_ORDINAL
+    if ordinal.size and (ordinal.min() < 1 or ordinal.max() > _MAXORDINAL):
+        raise OverflowError("date value out of range")
+    year, month, day = _ord2ymd_numpy(np, ordinal)
+    seconds, us = np.divmod(us, 1000000)
+    hour, seconds = np.divmod(seconds, 3600)
+    minute, second = np.divmod(seconds, 60)
+    result = []
+    create = datetime._create
+    columns = (year, month, day, hour, minute, second, us, ordinal)
+    for y, m, d, hh, mm, ss, ff, n in zip(*(column.tolist() for column in columns)):
+        dt = create(y, m, d, hh, mm, ss, ff, tz)
+        dt._ordinal = n
+        result.append(dt)
+    if tz is not None and not fixed:
+        return [tz.fromutc(dt) for dt in result]
+    return result
+
+
+def to_timedelta64(values: Iterable["timedelta"]) -> Any:
+    "Convert an iterable of timedeltas to a NumPy timedelta64[us] array."
+    us = []
+    for delta in values:
+        if not isinstance(delta, timedelta):
+            raise TypeError(f"expected timedelta, not {type(delta).__name__}")
+        us.append(delta._to_microseconds())
+    return _numpy().array(us, dtype="int64").view("timedelta64[us]")
+
+
+def from_timedelta64(values: Any) -> List["timedelta"]:
+    "Convert a NumPy timedelta64 array to a list of timedeltas."
+    np = _numpy()
+    values = np.asarray(values)
+    if values.dtype.kind != "m":
+        raise TypeError(f"expected a timedelta64 array, not {values.dtype}")
+    us = np.ascontiguousarray(values.astype("timedelta64[us]")).view("int64").ravel()
+    days, us = np.divmod(us, 86400000000)
+    seconds, us = np.divmod(us, 1000000)
+    create = timedelta._create
+    return [create(d, s, f) for d, s, f in zip(days.tolist(), seconds.tolist(), us.tolist())]
+
 
 # Module exports
 timezone.utc = timezone._create(timedelta(0))
 timezone.min = timezone._create(timezone.minoffset)
 timezone.max = timezone._create(timezone.maxoffset)
 _EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_EPOCH_US = _EPOCH.sort_key()
+_MAX_US = _MAXORDINAL * 86400 * 1000000 - _EPOCH_US
 _date_class = date
+_tzinfo_class = tzinfo
 _time_class = time
@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Cron next-fire benchmark: chains CronSchedule.next_after over a year of fires
+# for several schedules, against stepping minute by minute until a match.
+import time
+
+from adafruit_datetime import CronSchedule, datetime, timedelta
+
+SCHEDULES = (
+    "*/5 * * * *",
+    "30 9-17 * * mon-fri",
+    "@daily",
+    "0 12 13 * 5",
+    "0 0 29 2 *",
+)
+START = datetime(2026, 1, 1)
+END = datetime(2027, 1, 1)
+STEPPED = 50
+MINUTE = timedelta(minutes=1)
+
+
+def by_stepping(schedule, dt):
+    dt = dt.replace(second=0, microsecond=0) + MINUTE
+    while not schedule.matches(dt):
+        dt += MINUTE
+    return dt
+
+
+for expression in SCHEDULES:
+    schedule = CronSchedule(expression)
+    calls = 0
+    dt = START
+    start = time.monotonic_ns()
+    while dt < END:
+        dt = schedule.next_after(dt)
+        calls += 1
+    elapsed = time.monotonic_ns() - start
+    print(f"{expression:>20}: {calls:6} calls, {elapsed / calls / 1000:8.2f} us per next_after")
+
+    # Stepping a minute at a time is only bearable for schedules firing often.
+    first = schedule.next_after(START)
+    if first - START > timedelta(days=1):
+        continue
+    dt = START
+    start = time.monotonic_ns()
+    for _ in range(STEPPED):
+        dt = by_stepping(schedule, dt)
+    elapsed = time.monotonic_ns() - start
+    expected = START
+    for _ in range(STEPPED):
+        expected = schedule.next_after(expected)
+    assert dt == expected
+    print(
+        f"{'minute stepping':>20}: {STEPPED:6} fires, {elapsed / STEPPED / 1000:8.2f} us per fire"
+    )
@@ -0,0 +1,101 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Compare the single-pass ISO 8601 scanner used by fromisoformat() and
+# fromisoformat_many() against the regex based parser it replaced.
+import re
+import time
+
+from adafruit_datetime import datetime, timedelta, timezone
+
+SAMPLES = (
+    "2021-03-04",
+    "2021-03-04T05:06:07",
+    "2021-03-04T05:06:07.123456",
+    "2021-03-04T05:06:07.123456+02:00",
+    "2021-03-04T05:06:07Z",
+)
+ROUNDS = 2000
+
+_TIME_SEGMENTS = (
+    r"([0-9][0-9])",
+    r":([0-9][0-9])",
+    r":([0-9][0-9])",
+    r"\.([0-9][0-9][0-9])",
+    r"([0-9][0-9][0-9])",
+)
+_OFFSET_SEGMENTS = (r"([\-\+][0-9][0-9]):([0-9][0-9])",)
+
+
+def _segments(string, segments):
+    results = []
+    for regex in segments:
+        match = re.match(regex, string)
+        if match:
+            for grp in range(regex.count("(")):
+                results.append(int(match.group(grp + 1)))
+            string = string[len(match.group(0)) :]
+        elif string:
+            raise ValueError()
+    if string:
+        raise ValueError()
+    return results
+
+
+def regex_fromisoformat(string):
+    """The previous implementation: several re.match calls and slices per string."""
+    match = re.match(r"([0-9][0-9][0-9][0-9])-([0-9][0-9])-([0-9][0-9])$", string[:10])
+    y, m, d = int(match.group(1)), int(match.group(2)), int(match.group(3))
+    if len(string) <= 10:
+        return datetime(y, m, d)
+    time_string = string[11:]
+    if time_string[-1] == "Z":
+        time_string = time_string[:-1] + "+00:00"
+    offset_string = None
+    match = re.match(r"(.*)[\-\+]", time_string)
+    if match:
+        offset_string = time_string[len(match.group(1)) :]
+        time_string = match.group(1)
+    fields = _segments(time_string, _TIME_SEGMENTS)
+    fields += [0] * (5 - len(fields))
+    tz = None
+    if offset_string:
+        hh, mm = _segments(offset_string, _OFFSET_SEGMENTS)
+        mm = -mm if hh < 0 else mm
+        tz = timezone(timedelta(hours=hh, minutes=mm), name="utcoffset")
+    us = fields[3] * 1000 + fields[4]
+    return datetime(y, m, d, fields[0], fields[1], fields[2], us, tz)
+
+
+def bench(label, parse):
+    start = time.monotonic_ns()
+    for _ in range(ROUNDS):
+        for sample in SAMPLES:
+            parse(sample)
+    elapsed = time.monotonic_ns() - start
+    per_call = elapsed / (ROUNDS * len(SAMPLES)) / 1000
+    print(f"{label:>12}: {per_call:.2f} us per string")
+    return per_call
+
+
+for sample in SAMPLES:
+    assert regex_fromisoformat(sample) == datetime.fromisoformat(sample), sample
+
+
+def bench_many(label, parse_many):
+    start = time.monotonic_ns()
+    for _ in range(ROUNDS):
+        for _ in parse_many(SAMPLES):
+            pass
+    elapsed = time.monotonic_ns() - start
+    per_call = elapsed / (ROUNDS * len(SAMPLES)) / 1000
+    print(f"{label:>12}: {per_call:.2f} us per string")
+    return per_call
+
+
+assert list(datetime.fromisoformat_many(SAMPLES)) == [datetime.fromisoformat(s) for s in SAMPLES]
+
+old = bench("regex", regex_fromisoformat)
+new = bench("scanner", datetime.fromisoformat)
+many = bench_many("batch", datetime.fromisoformat_many)
+print(f"speedup: {old / new:.2f}x, batch {old / many:.2f}x")
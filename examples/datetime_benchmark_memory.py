@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Memory footprint of the slotted date/time classes. Subclasses without
+# __slots__ get a per-instance __dict__ again, which is how every instance
+# was laid out before, so they serve as the baseline.
+import gc
+
+from adafruit_datetime import DatetimeArray, date, datetime, time, timedelta
+
+try:
+    import sys
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+COUNT = 2000
+
+
+class DictTimedelta(timedelta):
+    pass
+
+
+class DictDate(date):
+    pass
+
+
+class DictTime(time):
+    pass
+
+
+class DictDatetime(datetime):
+    pass
+
+
+CASES = (
+    ("timedelta", timedelta, DictTimedelta, (1, 2, 3)),
+    ("date", date, DictDate, (2021, 3, 4)),
+    ("time", time, DictTime, (5, 6, 7, 8)),
+    ("datetime", datetime, DictDatetime, (2021, 3, 4, 5, 6, 7, 8)),
+)
+
+
+def measure(build):
+    """Bytes allocated per element while the result of build() is alive."""
+    gc.collect()
+    if tracemalloc is not None:
+        tracemalloc.start()
+        items = build()
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+    else:
+        free = gc.mem_free()
+        items = build()
+        used = free - gc.mem_free()
+    del items
+    return used / COUNT
+
+
+def footprint(cls, args):
+    """Bytes allocated per instance while COUNT instances are alive."""
+    return measure(lambda: [cls(*args) for _ in range(COUNT)])
+
+
+for name, slotted, with_dict, args in CASES:
+    new = footprint(slotted, args)
+    old = footprint(with_dict, args)
+    line = f"{name:>10}: {new:6.1f} bytes vs {old:6.1f} bytes with __dict__"
+    if tracemalloc is not None:
+        size = sys.getsizeof(slotted(*args))
+        line += f", getsizeof {size} vs {sys.getsizeof(with_dict(*args))} plus the dict"
+    print(line)
+
+# A list of datetimes against the same values held by a DatetimeArray,
+# counting the list itself. The array is filled from a generator so that no
+# datetime outlives its conversion.
+step = timedelta(seconds=1)
+start = datetime(2021, 3, 4)
+as_list = measure(lambda: [start + step * i for i in range(COUNT)])
+as_array = measure(lambda: DatetimeArray(start + step * i for i in range(COUNT)))
+print(f"{'series':>10}: {as_array:6.1f} bytes in a DatetimeArray vs {as_list:6.1f} in a list")
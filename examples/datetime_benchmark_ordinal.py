@@ -0,0 +1,36 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Ordinal conversion benchmark, with and without the year start table.
+# Lower COUNT on boards that cannot hold a million ordinals.
+import time
+
+import adafruit_datetime
+from adafruit_datetime import date
+
+COUNT = 1000000
+
+ordinals = []
+seed = 2026
+for _ in range(COUNT):
+    seed = (seed * 1103515245 + 12345) & 0x7FFFFFFF
+    ordinals.append(1 + seed % 3652059)
+
+
+def bench(label, operation, items):
+    start = time.monotonic_ns()
+    for item in items:
+        operation(item)
+    elapsed = time.monotonic_ns() - start
+    print(f"{label:>24}: {elapsed / len(items) / 1000:.3f} us")
+
+
+for enabled in (False, True):
+    adafruit_datetime.use_ordinal_table(enabled)
+    mode = "table" if enabled else "arithmetic"
+    dates = [date.fromordinal(n) for n in ordinals]
+    bench(f"fromordinal ({mode})", date.fromordinal, ordinals)
+    bench(f"toordinal ({mode})", date.toordinal, dates)
+    bench(f"weekday ({mode})", date.weekday, dates)
+    del dates
+adafruit_datetime.use_ordinal_table(False)
@@ -0,0 +1,36 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Pickle payload size and throughput for a batch of datetimes, as sent
+# through multiprocessing queues. Runs on CPython (Blinka), which has pickle.
+import pickle
+import time
+
+from adafruit_datetime import DatetimeArray, datetime, timedelta, timezone
+
+COUNT = 10000
+ROUNDS = 5
+
+tz = timezone(timedelta(hours=1))
+start = datetime(2021, 3, 4, 5, 6, 7, 8, tz)
+step = timedelta(seconds=1, microseconds=250)
+values = [start + step * i for i in range(COUNT)]
+
+CASES = (
+    ("datetime list", values),
+    ("field tuples", [(*dt.timetuple()[:6], dt.microsecond) for dt in values]),
+    ("isoformat strings", [dt.isoformat() for dt in values]),
+    ("DatetimeArray", DatetimeArray(values, tz)),
+)
+
+for label, batch in CASES:
+    payload = pickle.dumps(batch, pickle.HIGHEST_PROTOCOL)
+    begin = time.monotonic_ns()
+    for _ in range(ROUNDS):
+        pickle.loads(pickle.dumps(batch, pickle.HIGHEST_PROTOCOL))
+    elapsed = (time.monotonic_ns() - begin) / ROUNDS / COUNT
+    print(f"{label:>18}: {len(payload) / COUNT:6.1f} bytes, {elapsed:7.1f} ns per element")
+
+restored = pickle.loads(pickle.dumps(values))
+assert restored == values
+assert restored[0].tzinfo == tz
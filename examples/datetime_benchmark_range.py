@@ -0,0 +1,51 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Iterating dates and datetimes with the range types versus stepping them
+# by hand: date has no timedelta arithmetic, so dates go through ordinals.
+import time
+
+from adafruit_datetime import date, date_range, datetime, datetime_range, timedelta
+
+DAYS = 20000
+STEPS = 20000
+
+
+def bench(label, make):
+    start = time.monotonic_ns()
+    items = make()
+    elapsed = time.monotonic_ns() - start
+    print(f"{label:>28}: {elapsed / len(items) / 1000:.3f} us per item")
+    return items
+
+
+def add_loop(start, stop, step):
+    items = []
+    while start < stop:
+        items.append(start)
+        start += step
+    return items
+
+
+def ordinal_loop(start, stop):
+    return [date.fromordinal(n) for n in range(start.toordinal(), stop.toordinal())]
+
+
+first = date(1990, 1, 1)
+last = date.fromordinal(first.toordinal() + DAYS)
+by_add = bench("date.fromordinal", lambda: ordinal_loop(first, last))
+by_range = bench("date_range", lambda: list(date_range(first, last)))
+assert by_add == by_range
+
+step = timedelta(minutes=5)
+begin = datetime(2021, 1, 1)
+end = begin + step * STEPS
+by_add = bench("datetime + timedelta", lambda: add_loop(begin, end, step))
+by_range = bench("datetime_range", lambda: list(datetime_range(begin, end, step)))
+assert by_add == by_range
+
+series = datetime_range(begin, end, step)
+start = time.monotonic_ns()
+for i in range(0, len(series), 97):
+    assert series[i] in series
+print(f"{'index and membership':>28}: {(time.monotonic_ns() - start) / 1000:.0f} us in total")
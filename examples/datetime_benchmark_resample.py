@@ -0,0 +1,47 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Per-minute aggregates of a stream of readings: Resampler versus a dict
+# keyed on floored datetimes.
+import time
+
+from adafruit_datetime import Resampler, datetime, timedelta, timezone
+
+COUNT = 20000
+
+tz = timezone(timedelta(hours=1))
+start = datetime(2021, 5, 1, tzinfo=tz)
+pairs = [(start + timedelta(seconds=3 * i), i % 17) for i in range(COUNT)]
+minute = timedelta(minutes=1)
+
+
+def with_dict():
+    buckets = {}
+    for dt, value in pairs:
+        key = dt.replace(second=0, microsecond=0)
+        entry = buckets.get(key)
+        if entry is None:
+            buckets[key] = [1, value, value, value]
+        else:
+            entry[0] += 1
+            entry[1] += value
+            entry[2] = min(entry[2], value)
+            entry[3] = max(entry[3], value)
+    return [(key, *buckets[key]) for key in sorted(buckets)]
+
+
+def with_resampler():
+    resampler = Resampler(minute)
+    aggregates = list(resampler.feed(pairs)) + resampler.flush()
+    return [(a.start, a.count, a.sum, a.min, a.max) for a in aggregates]
+
+
+def bench(label, run):
+    begin = time.monotonic_ns()
+    result = run()
+    elapsed = time.monotonic_ns() - begin
+    print(f"{label:>16}: {elapsed / COUNT / 1000:.3f} us per reading")
+    return result
+
+
+assert bench("dict of datetime", with_dict) == bench("Resampler", with_resampler)
@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Sorting benchmark: integer sort keys versus the previous tuple-based comparison.
+import time
+
+from adafruit_datetime import datetime, timedelta, timezone
+
+COUNT = 2000
+ZONES = (timezone.utc, timezone(timedelta(hours=2)), timezone(timedelta(hours=-5)))
+
+
+class TupleDatetime(datetime):
+    """Compares by building field tuples, as datetime used to."""
+
+    def _cmp(self, other, allow_mixed=False):
+        myoff = self.utcoffset()
+        otoff = other.utcoffset()
+        if myoff == otoff:
+            mine = (self.year, self.month, self.day, self.hour, self.minute)
+            theirs = (other.year, other.month, other.day, other.hour, other.minute)
+            mine += (self.second, self.microsecond)
+            theirs += (other.second, other.microsecond)
+            return (mine > theirs) - (mine < theirs)
+        diff = self - other
+        if diff.days < 0:
+            return -1
+        return 1 if diff else 0
+
+
+def make(cls):
+    items = []
+    seed = 12345
+    for i in range(COUNT):
+        seed = (seed * 1103515245 + 12345) & 0x7FFFFFFF
+        items.append(
+            cls(
+                2000 + seed % 30,
+                1 + seed % 12,
+                1 + seed % 28,
+                seed % 24,
+                seed % 60,
+                seed % 59,
+                seed % 1000000,
+                tzinfo=ZONES[i % len(ZONES)],
+            )
+        )
+    return items
+
+
+def bench(label, items, **kwargs):
+    start = time.monotonic_ns()
+    ordered = sorted(items, **kwargs)
+    elapsed = time.monotonic_ns() - start
+    print(f"{label:>22}: {elapsed / 1000000:.1f} ms")
+    return ordered
+
+
+by_tuple = bench("tuple comparison", make(TupleDatetime))
+by_compare = bench("integer comparison", make(datetime))
+by_key = bench("key=datetime.sort_key", make(datetime), key=datetime.sort_key)
+assert [d.isoformat() for d in by_tuple] == [d.isoformat() for d in by_compare]
+assert by_compare == by_key
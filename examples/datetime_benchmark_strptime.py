@@ -0,0 +1,32 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Per-call cost of datetime.strptime() when the same format is used for every
+# row, as in CSV ingestion, versus recompiling the format on each call.
+import time
+
+import adafruit_datetime
+from adafruit_datetime import datetime
+
+ROWS = ("2021-03-04 05:06:07.123", "2021-03-04 05:06:08.456", "2021-03-05 23:59:59.999")
+FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+ROUNDS = 3000
+
+
+def bench(label, before_call=None):
+    start = time.monotonic_ns()
+    for _ in range(ROUNDS):
+        for row in ROWS:
+            if before_call is not None:
+                before_call()
+            datetime.strptime(row, FORMAT)
+    elapsed = time.monotonic_ns() - start
+    per_call = elapsed / (ROUNDS * len(ROWS)) / 1000
+    print(f"{label:>10}: {per_call:.2f} us per row")
+    return per_call
+
+
+# pylint: disable=protected-access
+uncached = bench("uncached", adafruit_datetime._STRPTIME_CACHE.clear)
+cached = bench("cached")
+print(f"plan cache saves {uncached - cached:.2f} us per row ({uncached / cached:.2f}x)")
@@ -0,0 +1,26 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Microbenchmark of timedelta arithmetic and plain int construction.
+import time
+
+from adafruit_datetime import timedelta
+
+ROUNDS = 20000
+a = timedelta(1, 3600, 250000)
+b = timedelta(0, 59, 999999)
+
+CASES = (
+    ("a + b", lambda: a + b),
+    ("a - b", lambda: a - b),
+    ("-a", lambda: -a),
+    ("timedelta(ints)", lambda: timedelta(days=1, hours=2, minutes=3)),
+    ("timedelta(float)", lambda: timedelta(hours=1.5)),
+)
+
+for label, operation in CASES:
+    start = time.monotonic_ns()
+    for _ in range(ROUNDS):
+        operation()
+    elapsed = time.monotonic_ns() - start
+    print(f"{label:>16}: {elapsed / ROUNDS / 1000:.2f} us")
@@ -0,0 +1,169 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+# pylint:disable=invalid-name, wrong-import-position, protected-access
+import sys
+import unittest
+from datetime import datetime as cpy_datetime
+from datetime import timedelta as cpy_timedelta
+
+# CircuitPython subset implementation
+sys.path.append("..")
+from adafruit_datetime import CronSchedule, datetime, timedelta, timezone
+
+MINUTE = cpy_timedelta(minutes=1)
+
+
+def cron_matches(fields, dt):
+    """Reference matcher over explicit value sets, as in Vixie cron."""
+    minutes, hours, days, months, weekdays, either = fields
+    weekday = dt.isoweekday() % 7
+    if either:
+        day_ok = dt.day in days or weekday in weekdays
+    else:
+        day_ok = dt.day in days and weekday in weekdays
+    return dt.minute in minutes and dt.hour in hours and dt.month in months and day_ok
+
+
+def brute_next(fields, dt, limit):
+    dt = dt.replace(second=0, microsecond=0) + MINUTE
+    for _ in range(limit):
+        if cron_matches(fields, dt):
+            return dt
+        dt += MINUTE
+    return None
+
+
+def brute_prev(fields, dt, limit):
+    floor = dt.replace(second=0, microsecond=0)
+    dt = floor if floor != dt else floor - MINUTE
+    for _ in range(limit):
+        if cron_matches(fields, dt):
+            return dt
+        dt -= MINUTE
+    return None
+
+
+def to_cpy(dt):
+    return cpy_datetime(dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second, dt.microsecond)
+
+
+ALL_DAYS = set(range(1, 32))
+ALL_WEEKDAYS = set(range(7))
+CASES = (
+    ("*/7 * * * *", (set(range(0, 60, 7)), set(range(24)), ALL_DAYS, set(range(1, 13)))),
+    ("30 9-17/4 * * MON-FRI", ({30}, {9, 13, 17}, ALL_DAYS, set(range(1, 13)))),
+    ("0 12 13 * 5", ({0}, {12}, {13}, set(range(1, 13)))),
+    ("15,45 3 */10 feb,aug *", ({15, 45}, {3}, {1, 11, 21, 31}, {2, 8})),
+    ("5 4 31 * *", ({5}, {4}, {31}, set(range(1, 13)))),
+    ("59 23 28-31 * *", ({59}, {23}, set(range(28, 32)), set(range(1, 13)))),
+    ("0 0 * * 7", ({0}, {0}, ALL_DAYS, set(range(1, 13)))),
+)
+WEEKDAYS = {
+    "*/7 * * * *": ALL_WEEKDAYS,
+    "30 9-17/4 * * MON-FRI": {1, 2, 3, 4, 5},
+    "0 12 13 * 5": {5},
+    "15,45 3 */10 feb,aug *": ALL_WEEKDAYS,
+    "5 4 31 * *": ALL_WEEKDAYS,
+    "59 23 28-31 * *": ALL_WEEKDAYS,
+    "0 0 * * 7": {0},
+}
+
+
+class TestCronSchedule(unittest.TestCase):
+    def reference(self, expression, values):
+        either = expression.split()[2][0] != "*" and expression.split()[4][0] != "*"
+        return values + (WEEKDAYS[expression], either)
+
+    def test_against_minute_stepping(self):
+        starts = [
+            cpy_datetime(2023, 12, 31, 23, 59, 30),
+            cpy_datetime(2024, 2, 28, 4, 5),
+            cpy_datetime(2024, 7, 15, 12, 0, 0, 1),
+            cpy_datetime(2025, 1, 31, 0, 0),
+        ]
+        for expression, values in CASES:
+            schedule = CronSchedule(expression)
+            fields = self.reference(expression, values)
+            for start in starts:
+                ours = datetime(*start.timetuple()[:6], start.microsecond)
+                with self.subTest(expression=expression, start=start):
+                    expected = brute_next(fields, start, 600000)
+                    got = schedule.next_after(ours)
+                    self.assertEqual(to_cpy(got), expected)
+                    self.assertTrue(schedule.matches(got))
+                    expected = brute_prev(fields, start, 600000)
+                    got = schedule.prev_before(ours)
+                    self.assertEqual(to_cpy(got), expected)
+
+    def test_chained_fires(self):
+        schedule = CronSchedule("0 12 13 * 5")
+        fields = self.reference("0 12 13 * 5", CASES[2][1])
+        dt, expected = datetime(2024, 1, 1), cpy_datetime(2024, 1, 1)
+        for _ in range(60):
+            dt = schedule.next_after(dt)
+            expected = brute_next(fields, expected, 20000)
+            self.assertEqual(to_cpy(dt), expected)
+        for _ in range(60):
+            dt = schedule.prev_before(dt)
+            expected = brute_prev(fields, expected, 20000)
+            self.assertEqual(to_cpy(dt), expected)
+
+    def test_leap_day(self):
+        schedule = CronSchedule("0 0 29 2 *")
+        self.assertEqual(schedule.next_after(datetime(2024, 2, 29)), datetime(2028, 2, 29))
+        self.assertEqual(schedule.prev_before(datetime(2100, 3, 1)), datetime(2096, 2, 29))
+        self.assertIsNone(schedule.next_after(datetime(9996, 2, 29)))
+        self.assertIsNone(CronSchedule("0 0 1 1 *").prev_before(datetime(1, 1, 1)))
+
+    def test_macros_and_names(self):
+        self.assertEqual(CronSchedule("@yearly"), CronSchedule("0 0 1 jan *"))
+        self.assertEqual(CronSchedule("@annually"), CronSchedule("0 0 1 1 *"))
+        self.assertEqual(CronSchedule("@monthly"), CronSchedule("0 0 1 * *"))
+        self.assertEqual(CronSchedule("@weekly"), CronSchedule("0 0 * * sun"))
+        self.assertEqual(CronSchedule("@daily"), CronSchedule("0 0 * * *"))
+        self.assertEqual(CronSchedule("@midnight"), CronSchedule("@daily"))
+        self.assertEqual(CronSchedule("@hourly"), CronSchedule("0 * * * *"))
+        self.assertEqual(CronSchedule("0 0 * * 0"), CronSchedule("0 0 * * 7"))
+        self.assertEqual(CronSchedule("1-10/3 * * * *"), CronSchedule("1,4,7,10 * * * *"))
+        self.assertEqual(CronSchedule("50/5 * * * *"), CronSchedule("50,55 * * * *"))
+        self.assertEqual(repr(CronSchedule("@daily")), "CronSchedule('@daily')")
+        self.assertEqual(CronSchedule("@daily").expression, "@daily")
+
+    def test_invalid(self):
+        for expression in (
+            "",
+            "* * * *",
+            "* * * * * *",
+            "60 * * * *",
+            "* 24 * * *",
+            "* * 0 * *",
+            "* * * 13 *",
+            "* * * * 8",
+            "*/0 * * * *",
+            "5-1 * * * *",
+            "x * * * *",
+            "* * * foo *",
+            "0 0 30 2 *",
+            "0 0 31 4,6,9,11 *",
+        ):
+            with self.subTest(expression=expression):
+                with self.assertRaises(ValueError):
+                    CronSchedule(expression)
+        # Restricting the day of week as well makes these fire on weekdays.
+        CronSchedule("0 0 30 2 mon")
+        with self.assertRaises(TypeError):
+            CronSchedule("@daily").next_after("2024-01-01")
+
+    def test_tzinfo(self):
+        tz = timezone(timedelta(hours=-5))
+        schedule = CronSchedule("30 8 * * *")
+        got = schedule.next_after(datetime(2024, 3, 9, 9, 0, tzinfo=tz))
+        self.assertEqual(got, datetime(2024, 3, 10, 8, 30, tzinfo=tz))
+        self.assertIs(got.tzinfo, tz)
+        got = schedule.prev_before(datetime(2024, 3, 9, 9, 0, tzinfo=tz))
+        self.assertEqual(got, datetime(2024, 3, 9, 8, 30, tzinfo=tz))
+        self.assertIs(got.tzinfo, tz)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,6 +10,7 @@
 # Implements a subset of https://github.com/python/cpython/blob/master/Lib/test/datetimetester.py
 # NOTE: This test is based off CPython and therefore linting is disabled within this file.
 # pylint:disable=invalid-name, no-member, wrong-import-position, undefined-variable, no-self-use, cell-var-from-loop, too-many-public-methods, fixme, import-outside-toplevel, unused-argument, too-few-public-methods
+import pickle
 import sys
 import unittest
 from datetime import MAXYEAR, MINYEAR
@@ -19,6 +20,7 @@ from datetime import date as cpython_date
 
 # CircuitPython subset implementation
 sys.path.append("..")
+import adafruit_datetime
 from adafruit_datetime import date as cpy_date
 
 # An arbitrary collection of objects of non-datetime types, for testing
@@ -56,6 +58,71 @@ class TestDate(unittest.TestCase):
         self.assertRaises(ValueError, cpy_date, 2000, 1, 0)
         self.assertRaises(ValueError, cpy_date, 2000, 1, 32)
 
+    def test_sort_key(self):
+        dates = [
+            cpy_date(2000, 12, 31),
+            cpy_date(1, 1, 1),
+            cpy_date(2001, 1, 1),
+            cpy_date(2000, 2, 29),
+        ]
+        for d in dates:
+            self.assertEqual(d.sort_key(), d.toordinal())
+        self.assertEqual(sorted(dates, key=cpy_date.sort_key), sorted(dates))
+        self.assertLess(cpy_date(2000, 2, 29), cpy_date(2000, 3, 1))
+        self.assertGreater(cpy_date(2000, 12, 1), cpy_date(2000, 11, 30))
+
+    def test_ordinal_table(self):
+        ordinals = [1, 2, 59, 60, 365, 366, 730119, 730120, 730179, 730180, 3652059]
+        expected = [cpython_date.fromordinal(n) for n in ordinals]
+        adafruit_datetime.use_ordinal_table()
+        try:
+            for n, want in zip(ordinals, expected):
+                d = cpy_date.fromordinal(n)
+                self.assertEqual((d.year, d.month, d.day), (want.year, want.month, want.day))
+                self.assertEqual(d.toordinal(), n)
+                self.assertEqual(d.weekday(), want.weekday())
+        finally:
+            adafruit_datetime.use_ordinal_table(False)
+        self.assertEqual(cpy_date.fromordinal(730120), cpy_date(2000, 1, 1))
+
+    def test_ordinal_cached(self):
+        d = cpy_date.fromordinal(730180)
+        self.assertEqual(d._ordinal, 730180)
+        e = cpy_date(2000, 2, 29)
+        self.assertEqual(e._ordinal, 0)
+        self.assertEqual((e.weekday(), e.isoweekday()), (1, 2))
+        self.assertEqual(e._ordinal, 730179)
+        self.assertEqual(hash(d), hash(cpy_date(2000, 3, 1)))
+        e._setstate(d._getstate()[0])
+        self.assertEqual(e.toordinal(), 730180)
+
+    def test_pickling(self):
+        orig = cpy_date(2000, 2, 29)
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            derived = pickle.loads(pickle.dumps(orig, proto))
+            self.assertEqual(orig, derived)
+            self.assertEqual(derived.toordinal(), 730179)
+        self.assertEqual(orig.__reduce__(), (cpy_date, (b"\x07\xd0\x02\x1d",)))
+        self.assertEqual(cpy_date(b"\x07\xd0\x02\x1d"), orig)
+
+    def test_binary_encoding(self):
+        d = cpy_date(2000, 2, 29)
+        self.assertEqual(d.to_bytes(), b"\x07\xd0\x02\x1d")
+        self.assertEqual(cpy_date.from_bytes(b"\x00" + d.to_bytes(), 1), d)
+        dates = [cpy_date(1, 1, 1), d, cpy_date(9999, 12, 31)]
+        buffer = bytearray(2 + 3 * cpy_date.packed_size)
+        self.assertEqual(cpy_date.pack_into(memoryview(buffer), 2, dates), len(buffer))
+        self.assertEqual(cpy_date.unpack_from(buffer, 2, 3), dates)
+        self.assertEqual(cpy_date.unpack_from(memoryview(buffer), 6), [d])
+        with self.assertRaises(ValueError):
+            cpy_date.unpack_from(buffer, 2, 4)
+        with self.assertRaises(ValueError):
+            cpy_date.pack_into(buffer, 3, dates)
+        with self.assertRaises(ValueError):
+            cpy_date.from_bytes(b"\x07\xd0\x0d\x01")
+        with self.assertRaises(TypeError):
+            cpy_date.pack_into(buffer, 0, [(2000, 1, 1)])
+
     def test_hash_equality(self):
         d = cpy_date(2000, 12, 31)
         e = cpy_date(2000, 12, 31)
@@ -183,7 +250,6 @@ class TestDate(unittest.TestCase):
         t = cpy_date(2002, 3, 2)
         self.assertEqual(t.ctime(), "Sat Mar  2 00:00:00 2002")
 
-    @unittest.skip("Skip for CircuitPython - strftime() not implemented for date objects.")
     def test_strftime(self):
         t = cpy_date(2005, 3, 2)
         self.assertEqual(t.strftime("m:%m d:%d y:%y"), "m:03 d:02 y:05")
@@ -237,14 +303,14 @@ class TestDate(unittest.TestCase):
         b = B(2007, 9, 10)
         self.assertEqual(format(b, ""), str(dt))
 
-        # date strftime not implemented in CircuitPython, skip
-        """for fmt in ["m:%m d:%d y:%y",
-                    "m:%m d:%d y:%y H:%H M:%M S:%S",
-                    "%z %Z",
-                    ]:
-            self.assertEqual(dt.__format__(fmt), dt.strftime(fmt))
-            self.assertEqual(a.__format__(fmt), dt.strftime(fmt))
-            self.assertEqual(b.__format__(fmt), 'B')"""
+        for fmt in [
+            "m:%m d:%d y:%y",
+            "m:%m d:%d y:%y H:%H M:%M S:%S",
+            "%z %Z",
+        ]:
+            self.assertEqual(format(dt, fmt), dt.strftime(fmt))
+            self.assertEqual(format(a, fmt), dt.strftime(fmt))
+            self.assertEqual(format(b, fmt), "B")
 
     @unittest.skip("Skip for CircuitPython - min/max/resolution not implemented for date objects.")
     def test_resolution_info(self):
@@ -403,7 +469,6 @@ class TestDate(unittest.TestCase):
         self.assertTrue(cpy_date.min)
         self.assertTrue(cpy_date.max)
 
-    @unittest.skip("Skip for CircuitPython - date strftime not implemented yet.")
     def test_strftime_y2k(self):
         for y in (1, 49, 70, 99, 100, 999, 1000, 1970):
             d = cpy_date(y, 1, 1)
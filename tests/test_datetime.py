@@ -10,6 +10,7 @@
 # Implements a subset of https://github.com/python/cpython/blob/master/Lib/test/datetimetester.py
 # NOTE: This test is based off CPython and therefore linting is disabled within this file.
 # pylint:disable=invalid-name, no-member, cell-var-from-loop, unused-argument, no-self-use, too-few-public-methods, raise-missing-from, too-many-statements, too-many-lines, undefined-variable, eval-used, import-outside-toplevel, redefined-outer-name, too-many-locals, reimported, protected-access, wrong-import-position, consider-using-enumerate, wrong-import-order, redefined-builtin, too-many-public-methods
+import pickle
 import sys
 
 # CircuitPython subset implementation
@@ -19,11 +20,14 @@ from datetime import MAXYEAR, MINYEAR
 
 # CPython standard implementation
 from datetime import datetime as cpython_datetime
+from datetime import timedelta as cpython_timedelta
+from datetime import timezone as cpython_timezone
 
 from test import support
 from test_date import TestDate
 
-from adafruit_datetime import date, time, timedelta, timezone, tzinfo
+import adafruit_datetime
+from adafruit_datetime import clear_local_offset_cache, date, time, timedelta, timezone, tzinfo
 from adafruit_datetime import datetime as cpy_datetime
 
 
@@ -221,7 +225,6 @@ class TestDateTime(TestDate):
             with self.subTest(tzi=tzi):
                 assert dt.isoformat() == exp
 
-    @unittest.skip("strftime not implemented in datetime")
     def test_format(self):
         dt = self.theclass(2007, 9, 10, 4, 5, 1, 123)
         self.assertEqual(format(dt, ""), str(dt))
@@ -491,7 +494,6 @@ class TestDateTime(TestDate):
         got = self.theclass.fromtimestamp(ts)
         self.verify_field_equality(expected, got)
 
-    @unittest.skip("gmtime not implemented in CircuitPython")
     def test_utcfromtimestamp(self):
         import time
 
@@ -504,6 +506,8 @@ class TestDateTime(TestDate):
     # March (M3.2.0) and ends 2 a.m. on first Sunday in November (M11.1.0).
     @support.run_with_tz("EST+05EDT,M3.2.0,M11.1.0")
     def test_timestamp_naive(self):
+        clear_local_offset_cache()
+        self.addCleanup(clear_local_offset_cache)
         t = self.theclass(1970, 1, 1)
         self.assertEqual(t.timestamp(), 18000.0)
         t = self.theclass(1970, 1, 1, 1, 2, 3)
@@ -526,6 +530,33 @@ class TestDateTime(TestDate):
             else:
                 self.assertEqual(self.theclass.fromtimestamp(s), t)
 
+    @support.run_with_tz("EST+05EDT,M3.2.0,M11.1.0")
+    def test_timestamp_naive_cached(self):
+        clear_local_offset_cache()
+        self.addCleanup(clear_local_offset_cache)
+        base = self.theclass(2012, 6, 1, 12)
+        expected = [(base + timedelta(minutes=17 * i)).timestamp() for i in range(60)]
+        localtime = adafruit_datetime._time.localtime
+        calls = []
+
+        def counting(*args):
+            calls.append(args)
+            return localtime(*args)
+
+        adafruit_datetime._time.localtime = counting
+        try:
+            got = [(base + timedelta(minutes=17 * i)).timestamp() for i in range(60)]
+        finally:
+            adafruit_datetime._time.localtime = localtime
+        self.assertEqual(got, expected)
+        self.assertEqual(calls, [])
+        # The ambiguous hour is never answered from a single offset interval.
+        first = self.theclass(2012, 11, 4, 1, 30)
+        second = first.replace(fold=1)
+        for _ in range(2):
+            self.assertEqual(second.timestamp() - first.timestamp(), 3600)
+            self.assertEqual(self.theclass(2012, 11, 4, 0, 30).timestamp(), 1352003400)
+
     def test_timestamp_aware(self):
         t = self.theclass(1970, 1, 1, tzinfo=timezone.utc)
         self.assertEqual(t.timestamp(), 0.0)
@@ -534,7 +565,6 @@ class TestDateTime(TestDate):
         t = self.theclass(1970, 1, 1, 1, 2, 3, 4, tzinfo=timezone(timedelta(hours=-5), "EST"))
         self.assertEqual(t.timestamp(), 18000 + 3600 + 2 * 60 + 3 + 4 * 1e-6)
 
-    @unittest.skip("Not implemented - gmtime")
     @support.run_with_tz("MSK-03")  # Something east of Greenwich
     def test_microsecond_rounding(self):
         for fts in [self.theclass.fromtimestamp, self.theclass.utcfromtimestamp]:
@@ -575,7 +605,7 @@ class TestDateTime(TestDate):
             self.assertEqual(t.second, 0)
             self.assertEqual(t.microsecond, 7812)
 
-    @unittest.skip("gmtime not implemented in CircuitPython")
+    @unittest.skip("datetime.min and datetime.max not implemented")
     def test_timestamp_limits(self):
         # minimum timestamp
         min_dt = self.theclass.min.replace(tzinfo=timezone.utc)
@@ -614,6 +644,58 @@ class TestDateTime(TestDate):
         with self.assertRaises((ValueError, OverflowError)):
             self.theclass.utcfromtimestamp(ts)
 
+    def test_fromtimestamp_arithmetic(self):
+        zones = [
+            (timezone.utc, cpython_timezone.utc),
+            (
+                timezone(timedelta(hours=5, minutes=30)),
+                cpython_timezone(cpython_timedelta(hours=5, minutes=30)),
+            ),
+            (timezone(timedelta(hours=-8)), cpython_timezone(cpython_timedelta(hours=-8))),
+        ]
+        for ts in [
+            0,
+            -1,
+            86399.5,
+            951782400,
+            951868799.999999,
+            -62135596800,
+            253402300799,
+            1e9 + 0.25,
+        ]:
+            for tz, cpython_tz in zones:
+                with self.subTest(ts=ts, tz=tz):
+                    try:
+                        expected = self.theclass_cpython.fromtimestamp(ts, cpython_tz)
+                    except (OverflowError, ValueError):
+                        self.assertRaises(OverflowError, self.theclass.fromtimestamp, ts, tz)
+                        continue
+                    got = self.theclass.fromtimestamp(ts, tz)
+                    self.assertEqual(got.isoformat(), expected.isoformat())
+                    self.assertIs(got.tzinfo, tz)
+            with self.subTest(ts=ts):
+                got = self.theclass.utcfromtimestamp(ts)
+                expected = self.theclass_cpython.fromtimestamp(ts, cpython_timezone.utc)
+                self.assertEqual(got.isoformat(), expected.replace(tzinfo=None).isoformat())
+        self.assertRaises(OverflowError, self.theclass.utcfromtimestamp, -62135596801)
+        self.assertRaises(TypeError, self.theclass.fromtimestamp, 0, 1)
+
+    def test_fromtimestamp_many(self):
+        import array
+
+        stamps = array.array("d", [0, 3600.5, 86399, 86400, -1, 1e9])
+        tz = timezone(timedelta(hours=-1))
+        results = list(self.theclass.fromtimestamp_many(stamps, tz))
+        self.assertEqual(results, [self.theclass.fromtimestamp(t, tz) for t in stamps])
+        self.assertEqual(
+            [dt.toordinal() for dt in results], [dt.date().toordinal() for dt in results]
+        )
+        stamps = array.array("l", [0, 60, 120])
+        self.assertEqual(
+            list(self.theclass.fromtimestamp_many(stamps)),
+            [self.theclass.fromtimestamp(t) for t in stamps],
+        )
+
     def test_insane_fromtimestamp(self):
         # It's possible that some platform maps time_t to double,
         # and that this test will fail there.  This test should
@@ -622,7 +704,6 @@ class TestDateTime(TestDate):
         for insane in -1e200, 1e200:
             self.assertRaises(OverflowError, self.theclass.fromtimestamp, insane)
 
-    @unittest.skip("Not implemented - gmtime")
     def test_insane_utcfromtimestamp(self):
         # It's possible that some platform maps time_t to double,
         # and that this test will fail there.  This test should
@@ -646,6 +727,106 @@ class TestDateTime(TestDate):
             # Else try again a few times.
         self.assertLessEqual(abs(from_timestamp - from_now), tolerance)
 
+    def test_strptime_compiled(self):
+        strptime = self.theclass.strptime
+        for string, fmt in [
+            ("2004-12-01 13:02:47.197", "%Y-%m-%d %H:%M:%S.%f"),
+            ("01/02/03 4:5:6", "%d/%m/%y %H:%M:%S"),
+            ("2/03 04am:05:06", "%j/%y %I%p:%M:%S"),
+            ("Wed, 01 December 2004 01:02:03 PM", "%a, %d %B %Y %I:%M:%S %p"),
+            ("2004-12-01T13:02:47-0530", "%Y-%m-%dT%H:%M:%S%z"),
+            ("2004-12-01T13:02:47+05:30", "%Y-%m-%dT%H:%M:%S%z"),
+            ("1 % 1999", "%m %% %Y"),
+        ]:
+            with self.subTest(string=string, fmt=fmt):
+                expected = self.theclass_cpython.strptime(string, fmt)
+                for _ in range(2):  # compiled, then cached
+                    got = strptime(string, fmt)
+                    self.assertEqual(got.isoformat(), expected.isoformat())
+                    self.assertIs(type(got), self.theclass)
+
+        self.assertIs(strptime("2004-12-01Z", "%Y-%m-%d%z").tzinfo, timezone.utc)
+        for string, fmt in [
+            ("01/02/3 04:05:06", "%d/%m/%y %H:%M:%S"),
+            ("2004-12-01 extra", "%Y-%m-%d"),
+            ("2004-13-01", "%Y-%m-%d"),
+            ("13 AM", "%I %p"),
+            ("Foo 2004", "%b %Y"),
+            ("2004", "%Q"),
+            ("2004", "%Y%"),
+        ]:
+            with self.subTest(string=string, fmt=fmt):
+                self.assertRaises(ValueError, strptime, string, fmt)
+        self.assertRaises(TypeError, strptime, 2004, "%Y")
+
+    def test_strptime_names(self):
+        # Names stop at the longest known name, not at the end of the letters.
+        for string, fmt in [
+            ("TuesdayT06", "%AT%m"),
+            ("AMT50", "%pT%M"),
+            ("NovMon", "%b%a"),
+            ("NovemberMonday", "%B%A"),
+            ("Sept", "%bt"),
+            ("pm12", "%p%I"),
+        ]:
+            with self.subTest(string=string, fmt=fmt):
+                expected = self.theclass_cpython.strptime(string, fmt)
+                got = self.theclass.strptime(string, fmt)
+                self.assertEqual(got.isoformat(), expected.isoformat())
+        self.assertRaises(ValueError, self.theclass.strptime, "Tuesdays", "%A")
+
+    def test_strptime_adjacent_numbers(self):
+        # Numbers take fewer digits when that lets the rest of the format match.
+        for string, fmt in [
+            ("131", "%m%d"),
+            ("1231", "%m%d"),
+            ("9123", "%m%d%H"),
+            ("2359", "%H%M"),
+            ("05591", "%M%S%m"),
+            ("2024 3661", "%Y %j%H"),
+            ("12313", "%m%d%f"),
+            ("202401011", "%Y%m%d%H"),
+            ("150211", "%j0%S1"),
+            ("051", "%j1"),
+        ]:
+            with self.subTest(string=string, fmt=fmt):
+                expected = self.theclass_cpython.strptime(string, fmt)
+                got = self.theclass.strptime(string, fmt)
+                self.assertEqual(got.isoformat(), expected.isoformat())
+        for string, fmt in [("99", "%H"), ("1399", "%m%d"), ("0", "%m"), ("00", "%d")]:
+            with self.subTest(string=string, fmt=fmt):
+                with self.assertRaisesRegex(ValueError, "does not match format|unconverted data"):
+                    self.theclass.strptime(string, fmt)
+                self.assertRaises(ValueError, self.theclass_cpython.strptime, string, fmt)
+        with self.assertRaisesRegex(ValueError, "^time data '0000' does not match format"):
+            self.theclass.strptime("0000", "%m%d")
+        with self.assertRaisesRegex(ValueError, "^unconverted data remains: 99$"):
+            self.theclass.strptime("1399", "%m%d")
+
+    def test_strptime_offset_and_precedence(self):
+        for string, fmt in [
+            # Offset seconds are only taken when the rest still matches.
+            ("+034402", "%z%I"),
+            ("+0344", "%z"),
+            ("-03:4402", "%z%S"),
+            # The last of %Y and %y, or of %H and %I, wins.
+            ("99 2004", "%y %Y"),
+            ("2004 99", "%Y %y"),
+            ("05 13", "%I %H"),
+            ("13 05pm", "%H %I%p"),
+        ]:
+            with self.subTest(string=string, fmt=fmt):
+                expected = self.theclass_cpython.strptime(string, fmt)
+                got = self.theclass.strptime(string, fmt)
+                self.assertEqual(got.isoformat(), expected.isoformat())
+        for string, fmt in [("+0160", "%z"), ("+01:6", "%z"), ("+0", "%z")]:
+            with self.subTest(string=string, fmt=fmt):
+                self.assertRaises(ValueError, self.theclass.strptime, string, fmt)
+        with self.assertRaisesRegex(ValueError, "^unconverted data remains: 3$"):
+            self.theclass.strptime("13", "%I")
+        with self.assertRaisesRegex(ValueError, "^day of the year 366 is out of range"):
+            self.theclass.strptime("2001 366", "%Y %j")
+
     @unittest.skip("gmtime not implemented in CircuitPython")
     def test_strptime(self):
         string = "2004-12-01 13:02:47.197"
@@ -770,6 +951,23 @@ class TestDateTime(TestDate):
         self.assertEqual(tt.tm_yday, t.toordinal() - date(t.year, 1, 1).toordinal() + 1)
         self.assertEqual(tt.tm_isdst, -1)
 
+    def test_strftime_directives(self):
+        fmt = "%a %A %b %B %c|%d %e %f %H %I %j %m %M %p %S|%u %U %w %W|%x %X %y %Y %%"
+        for args in [
+            (2004, 12, 31, 6, 22, 33, 47),
+            (2021, 1, 3, 0, 0, 0, 0),
+            (2000, 2, 29, 12, 59, 59, 999999),
+            (1999, 7, 5, 23, 1, 2, 3),
+        ]:
+            with self.subTest(args=args):
+                t = self.theclass(*args)
+                self.assertEqual(t.strftime(fmt), self.theclass_cpython(*args).strftime(fmt))
+                # the second call is served from the compiled-format cache
+                self.assertEqual(t.strftime(fmt), self.theclass_cpython(*args).strftime(fmt))
+
+        t = self.theclass(2004, 12, 31, 6, 22, tzinfo=timezone(timedelta(hours=-5, minutes=-30)))
+        self.assertEqual(t.strftime("%H:%M %z %Z"), "06:22 -0530 UTC-05:30")
+
     @unittest.skip("gmtime not implemented in CircuitPython")
     def test_more_strftime(self):
         # This tests fields beyond those tested by the TestDate.test_strftime.
@@ -1003,6 +1201,258 @@ class TestDateTime(TestDate):
                 self.assertIsInstance(dt, DateTimeSubclass)
                 self.assertEqual(dt.extra, 7)
 
+    def test_add_timedelta_carries(self):
+        tz = timezone(timedelta(hours=2))
+        dt = self.theclass(1999, 12, 31, 23, 59, 59, 999999, tzinfo=tz)
+        expected = self.theclass_cpython(1999, 12, 31, 23, 59, 59, 999999)
+        for delta in [(0, 0, 1), (0, 1), (1,), (-1, 0, -999999), (366, 86399), (-730000,)]:
+            with self.subTest(delta=delta):
+                got = dt + timedelta(*delta)
+                self.assertIs(got.tzinfo, tz)
+                self.assertEqual(
+                    got.replace(tzinfo=None).isoformat(),
+                    (expected + cpython_timedelta(*delta)).isoformat(),
+                )
+                got = dt - timedelta(*delta)
+                self.assertEqual(
+                    got.replace(tzinfo=None).isoformat(),
+                    (expected - cpython_timedelta(*delta)).isoformat(),
+                )
+        self.assertRaises(OverflowError, lambda: dt + timedelta(3000000))
+        self.assertRaises(OverflowError, lambda: self.theclass(1, 1, 1) - timedelta(0, 0, 1))
+
+        class Sub(self.theclass):
+            pass
+
+        self.assertIs(type(Sub(2000, 1, 1) + timedelta(1)), Sub)
+
+    def test_fixed_offset_sub_and_compare(self):
+        offsets = [None, 0, 90, -300, 840]
+        fields = [(2000, 1, 1, 0, 0), (1999, 12, 31, 22, 30), (2000, 1, 1, 5, 0, 0, 1)]
+        ours, theirs = [], []
+        for minutes in offsets:
+            for args in fields:
+                if minutes is None:
+                    tz = cpython_tz = None
+                else:
+                    tz = timezone(timedelta(minutes=minutes))
+                    cpython_tz = cpython_timezone(cpython_timedelta(minutes=minutes))
+                ours.append(self.theclass(*args, tzinfo=tz))
+                theirs.append(self.theclass_cpython(*args, tzinfo=cpython_tz))
+
+        class NoReplace(self.theclass):
+            def replace(self, *args, **kwargs):
+                raise AssertionError("fold is irrelevant for fixed offsets")
+
+        for a, b in zip(ours, theirs):
+            for c, d in zip(ours, theirs):
+                with self.subTest(a=b, c=d):
+                    self.assertEqual(a == c, b == d)
+                    if (a.tzinfo is None) != (c.tzinfo is None):
+                        self.assertRaises(TypeError, lambda: a - c)
+                        self.assertRaises(TypeError, lambda: a < c)
+                        continue
+                    diff, expected = a - c, b - d
+                    self.assertEqual(
+                        (diff.days, diff.seconds, diff.microseconds),
+                        (expected.days, expected.seconds, expected.microseconds),
+                    )
+                    self.assertEqual(a < c, b < d)
+                    self.assertEqual(a >= c, b >= d)
+
+        a = NoReplace(2000, 1, 1, tzinfo=timezone(timedelta(hours=1)))
+        c = NoReplace(2000, 1, 1, 1, tzinfo=timezone(timedelta(hours=2)))
+        self.assertEqual(a, c)
+
+    def test_ordinal_cached(self):
+        dt = self.theclass(2000, 2, 28, 23, 30)
+        later = dt + timedelta(hours=1)
+        self.assertEqual(later._ordinal, dt.toordinal() + 1)
+        self.assertEqual(later.ctime(), "Tue Feb 29 00:30:00 2000")
+        self.assertEqual((later - dt).seconds, 3600)
+        self.assertEqual(self.theclass.fromordinal(730179)._ordinal, 730179)
+        aware = self.theclass(2000, 1, 1, 1, tzinfo=timezone(timedelta(hours=1)))
+        self.assertEqual(aware.timestamp(), 946684800)
+
+    def test_pickling(self):
+        tz = timezone(timedelta(hours=-5), "EST")
+        for orig in [
+            self.theclass(2000, 2, 29, 23, 59, 59, 999999),
+            self.theclass(1, 1, 1, tzinfo=timezone.utc),
+            self.theclass(2021, 11, 7, 1, 30, 0, 65536, tz, fold=1),
+            SubclassDatetime(9999, 12, 31, 23, 59),
+        ]:
+            for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+                derived = pickle.loads(pickle.dumps(orig, proto))
+                self.assertEqual(orig, derived)
+                self.assertIs(type(derived), type(orig))
+                self.assertEqual(derived.tzname(), orig.tzname())
+                self.assertEqual(derived.fold, orig.fold if proto > 3 else 0)
+                self.assertEqual(derived.toordinal(), orig.toordinal())
+            self.assertEqual(orig.__reduce__(), orig.__reduce_ex__(2))
+        self.assertIs(
+            pickle.loads(pickle.dumps(orig.replace(tzinfo=timezone.utc))).tzinfo, timezone.utc
+        )
+        # The 10 byte state is the one CPython uses
+        cpython_orig = cpython_datetime(2021, 11, 7, 1, 30, 0, 65536, fold=1)
+        state = cpython_orig.__reduce_ex__(4)[1]
+        self.assertEqual(self.theclass(*state).isoformat(), cpython_orig.isoformat())
+        self.assertEqual(self.theclass(*state).fold, 1)
+        self.assertEqual(self.theclass(2021, 11, 7, 1, 30, 0, 65536, fold=1)._getstate(4), state)
+
+    def test_floor_ceil_round(self):
+        epoch = cpython_datetime(1970, 1, 1)
+        deltas = [(0, 60), (0, 900), (0, 3600), (7, 0), (0, 7, 13), (1, 1, 1)]
+        fields = [
+            (2021, 3, 14, 1, 59, 26, 535897),
+            (2021, 3, 14, 2, 0),
+            (1969, 12, 31, 23, 52, 30),
+            (1, 2, 1, 0, 7, 30),
+            (2000, 2, 29, 12, 7, 30),
+        ]
+        for args in deltas:
+            delta = timedelta(*args)
+            cpython_delta = cpython_timedelta(*args)
+            for f in fields:
+                dt = self.theclass(*f)
+                q, r = divmod(cpython_datetime(*f) - epoch, cpython_delta)
+                floor = epoch + q * cpython_delta
+                ceil = floor + cpython_delta if r else floor
+                nearest = (
+                    ceil if 2 * r > cpython_delta or (2 * r == cpython_delta and q % 2) else floor
+                )
+                self.assertEqual(dt.floor(delta).isoformat(), floor.isoformat())
+                self.assertEqual(dt.ceil(delta).isoformat(), ceil.isoformat())
+                self.assertEqual(dt.round(delta).isoformat(), nearest.isoformat())
+        # Ties go to the even bucket
+        minute = timedelta(minutes=1)
+        self.assertEqual(self.theclass(2021, 1, 1, 0, 0, 30).round(minute).minute, 0)
+        self.assertEqual(self.theclass(2021, 1, 1, 0, 1, 30).round(minute).minute, 2)
+
+    def test_floor_origin_and_tzinfo(self):
+        tz = timezone(timedelta(hours=5, minutes=30))
+        dt = self.theclass(2021, 6, 1, 10, 20, 0, 0, tz, fold=1)
+        floored = dt.floor(timedelta(hours=1))
+        self.assertEqual(floored, self.theclass(2021, 6, 1, 10, tzinfo=tz))
+        self.assertIs(floored.tzinfo, tz)
+        self.assertEqual(floored.fold, 0)
+        self.assertEqual(floored.toordinal(), dt.toordinal())
+        origin = self.theclass(2021, 1, 1, 0, 5)
+        self.assertEqual(dt.floor(timedelta(minutes=15), origin).minute, 20)
+        self.assertEqual(dt.replace(minute=21).floor(timedelta(minutes=15), origin).minute, 20)
+        self.assertEqual(dt.replace(minute=21).ceil(timedelta(minutes=15), origin).minute, 35)
+        self.assertEqual(dt.floor(timedelta(days=7)).weekday(), 3)
+        self.assertEqual(dt.floor(timedelta(days=7), self.theclass(2021, 1, 4)).weekday(), 0)
+        self.assertEqual(dt.floor(timedelta(microseconds=1)), dt)
+        with self.assertRaises(ValueError):
+            dt.floor(timedelta(0))
+        with self.assertRaises(ValueError):
+            dt.floor(timedelta(hours=-1))
+        with self.assertRaises(TypeError):
+            dt.floor(60)
+        with self.assertRaises(OverflowError):
+            self.theclass(9999, 12, 31, 12).ceil(timedelta(days=1))
+
+    def test_floor_many(self):
+        items = [self.theclass(2021, 1, 1, 23, m * 7, s) for m in range(8) for s in (0, 29, 30)]
+        delta = timedelta(minutes=10)
+        self.assertEqual(
+            list(self.theclass.floor_many(items, delta)), [dt.floor(delta) for dt in items]
+        )
+        self.assertEqual(
+            list(self.theclass.ceil_many(items, delta)), [dt.ceil(delta) for dt in items]
+        )
+        self.assertEqual(
+            list(self.theclass.round_many(items, delta)), [dt.round(delta) for dt in items]
+        )
+        with self.assertRaises(ValueError):
+            self.theclass.floor_many(items, timedelta(0))
+
+    def test_binary_encoding(self):
+        tz = timezone(timedelta(hours=-5), "EST")
+        items = [
+            self.theclass(1, 1, 1),
+            self.theclass(2021, 11, 7, 1, 30, 0, 65536, tz, fold=1),
+            self.theclass(9999, 12, 31, 23, 59, 59, 999999),
+        ]
+        state = cpython_datetime(2021, 11, 7, 1, 30, 0, 65536, fold=1).__reduce_ex__(4)[1][0]
+        self.assertEqual(items[1].to_bytes(), state)
+        decoded = self.theclass.from_bytes(state, 0, tz)
+        self.assertEqual(decoded, items[1])
+        self.assertEqual(decoded.fold, 1)
+        buffer = bytearray(1 + 3 * self.theclass.packed_size)
+        view = memoryview(buffer)
+        self.assertEqual(self.theclass.pack_into(view, 1, items), len(buffer))
+        unpacked = self.theclass.unpack_from(view, 1, 3)
+        self.assertEqual(unpacked[0], items[0])
+        self.assertEqual(unpacked[1].replace(tzinfo=tz), items[1])
+        self.assertIsNone(unpacked[1].tzinfo)
+        self.assertEqual(unpacked[2], items[2])
+        # A datetime packed as a date keeps only its date fields
+        packed = bytearray(date.packed_size)
+        self.assertEqual(date.pack_into(packed, 0, items[1:2]), 4)
+        self.assertEqual(date.from_bytes(packed), date(2021, 11, 7))
+        with self.assertRaises(ValueError):
+            self.theclass.from_bytes(state[:9])
+
+    def test_sort_key(self):
+        fields = [
+            (2000, 1, 1),
+            (1999, 12, 31, 23, 59, 59, 999999),
+            (2000, 1, 1, 0, 0, 0, 1),
+            (1, 1, 1),
+            (9999, 12, 31, 23, 59, 59, 999999),
+            (2000, 1, 1, 2, 30),
+        ]
+        for minutes in (None, 0, 150, -300):
+            if minutes is None:
+                tz = cpython_tz = None
+            else:
+                tz = timezone(timedelta(minutes=minutes))
+                cpython_tz = cpython_timezone(cpython_timedelta(minutes=minutes))
+            for args in fields:
+                if minutes and args[0] in {1, 9999}:
+                    continue  # the UTC time would be out of range
+                with self.subTest(args=args, minutes=minutes):
+                    ours = self.theclass(*args, tzinfo=tz)
+                    theirs = self.theclass_cpython(*args, tzinfo=cpython_tz)
+                    if cpython_tz is not None:
+                        theirs = theirs.astimezone(cpython_timezone.utc).replace(tzinfo=None)
+                    expected = theirs - self.theclass_cpython(1, 1, 1)
+                    self.assertEqual(ours.sort_key(), expected // cpython_timedelta(microseconds=1))
+                    self.assertEqual(ours.sort_key(), ours.sort_key())
+
+        aware = [
+            self.theclass(*args, tzinfo=timezone(timedelta(minutes=minutes)))
+            for minutes in (0, 150, -300)
+            for args in fields[:3] + fields[5:]
+        ]
+        by_key = sorted(aware, key=self.theclass.sort_key)
+        self.assertEqual(by_key, sorted(aware))
+        for a, b in zip(by_key, by_key[1:]):
+            self.assertLessEqual(a, b)
+            if a == b:
+                self.assertEqual(hash(a), hash(b))
+
+    def test_slots(self):
+        dt = self.theclass(2002, 3, 4, 18, 45, 3, 1234, tzinfo=timezone.utc)
+        for obj in (dt, dt.date(), dt.time(), dt - dt, timezone.utc):
+            with self.subTest(obj=obj):
+                self.assertFalse(hasattr(obj, "__dict__"))
+                with self.assertRaises(AttributeError):
+                    obj.extra = 1
+
+        class Extra(self.theclass):
+            pass
+
+        extra = Extra(2002, 3, 4)
+        extra.extra = 7
+        self.assertEqual(extra.extra, 7)
+
+        d = date(2000, 1, 1)
+        d._setstate(dt.date()._getstate()[0])
+        self.assertEqual(d, dt.date())
+
     def test_fromisoformat_datetime(self):
         # Test that isoformat() is reversible
         base_dates = [(1, 1, 1), (1900, 1, 1), (2004, 11, 12), (2017, 5, 30)]
@@ -1179,6 +1629,69 @@ class TestDateTime(TestDate):
 
         self.assertIs(dt.tzinfo, timezone.utc)
 
+    def test_fromisoformat_buffers(self):
+        expected = self.theclass.fromisoformat("2014-12-14T09:30:45.457390+10:45")
+        record = b"id=7 ts=2014-12-14T09:30:45.457390+10:45 temp=21.5"
+        for buf in (record, bytearray(record), memoryview(record)):
+            with self.subTest(buf=type(buf).__name__):
+                self.assertEqual(self.theclass.fromisoformat(buf, 8, 32), expected)
+        self.assertEqual(
+            self.theclass.fromisoformat(memoryview(record), 8, 10), self.theclass(2014, 12, 14)
+        )
+        self.assertEqual(
+            self.theclass.fromisoformat("ts=2014-12-14T09:30:45.457390+10:45", 3), expected
+        )
+        self.assertEqual(
+            list(self.theclass.fromisoformat_many([b"2014-12-14T09:30:45.457390+10:45"])),
+            [expected],
+        )
+        with self.assertRaisesRegex(ValueError, "2014-12-14T09:30:4x"):
+            self.theclass.fromisoformat(b"2014-12-14T09:30:4x")
+        with self.assertRaises(ValueError):
+            self.theclass.fromisoformat(record, 8, 31)
+        with self.assertRaises(ValueError):
+            self.theclass.fromisoformat(record, 40, 32)
+
+    def test_fromisoformat_many(self):
+        strings = [
+            "2014-12-14",
+            "2014-12-14T09:30:45.457390+10:45",
+            "2014-12-14T09:30:45-05:00",
+            "2014-12-15T00:00:00+10:45",
+        ]
+        consumed = []
+
+        def source():
+            for s in strings:
+                consumed.append(s)
+                yield s
+
+        results = self.theclass.fromisoformat_many(source())
+        self.assertEqual(consumed, [])
+        first = next(results)
+        self.assertEqual(consumed, strings[:1])
+        results = [first, *results]
+        self.assertEqual(results, [self.theclass.fromisoformat(s) for s in strings])
+        self.assertIs(results[1].tzinfo, results[3].tzinfo)
+
+        with self.assertRaisesRegex(ValueError, "2014-12-1x"):
+            list(self.theclass.fromisoformat_many(["2014-12-14", "2014-12-1x"]))
+
+    def test_interned_timezones(self):
+        first = self.theclass.fromisoformat("2014-12-14T09:30:45+02:00")
+        second = self.theclass.fromisoformat("2020-01-01T00:00:00+02:00")
+        self.assertIs(first.tzinfo, second.tzinfo)
+        self.assertEqual(first.tzname(), "utcoffset")
+        parsed = self.theclass.strptime("2020-01-01 +0200", "%Y-%m-%d %z")
+        self.assertIs(parsed.tzinfo, timezone.intern(timedelta(hours=2)))
+        self.assertIsNot(parsed.tzinfo, first.tzinfo)
+        self.assertIs(timezone.intern(timedelta(0)), timezone.utc)
+        named = timezone.intern(timedelta(hours=-5), "EST")
+        self.assertIs(timezone.intern(timedelta(hours=-5), "EST"), named)
+        self.assertEqual(named.tzname(None), "EST")
+        self.assertRaises(TypeError, timezone.intern, 5)
+        self.assertRaises(ValueError, timezone.intern, timedelta(hours=24))
+
     def test_fromisoformat_subclass(self):
         class DateTimeSubclass(self.theclass):
             pass
@@ -0,0 +1,179 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+# pylint:disable=invalid-name, wrong-import-position, protected-access
+import array
+import sys
+import unittest
+
+# CPython standard implementation
+from datetime import datetime as cpython_datetime
+from datetime import timedelta as cpython_timedelta
+from datetime import timezone as cpython_timezone
+
+# CircuitPython subset implementation
+sys.path.append("..")
+from adafruit_datetime import DatetimeArray, PosixTimeZone, datetime, timedelta, timezone
+
+FIELDS = [
+    (2021, 3, 14, 1, 59, 26, 535897),
+    (1970, 1, 1),
+    (1, 1, 1),
+    (9999, 12, 31, 23, 59, 59, 999999),
+    (2000, 2, 29, 12),
+    (1969, 12, 31, 23, 59, 59, 999999),
+]
+
+
+class TestDatetimeArray(unittest.TestCase):
+    def test_naive_roundtrip(self):
+        values = [datetime(*fields) for fields in FIELDS]
+        dts = DatetimeArray(values)
+        self.assertEqual(len(dts), len(values))
+        self.assertIsNone(dts.tzinfo)
+        self.assertEqual(dts.microseconds.typecode, "q")
+        self.assertEqual(dts.tolist(), values)
+        for i, dt in enumerate(values):
+            self.assertEqual(dts[i], dt)
+            self.assertEqual(dts[i].toordinal(), dt.toordinal())
+        self.assertEqual(dts[-1], values[-1])
+        self.assertEqual(dts[1], datetime(1970, 1, 1))
+        self.assertEqual(dts.microseconds[1], 0)
+        self.assertEqual(
+            dts.isoformat(), [cpython_datetime(*fields).isoformat() for fields in FIELDS]
+        )
+        self.assertEqual(dts.isoformat(" ")[1], "1970-01-01 00:00:00")
+
+    def test_aware_converts_to_tzinfo(self):
+        east = timezone(timedelta(hours=5, minutes=30))
+        cpython_east = cpython_timezone(cpython_timedelta(hours=5, minutes=30))
+        dts = DatetimeArray(
+            [datetime(2021, 6, 1, 23, tzinfo=timezone.utc), datetime(2021, 6, 2, tzinfo=east)],
+            tzinfo=east,
+        )
+        self.assertIs(dts.tzinfo, east)
+        self.assertIs(dts[0].tzinfo, east)
+        expected = [
+            cpython_datetime(2021, 6, 1, 23, tzinfo=cpython_timezone.utc).astimezone(cpython_east),
+            cpython_datetime(2021, 6, 2, tzinfo=cpython_east),
+        ]
+        self.assertEqual(dts.isoformat(), [dt.isoformat() for dt in expected])
+        self.assertEqual(
+            list(dts.microseconds),
+            [int(dt.timestamp()) * 1000000 for dt in expected],
+        )
+
+    def test_mixing_naive_and_aware(self):
+        naive = DatetimeArray([datetime(2021, 1, 1)])
+        aware = DatetimeArray([datetime(2021, 1, 1, tzinfo=timezone.utc)], tzinfo=timezone.utc)
+        with self.assertRaises(TypeError):
+            naive.append(datetime(2021, 1, 1, tzinfo=timezone.utc))
+        with self.assertRaises(TypeError):
+            DatetimeArray([datetime(2021, 1, 1)], tzinfo=timezone.utc)
+        with self.assertRaises(TypeError):
+            naive < aware  # pylint: disable=pointless-statement
+        with self.assertRaises(TypeError):
+            naive.append("2021-01-01")
+        with self.assertRaises(TypeError):
+            DatetimeArray([], tzinfo=1)
+
+    def test_from_microseconds(self):
+        store = array.array("q", [0, 86400000000, -1])
+        dts = DatetimeArray.from_microseconds(store, timezone.utc)
+        self.assertIs(dts.microseconds, store)
+        self.assertEqual(dts[2], datetime(1969, 12, 31, 23, 59, 59, 999999, timezone.utc))
+        self.assertEqual(DatetimeArray.from_microseconds([86400000000])[0], datetime(1970, 1, 2))
+        with self.assertRaises(OverflowError):
+            DatetimeArray.from_microseconds([-62135596800000001])
+        with self.assertRaises(OverflowError):
+            DatetimeArray.from_microseconds([253402300800000000])
+
+    def test_arithmetic(self):
+        values = [datetime(*fields) for fields in FIELDS[:3]]
+        cpython_values = [cpython_datetime(*fields) for fields in FIELDS[:3]]
+        dts = DatetimeArray(values)
+        delta = timedelta(days=3, hours=-5, microseconds=7)
+        cpython_delta = cpython_timedelta(days=3, hours=-5, microseconds=7)
+        shifted = dts + delta
+        self.assertIsNot(shifted.microseconds, dts.microseconds)
+        self.assertEqual(
+            shifted.isoformat(), [(dt + cpython_delta).isoformat() for dt in cpython_values]
+        )
+        self.assertEqual((delta + dts).tolist(), shifted.tolist())
+        self.assertEqual((shifted - delta).tolist(), values)
+        self.assertEqual(shifted - dts, [delta] * 3)
+        self.assertEqual(dts - values[1], [dt - values[1] for dt in values])
+        with self.assertRaises(OverflowError):
+            dts - timedelta(days=1)  # pylint: disable=pointless-statement
+        with self.assertRaises(ValueError):
+            dts - dts[1:]  # pylint: disable=pointless-statement
+
+    def test_comparison_masks(self):
+        dts = DatetimeArray([datetime(*fields) for fields in FIELDS])
+        pivot = datetime(2000, 2, 29, 12)
+        self.assertEqual(dts == pivot, [dt == pivot for dt in dts])
+        self.assertEqual(dts != pivot, [dt != pivot for dt in dts])
+        self.assertEqual(dts < pivot, [dt < pivot for dt in dts])
+        self.assertEqual(dts <= pivot, [dt <= pivot for dt in dts])
+        self.assertEqual(dts > pivot, [dt > pivot for dt in dts])
+        self.assertEqual(dts >= pivot, [dt >= pivot for dt in dts])
+        self.assertEqual(dts == dts[:], [True] * len(FIELDS))
+        inner = dts[4:]
+        self.assertEqual(inner < inner + timedelta(microseconds=1), [True, True])
+        self.assertEqual(inner >= inner + timedelta(microseconds=1), [False, False])
+
+    def test_sort_and_searchsorted(self):
+        values = [datetime(*fields) for fields in FIELDS]
+        dts = DatetimeArray(values)
+        dts.sort()
+        self.assertEqual(dts.tolist(), sorted(values))
+        dts.sort(reverse=True)
+        self.assertEqual(dts.tolist(), sorted(values, reverse=True))
+        dts.sort()
+        dts.append(datetime(9999, 12, 31, 23, 59, 59, 999999))
+        self.assertEqual(dts.searchsorted(datetime(1970, 1, 1)), 2)
+        self.assertEqual(dts.searchsorted(datetime(1970, 1, 1), "right"), 3)
+        self.assertEqual(dts.searchsorted(datetime(1, 1, 1)), 0)
+        self.assertEqual(dts.searchsorted(datetime(9999, 12, 31, 23, 59, 59, 999999)), 5)
+        self.assertEqual(dts.searchsorted(datetime(9999, 12, 31, 23, 59, 59, 999999), "right"), 7)
+        with self.assertRaises(ValueError):
+            dts.searchsorted(datetime(1970, 1, 1), "middle")
+
+    def test_sort_keeps_buffer(self):
+        buffer = array.array("q", [3000000, -5, 1000000, 0])
+        dts = DatetimeArray.from_microseconds(buffer)
+        storage = dts.microseconds
+        dts.sort()
+        self.assertIs(dts.microseconds, storage)
+        self.assertIs(storage, buffer)
+        self.assertEqual(list(buffer), [-5, 0, 1000000, 3000000])
+        dts.sort(reverse=True)
+        self.assertEqual(list(storage), [3000000, 1000000, 0, -5])
+
+    def test_floor_ceil_round(self):
+        delta = timedelta(minutes=15)
+        origin = datetime(2000, 1, 1, 0, 5)
+        values = [datetime(2021, 7, 14, 1, 59, 26), datetime(1969, 12, 31, 23, 52, 30)]
+        for tz in (None, timezone(timedelta(hours=-9, minutes=-30)), PosixTimeZone("EST5EDT")):
+            items = [dt.replace(tzinfo=tz) for dt in values]
+            dts = DatetimeArray(items, tz)
+            self.assertEqual(dts.floor(delta).tolist(), [dt.floor(delta) for dt in items])
+            self.assertEqual(dts.ceil(delta).tolist(), [dt.ceil(delta) for dt in items])
+            self.assertEqual(dts.round(delta).tolist(), [dt.round(delta) for dt in items])
+            self.assertEqual(
+                dts.floor(delta, origin).tolist(), [dt.floor(delta, origin) for dt in items]
+            )
+
+    def test_slicing_and_assignment(self):
+        dts = DatetimeArray([datetime(*fields) for fields in FIELDS])
+        tail = dts[3:]
+        self.assertIsInstance(tail, DatetimeArray)
+        self.assertEqual(tail.tolist(), dts.tolist()[3:])
+        dts[0] = datetime(2022, 1, 1)
+        self.assertEqual(dts[0], datetime(2022, 1, 1))
+        dts.extend([datetime(2023, 1, 1), datetime(2024, 1, 1)])
+        self.assertEqual(len(dts), len(FIELDS) + 2)
+        self.assertEqual(repr(dts[:1]), "DatetimeArray([datetime.datetime(2022, 1, 1, 0, 0)])")
+
+
+if __name__ == "__main__":
+    unittest.main()
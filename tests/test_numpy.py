@@ -0,0 +1,142 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+# pylint:disable=invalid-name, wrong-import-position, protected-access
+import random
+import sys
+import unittest
+
+# CPython standard implementation
+from datetime import datetime as cpython_datetime
+from datetime import timedelta as cpython_timedelta
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# CircuitPython subset implementation
+sys.path.append("..")
+from adafruit_datetime import (
+    DatetimeArray,
+    PosixTimeZone,
+    datetime,
+    from_datetime64,
+    from_timedelta64,
+    timedelta,
+    timezone,
+    to_datetime64,
+    to_timedelta64,
+)
+
+EDGES = [
+    (1, 1, 1),
+    (1, 12, 31, 23, 59, 59, 999999),
+    (1600, 2, 29),
+    (1900, 3, 1),
+    (1969, 12, 31, 23, 59, 59, 999999),
+    (1970, 1, 1),
+    (2000, 12, 31, 12, 30),
+    (2004, 2, 29, 1, 2, 3, 4),
+    (9999, 12, 31, 23, 59, 59, 999999),
+]
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestNumpy(unittest.TestCase):
+    def test_datetime64_roundtrip(self):
+        values = [datetime(*fields) for fields in EDGES]
+        array = to_datetime64(values)
+        self.assertEqual(array.dtype, numpy.dtype("datetime64[us]"))
+        expected = numpy.array([cpython_datetime(*fields) for fields in EDGES], "datetime64[us]")
+        numpy.testing.assert_array_equal(array, expected)
+        converted = from_datetime64(array)
+        self.assertEqual(converted, values)
+        self.assertEqual([dt.toordinal() for dt in converted], [dt.toordinal() for dt in values])
+
+    def test_from_datetime64_calendar(self):
+        rng = random.Random(19)
+        us = [rng.randrange(-62135596800000000, 253402300800000000) for _ in range(2000)]
+        # Every day around the 400 year cycle boundaries and leap days
+        for year in (1, 100, 400, 1600, 1700, 2000, 2100, 9600):
+            first = (
+                cpython_datetime(year, 1, 1) - cpython_datetime(1970, 1, 1)
+            ) // cpython_timedelta(microseconds=1)
+            us.extend(first + day * 86400000000 for day in range(-400, 400) if year > 1 or day >= 0)
+        converted = from_datetime64(numpy.array(us, dtype="int64").view("datetime64[us]"))
+        epoch = cpython_datetime(1970, 1, 1)
+        for value, dt in zip(us, converted):
+            self.assertEqual(
+                dt.isoformat(), (epoch + cpython_timedelta(microseconds=value)).isoformat()
+            )
+
+    def test_aware(self):
+        tz = timezone(timedelta(hours=-3, minutes=-30))
+        values = [datetime(2020, 1, 1, tzinfo=tz), datetime(2020, 1, 1, tzinfo=timezone.utc)]
+        array = to_datetime64(values)
+        numpy.testing.assert_array_equal(
+            array, numpy.array(["2020-01-01T03:30", "2020-01-01T00:00"], "datetime64[us]")
+        )
+        self.assertEqual(
+            from_datetime64(array, tz),
+            [datetime(2020, 1, 1, tzinfo=tz), datetime(2019, 12, 31, 20, 30, tzinfo=tz)],
+        )
+        self.assertIs(from_datetime64(array, tz)[0].tzinfo, tz)
+        zone = PosixTimeZone("EST5EDT,M3.2.0,M11.1.0")
+        summer = numpy.array(["2021-07-01T12:00", "2021-11-07T05:30", "2021-11-07T06:30"], "M8[s]")
+        converted = from_datetime64(summer, zone)
+        self.assertEqual(
+            [dt.isoformat() for dt in converted],
+            ["2021-07-01T08:00:00-04:00", "2021-11-07T01:30:00-04:00", "2021-11-07T01:30:00-05:00"],
+        )
+        self.assertEqual([dt.fold for dt in converted], [0, 0, 1])
+        with self.assertRaises(TypeError):
+            to_datetime64([datetime(2020, 1, 1), values[0]])
+
+    def test_datetime_array(self):
+        dts = DatetimeArray([datetime(*fields) for fields in EDGES])
+        array = dts.to_datetime64()
+        numpy.testing.assert_array_equal(array, to_datetime64(dts))
+        numpy.testing.assert_array_equal(array, to_datetime64(list(dts)))
+        back = DatetimeArray.from_datetime64(array.astype("datetime64[ms]"), timezone.utc)
+        self.assertIs(back.tzinfo, timezone.utc)
+        self.assertEqual(back[5], datetime(1970, 1, 1, tzinfo=timezone.utc))
+        self.assertEqual(back[3], datetime(1900, 3, 1, tzinfo=timezone.utc))
+
+    def test_out_of_range(self):
+        with self.assertRaises(OverflowError):
+            from_datetime64(numpy.array(["10000-01-01"], "datetime64[D]"))
+        with self.assertRaises(OverflowError):
+            from_datetime64(numpy.array(["NaT"], "datetime64[us]"))
+        with self.assertRaises(OverflowError):
+            from_datetime64(numpy.array(["9999-12-31T23:00"], "M8[us]"), timezone.max)
+        with self.assertRaises(TypeError):
+            from_datetime64(numpy.array([1, 2]))
+        self.assertEqual(from_datetime64(numpy.array([], "datetime64[us]")), [])
+
+    def test_timedelta64(self):
+        values = [
+            timedelta(0),
+            timedelta(microseconds=-1),
+            timedelta(days=99999999, hours=23, minutes=59, seconds=59, microseconds=999999),
+            timedelta(days=-99999999),
+            timedelta(days=1, seconds=2, microseconds=3),
+        ]
+        array = to_timedelta64(values)
+        self.assertEqual(array.dtype, numpy.dtype("timedelta64[us]"))
+        self.assertEqual(array[1], numpy.timedelta64(-1, "us"))
+        self.assertEqual(from_timedelta64(array), values)
+        self.assertEqual(
+            from_timedelta64(numpy.array([90, -90], "timedelta64[m]")),
+            [timedelta(minutes=90), timedelta(minutes=-90)],
+        )
+        with self.assertRaises(TypeError):
+            from_timedelta64(numpy.array(["2020-01-01"], "datetime64[D]"))
+        with self.assertRaises(TypeError):
+            to_timedelta64([1])
+        # timedelta64[us] spans about 292000 years, less than timedelta does.
+        with self.assertRaises(OverflowError):
+            to_timedelta64([timedelta(days=999999999)])
+
+
+if __name__ == "__main__":
+    unittest.main()
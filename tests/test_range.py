@@ -0,0 +1,159 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+# pylint:disable=invalid-name, wrong-import-position, protected-access
+import sys
+import unittest
+
+# CPython standard implementation
+from datetime import date as cpython_date
+from datetime import datetime as cpython_datetime
+from datetime import timedelta as cpython_timedelta
+
+# CircuitPython subset implementation
+sys.path.append("..")
+from adafruit_datetime import (
+    PosixTimeZone,
+    date,
+    date_range,
+    datetime,
+    datetime_range,
+    timedelta,
+    timezone,
+)
+
+
+def cpython_dates(start, stop, step):
+    return [cpython_date.fromordinal(n).isoformat() for n in range(start, stop, step)]
+
+
+class TestDateRange(unittest.TestCase):
+    def test_matches_cpython(self):
+        cases = [
+            ((2019, 12, 20), (2021, 3, 5), 1),
+            ((2019, 12, 20), (2021, 3, 5), 13),
+            ((2000, 3, 31), (1999, 1, 1), -1),
+            ((2000, 3, 31), (1899, 1, 1), -28),
+            ((1, 1, 1), (9999, 12, 31), 400),
+            ((9999, 12, 31), (9900, 1, 1), -1),
+            ((2020, 1, 1), (2020, 1, 1), 1),
+        ]
+        for start, stop, step in cases:
+            r = date_range(date(*start), date(*stop), timedelta(days=step))
+            expected = cpython_dates(
+                cpython_date(*start).toordinal(), cpython_date(*stop).toordinal(), step
+            )
+            self.assertEqual(len(r), len(expected))
+            self.assertEqual([d.isoformat() for d in r], expected)
+            self.assertEqual([d.isoformat() for d in reversed(r)], expected[::-1])
+            self.assertEqual([d.isoformat() for d in r[3:-2:5]], expected[3:-2:5])
+            for i in (0, len(expected) // 2, -1) if expected else ():
+                self.assertEqual(r[i].isoformat(), expected[i])
+                self.assertEqual(
+                    r[i].toordinal(), cpython_date.fromisoformat(expected[i]).toordinal()
+                )
+
+    def test_membership(self):
+        r = date_range(date(2020, 1, 1), date(2020, 12, 31), timedelta(days=7))
+        self.assertIn(date(2020, 1, 8), r)
+        self.assertNotIn(date(2020, 1, 9), r)
+        self.assertIn(date(2020, 12, 30), r)
+        self.assertNotIn(date(2021, 1, 6), r)
+        self.assertNotIn(datetime(2020, 1, 8), r)
+        self.assertNotIn("2020-01-08", r)
+        self.assertEqual(r.index(date(2020, 12, 23)), 51)
+        self.assertEqual(r.count(date(2020, 1, 8)), 1)
+        with self.assertRaises(ValueError):
+            r.index(date(2020, 1, 2))
+        with self.assertRaises(IndexError):
+            r[len(r)]  # pylint: disable=pointless-statement
+
+    def test_attributes(self):
+        r = date_range(date(2020, 1, 1), date(2020, 2, 1))
+        self.assertEqual(r.start, date(2020, 1, 1))
+        self.assertEqual(r.step, timedelta(days=1))
+        self.assertEqual(r[::2], date_range(date(2020, 1, 1), date(2020, 2, 1), timedelta(days=2)))
+        self.assertEqual(hash(r), hash(date_range(date(2020, 1, 1), date(2020, 2, 1))))
+        self.assertEqual(
+            repr(r[::-1]),
+            "date_range(datetime.date(2020, 1, 31), datetime.date(2019, 12, 31), "
+            f"{timedelta(days=-1)!r})",
+        )
+        reverse = date_range(date(1, 1, 1), date(1, 1, 5))[::-1]
+        self.assertEqual(reverse[-1], date(1, 1, 1))
+        self.assertIn("Ellipsis", repr(reverse))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            date_range(date(2020, 1, 1), date(2020, 2, 1), timedelta(hours=12))
+        with self.assertRaises(ValueError):
+            date_range(date(2020, 1, 1), date(2020, 2, 1), timedelta(0))
+        with self.assertRaises(TypeError):
+            date_range(datetime(2020, 1, 1), datetime(2020, 2, 1))
+        with self.assertRaises(TypeError):
+            date_range(date(2020, 1, 1), date(2020, 2, 1), 1)
+
+
+class TestDatetimeRange(unittest.TestCase):
+    def test_matches_cpython(self):
+        step = timedelta(hours=7, microseconds=13)
+        cpython_step = cpython_timedelta(hours=7, microseconds=13)
+        start = cpython_datetime(1999, 12, 30, 12)
+        stop = cpython_datetime(2000, 3, 2)
+        expected = []
+        dt = start
+        while dt < stop:
+            expected.append(dt.isoformat())
+            dt += cpython_step
+        r = datetime_range(datetime(1999, 12, 30, 12), datetime(2000, 3, 2), step)
+        self.assertEqual(len(r), len(expected))
+        self.assertEqual([dt.isoformat() for dt in r], expected)
+        self.assertEqual([dt.isoformat() for dt in reversed(r)], expected[::-1])
+        self.assertEqual([dt.isoformat() for dt in r[::7]], expected[::7])
+        self.assertEqual(r[100].isoformat(), expected[100])
+        self.assertEqual(
+            r[-1].toordinal(), cpython_datetime.fromisoformat(expected[-1]).toordinal()
+        )
+        backwards = datetime_range(datetime(2000, 3, 2), datetime(1999, 12, 30, 12), -step)
+        self.assertEqual(len(backwards), len(expected))
+        self.assertEqual(backwards[0], datetime(2000, 3, 2))
+
+    def test_aware(self):
+        tz = timezone(timedelta(hours=2))
+        r = datetime_range(
+            datetime(2020, 1, 1, tzinfo=tz), datetime(2020, 1, 2, tzinfo=tz), timedelta(minutes=30)
+        )
+        self.assertIs(r.tzinfo, tz)
+        self.assertIs(r[5].tzinfo, tz)
+        self.assertEqual(len(r), 48)
+        self.assertIn(datetime(2020, 1, 1, 2, 30, tzinfo=tz), r)
+        self.assertIn(datetime(2020, 1, 1, 0, 30, tzinfo=timezone.utc), r)
+        self.assertNotIn(datetime(2020, 1, 1, 2, 30), r)
+        self.assertNotIn(datetime(2020, 1, 1, 2, 31, tzinfo=tz), r)
+        self.assertEqual(r.index(datetime(2020, 1, 1, 23, 30, tzinfo=tz)), 47)
+        with self.assertRaises(ValueError):
+            datetime_range(
+                datetime(2020, 1, 1, tzinfo=tz), datetime(2020, 1, 2), timedelta(hours=1)
+            )
+
+    def test_wall_clock_steps(self):
+        zone = PosixTimeZone("EST5EDT,M3.2.0,M11.1.0")
+        start = datetime(2021, 3, 13, 12, tzinfo=zone)
+        r = datetime_range(start, datetime(2021, 3, 15, tzinfo=zone), timedelta(hours=6))
+        self.assertEqual(list(r), [start + timedelta(hours=6 * i) for i in range(len(r))])
+        self.assertEqual(
+            [dt.utcoffset() for dt in r[::4]], [timedelta(hours=-5), timedelta(hours=-4)]
+        )
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            datetime_range(datetime(2020, 1, 1), datetime(2020, 2, 1), timedelta(0))
+        with self.assertRaises(TypeError):
+            datetime_range(date(2020, 1, 1), date(2020, 2, 1), timedelta(1))
+        with self.assertRaises(ValueError):
+            datetime_range(datetime(2020, 1, 1), datetime(2020, 2, 1), timedelta(1)).index(
+                datetime(2020, 1, 1, 1)
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
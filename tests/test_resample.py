@@ -0,0 +1,137 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+# pylint:disable=invalid-name, wrong-import-position, protected-access
+import random
+import sys
+import unittest
+
+# CircuitPython subset implementation
+sys.path.append("..")
+from adafruit_datetime import Resampler, datetime, timedelta, timezone
+
+START = datetime(2021, 5, 1, 23, 50)
+
+
+def stream(count, seed=24, jitter=0):
+    """Readings every 7 seconds, each arriving up to jitter readings late."""
+    rng = random.Random(seed)
+    pairs = [(START + timedelta(seconds=7 * i), rng.randrange(-50, 50)) for i in range(count)]
+    if jitter:
+        keyed = [(i + rng.randrange(jitter + 1), pair) for i, pair in enumerate(pairs)]
+        keyed.sort(key=lambda item: item[0])
+        pairs = [pair for _, pair in keyed]
+    return pairs
+
+
+def reference(pairs, delta):
+    """Aggregates computed from the whole stream at once."""
+    buckets = {}
+    for i, (dt, value) in enumerate(pairs):
+        buckets.setdefault(dt.floor(delta), []).append((dt, i, value))
+    result = []
+    for start in sorted(buckets):
+        items = buckets[start]
+        values = [value for _, _, value in items]
+        ordered = sorted(items, key=lambda item: (item[0], item[1]))
+        result.append(
+            (
+                start,
+                len(values),
+                sum(values),
+                min(values),
+                max(values),
+                ordered[0][2],
+                ordered[-1][2],
+            )
+        )
+    return result
+
+
+def summary(aggregates):
+    return [(a.start, a.count, a.sum, a.min, a.max, a.first, a.last) for a in aggregates]
+
+
+class TestResampler(unittest.TestCase):
+    def test_in_order(self):
+        pairs = stream(500)
+        delta = timedelta(minutes=1)
+        resampler = Resampler(delta)
+        emitted = list(resampler.feed(pairs))
+        # Every bucket but the last closes while the stream is read
+        self.assertEqual(len(resampler), 1)
+        emitted += resampler.flush()
+        self.assertEqual(summary(emitted), reference(pairs, delta))
+        self.assertEqual(len(resampler), 0)
+        self.assertEqual(resampler.dropped, 0)
+        first = emitted[0]
+        self.assertEqual(first.start, datetime(2021, 5, 1, 23, 50))
+        self.assertEqual(first.end, datetime(2021, 5, 1, 23, 51))
+        self.assertEqual(first.mean, first.sum / first.count)
+        self.assertEqual(emitted[10].start.toordinal(), datetime(2021, 5, 2).toordinal())
+
+    def test_out_of_order_within_lateness(self):
+        pairs = stream(800, jitter=20)
+        delta = timedelta(minutes=5)
+        resampler = Resampler(delta, lateness=timedelta(seconds=7 * 20))
+        emitted = list(resampler.feed(pairs)) + resampler.flush()
+        self.assertEqual(resampler.dropped, 0)
+        self.assertEqual(summary(emitted), reference(pairs, delta))
+        self.assertEqual([a.start for a in emitted], sorted(a.start for a in emitted))
+
+    def test_late_pairs_dropped(self):
+        resampler = Resampler(timedelta(minutes=1))
+        self.assertEqual(resampler.add(datetime(2021, 1, 1, 0, 0, 30), 1), [])
+        closed = resampler.add(datetime(2021, 1, 1, 0, 2, 0), 2)
+        self.assertEqual(summary(closed), [(datetime(2021, 1, 1), 1, 1, 1, 1, 1, 1)])
+        self.assertEqual(resampler.add(datetime(2021, 1, 1, 0, 0, 59), 3), [])
+        self.assertEqual(resampler.dropped, 1)
+        # The bucket ending at the watermark is closed as well
+        self.assertEqual(resampler.add(datetime(2021, 1, 1, 0, 1, 10), 4), [])
+        self.assertEqual(resampler.dropped, 2)
+        self.assertEqual(
+            summary(resampler.flush()), [(datetime(2021, 1, 1, 0, 2), 1, 2, 2, 2, 2, 2)]
+        )
+        self.assertEqual(resampler.flush(), [])
+        self.assertEqual(resampler.add(datetime(2021, 1, 1, 0, 2, 10), 5), [])
+        self.assertEqual(resampler.dropped, 3)
+
+    def test_lateness_keeps_buckets_open(self):
+        resampler = Resampler(timedelta(minutes=1), lateness=timedelta(seconds=30))
+        resampler.add(datetime(2021, 1, 1, 0, 0, 30), 1)
+        self.assertEqual(resampler.add(datetime(2021, 1, 1, 0, 1, 20), 2), [])
+        self.assertEqual(resampler.add(datetime(2021, 1, 1, 0, 0, 10), 3), [])
+        closed = resampler.add(datetime(2021, 1, 1, 0, 1, 30), 4)
+        self.assertEqual(summary(closed), [(datetime(2021, 1, 1), 2, 4, 1, 3, 3, 1)])
+        self.assertEqual(len(resampler), 1)
+        self.assertEqual(resampler.dropped, 0)
+
+    def test_origin_and_tzinfo(self):
+        tz = timezone(timedelta(hours=-3))
+        resampler = Resampler(timedelta(minutes=15), origin=datetime(2000, 1, 1, 0, 5))
+        buckets = resampler.add(datetime(2021, 1, 1, 10, 4, tzinfo=tz), 1.5)
+        buckets += resampler.add(datetime(2021, 1, 1, 10, 6, tzinfo=tz), 2.5)
+        self.assertEqual(len(buckets), 1)
+        buckets += resampler.flush()
+        self.assertEqual(
+            [a.start for a in buckets],
+            [
+                datetime(2021, 1, 1, 9, 50, tzinfo=tz),
+                datetime(2021, 1, 1, 10, 5, tzinfo=tz),
+            ],
+        )
+        self.assertIs(buckets[0].start.tzinfo, tz)
+        self.assertIn("count=1", repr(buckets[1]))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            Resampler(timedelta(0))
+        with self.assertRaises(ValueError):
+            Resampler(timedelta(minutes=1), lateness=timedelta(seconds=-1))
+        with self.assertRaises(TypeError):
+            Resampler(timedelta(minutes=1), lateness=5)
+        with self.assertRaises(TypeError):
+            Resampler(timedelta(minutes=1)).add("2021-01-01", 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
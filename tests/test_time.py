@@ -11,6 +11,7 @@
 # NOTE: This test is based off CPython and therefore linting is disabled within this file.
 # pylint:disable=invalid-name, no-member, cell-var-from-loop, unused-argument, no-self-use, too-few-public-methods, consider-using-enumerate, undefined-variable, wrong-import-order, wrong-import-position
 # CircuitPython subset implementation
+import pickle
 import sys
 
 sys.path.append("..")
@@ -20,6 +21,14 @@ import unittest
 from datetime import time as cpython_time
 
 from adafruit_datetime import time as cpy_time
+from adafruit_datetime import timedelta, timezone
+
+pickle_choices = [(pickle, pickle, proto) for proto in range(pickle.HIGHEST_PROTOCOL + 1)]
+
+
+class SubclassTime(cpy_time):
+    sub_var = 1
+
 
 # An arbitrary collection of objects of non-datetime types, for testing
 # mixed-type comparisons.
@@ -183,6 +192,19 @@ class TestTime(HarmlessMixedComparison, unittest.TestCase):
         self.assertEqual(dic[d], 2)
         self.assertEqual(dic[e], 2)
 
+    def test_sort_key(self):
+        t = self.theclass(1, 2, 3, 4)
+        self.assertEqual(t.sort_key(), 3723000004)
+        east = self.theclass(1, 2, 3, 4, tzinfo=timezone(timedelta(hours=1)))
+        self.assertEqual(east.sort_key(), 123000004)
+        west = self.theclass(0, 2, 3, 4, tzinfo=timezone(timedelta(0)))
+        self.assertEqual(east, west)
+        self.assertEqual(hash(east), hash(west))
+        self.assertLess(west, self.theclass(0, 2, 3, 5, tzinfo=timezone.utc))
+        times = [self.theclass(h, 59 - h, h) for h in (5, 23, 0, 12)]
+        self.assertEqual(sorted(times, key=self.theclass.sort_key), sorted(times))
+        self.assertRaises(TypeError, lambda: t < east)
+
     def test_isoformat(self):
         t = self.theclass(4, 5, 1, 123)
         self.assertEqual(t.isoformat(), "04:05:01.000123")
@@ -216,12 +238,51 @@ class TestTime(HarmlessMixedComparison, unittest.TestCase):
         self.assertEqual(t.isoformat(), "00:00:00.100000")
         self.assertEqual(t.isoformat(), str(t))
 
+    def test_fromisoformat(self):
+        for tstr, args in (
+            ("04", (4, 0)),
+            ("04:05", (4, 5)),
+            ("04:05:01", (4, 5, 1)),
+            ("04:05:01.123", (4, 5, 1, 123000)),
+            ("04:05:01.000123", (4, 5, 1, 123)),
+        ):
+            with self.subTest(tstr=tstr):
+                t = self.theclass.fromisoformat(tstr)
+                self.assertEqual(t, self.theclass(*args))
+                self.assertEqual(
+                    t.isoformat(), self.theclass_cpython.fromisoformat(tstr).isoformat()
+                )
+
+        t = self.theclass.fromisoformat("04:05:01-05:30")
+        self.assertEqual(t.utcoffset().total_seconds(), -(5 * 3600 + 30 * 60))
+        t = self.theclass.fromisoformat("04:05:01Z")
+        self.assertEqual(t.utcoffset().total_seconds(), 0)
+
+    def test_fromisoformat_fails(self):
+        bad_strs = [
+            "",
+            "4",
+            "04:5",
+            "04:05:",
+            "04:05:01.",
+            "04:05:01.1234",
+            "04:05:01+",
+            "04:05:01+05",
+            "04:05:01+05:3",
+            "04:05:01Z+00:00",
+            "04:05:01-05:00a",
+            "04;05",
+        ]
+        for bad_str in bad_strs:
+            with self.subTest(bad_str=bad_str):
+                with self.assertRaises(ValueError):
+                    self.theclass.fromisoformat(bad_str)
+
     def test_1653736(self):
         # verify it doesn't accept extra keyword arguments
         t = self.theclass(second=1)
         self.assertRaises(TypeError, t.isoformat, foo=3)
 
-    @unittest.skip("strftime not implemented for CircuitPython time objects")
     def test_strftime(self):
         t = self.theclass(1, 2, 3, 4)
         self.assertEqual(t.strftime("%H %M %S %f"), "01 02 03 000004")
@@ -233,7 +294,6 @@ class TestTime(HarmlessMixedComparison, unittest.TestCase):
         except UnicodeEncodeError:
             pass
 
-    @unittest.skip("strftime not implemented for CircuitPython time objects")
     def test_format(self):
         t = self.theclass(1, 2, 3, 4)
         self.assertEqual(format(t, ""), str(t))
@@ -286,7 +346,6 @@ class TestTime(HarmlessMixedComparison, unittest.TestCase):
         self.assertIsInstance(self.theclass.resolution, timedelta)
         self.assertTrue(self.theclass.max > self.theclass.min)
 
-    @unittest.skip("Skip for CircuitPython  - not implemented")
     def test_pickling(self):
         args = 20, 59, 16, 64**2
         orig = self.theclass(*args)
@@ -294,8 +353,34 @@ class TestTime(HarmlessMixedComparison, unittest.TestCase):
             green = pickler.dumps(orig, proto)
             derived = unpickler.loads(green)
             self.assertEqual(orig, derived)
+        orig = self.theclass(1, 30, tzinfo=timezone(timedelta(hours=2)), fold=1)
+        for pickler, unpickler, proto in pickle_choices:
+            derived = unpickler.loads(pickler.dumps(orig, proto))
+            self.assertEqual(derived.utcoffset(), orig.utcoffset())
+            self.assertEqual(derived.fold, 1 if proto > 3 else 0)
+        self.assertEqual(orig.__reduce__(), orig.__reduce_ex__(2))
+        state = cpython_time(23, 59, 16, 4096, fold=1).__reduce_ex__(4)[1]
+        self.assertEqual(self.theclass(*state).isoformat(), "23:59:16.004096")
+        self.assertEqual(self.theclass(*state).fold, 1)
+
+    def test_binary_encoding(self):
+        tz = timezone(timedelta(hours=2))
+        times = [
+            self.theclass(),
+            self.theclass(23, 59, 59, 999999, fold=1),
+            self.theclass(12, 0, 0, 65536),
+        ]
+        state = cpython_time(23, 59, 59, 999999, fold=1).__reduce_ex__(4)[1][0]
+        self.assertEqual(times[1].to_bytes(), state)
+        self.assertEqual(self.theclass.from_bytes(state).fold, 1)
+        self.assertEqual(self.theclass.from_bytes(state, 0, tz).tzinfo, tz)
+        buffer = bytearray(3 * self.theclass.packed_size)
+        self.assertEqual(self.theclass.pack_into(buffer, 0, times), len(buffer))
+        self.assertEqual(self.theclass.unpack_from(buffer, 0, 3), times)
+        self.assertEqual(self.theclass.unpack_from(buffer, 6, 1, tz)[0].tzinfo, tz)
+        with self.assertRaises(ValueError):
+            self.theclass.from_bytes(b"\x18\x00\x00\x00\x00\x00")
 
-    @unittest.skip("Skip for CircuitPython  - not implemented")
     def test_pickling_subclass_time(self):
         args = 20, 59, 16, 64**2
         orig = SubclassTime(*args)
@@ -0,0 +1,105 @@
+# SPDX-FileCopyrightText: 2001-2021 Python Software Foundation.All rights reserved.
+# SPDX-FileCopyrightText: 2000 BeOpen.com. All rights reserved.
+# SPDX-FileCopyrightText: 1995-2001 Corporation for National Research Initiatives.
+#                         All rights reserved.
+# SPDX-FileCopyrightText: 1995-2001 Corporation for National Research Initiatives.
+#                         All rights reserved.
+# SPDX-FileCopyrightText: 1991-1995 Stichting Mathematisch Centrum. All rights reserved.
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: Python-2.0
+# Implements a subset of https://github.com/python/cpython/blob/master/Lib/test/datetimetester.py
+# NOTE: This test is based off CPython and therefore linting is disabled within this file.
+# pylint:disable=invalid-name, no-member, wrong-import-position, protected-access
+import pickle
+import sys
+import unittest
+
+# CPython standard implementation
+from datetime import timedelta as cpython_timedelta
+
+# CircuitPython subset implementation
+sys.path.append("..")
+from adafruit_datetime import timedelta as cpy_timedelta
+
+
+class TestTimeDelta(unittest.TestCase):
+    theclass = cpy_timedelta
+    theclass_cpython = cpython_timedelta
+
+    def assertSameDelta(self, td, td_cpython):
+        self.assertEqual(
+            (td.days, td.seconds, td.microseconds),
+            (td_cpython.days, td_cpython.seconds, td_cpython.microseconds),
+        )
+
+    def test_int_constructor(self):
+        for args in [
+            (),
+            (1, 2, 3),
+            (-1, -2, -3),
+            (0, 86400, 1000000),
+            (0, -1, -1),
+            (1, 2, 3, 4, 5, 6, 7),
+            (-7, 6, -5, 4, -3, 2, -1),
+            (0, 0, 10**12),
+        ]:
+            with self.subTest(args=args):
+                self.assertSameDelta(self.theclass(*args), self.theclass_cpython(*args))
+        self.assertSameDelta(self.theclass(hours=1.5), self.theclass_cpython(hours=1.5))
+        self.assertRaises(OverflowError, self.theclass, 10**9)
+        self.assertRaises(OverflowError, self.theclass, 0, 0, -(10**9) * 86400 * 10**6)
+
+    def test_arithmetic(self):
+        a, b = (1, -5000, 999999), (-3, 86399, 1)
+        td_a, td_b = self.theclass(*a), self.theclass(*b)
+        cp_a, cp_b = self.theclass_cpython(*a), self.theclass_cpython(*b)
+        self.assertSameDelta(td_a + td_b, cp_a + cp_b)
+        self.assertSameDelta(td_a - td_b, cp_a - cp_b)
+        self.assertSameDelta(-td_a, -cp_a)
+        self.assertSameDelta(td_a * -7, cp_a * -7)
+        self.assertSameDelta(td_a * 0.5, cp_a * 0.5)
+        self.assertSameDelta(td_b // 3, cp_b // 3)
+        self.assertSameDelta(td_a % td_b, cp_a % cp_b)
+        self.assertEqual(td_a // td_b, cp_a // cp_b)
+
+        class Sub(self.theclass):
+            pass
+
+        self.assertIs(type(Sub(1) + Sub(2)), self.theclass)
+        self.assertIs(type(Sub(1, 2)), Sub)
+
+    def test_pickling(self):
+        for args in [(1, 2, 3), (-1, 0, 0), (999999999, 86399, 999999)]:
+            orig = self.theclass(*args)
+            for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+                derived = pickle.loads(pickle.dumps(orig, proto))
+                self.assertEqual(orig, derived)
+                self.assertIs(type(derived), self.theclass)
+            self.assertEqual(orig.__reduce__(), (self.theclass, args))
+
+    def test_binary_encoding(self):
+        deltas = [
+            self.theclass(0),
+            self.theclass(microseconds=-1),
+            self.theclass(999999999, 86399, 999999),
+            self.theclass(-999999999),
+            self.theclass(1, 2, 3),
+        ]
+        self.assertEqual(deltas[4].to_bytes(), b"\x00\x00\x00\x01\x00\x00\x1e\x84\x83")
+        for delta in deltas:
+            self.assertEqual(len(delta.to_bytes()), self.theclass.packed_size)
+            self.assertEqual(self.theclass.from_bytes(delta.to_bytes()), delta)
+        buffer = bytearray(len(deltas) * self.theclass.packed_size)
+        self.assertEqual(self.theclass.pack_into(buffer, 0, deltas), len(buffer))
+        self.assertEqual(self.theclass.unpack_from(memoryview(buffer), 0, len(deltas)), deltas)
+        with self.assertRaises(ValueError):
+            self.theclass.from_bytes(b"\x00\x00\x00\x00\x14\x1d\xd7\x60\x00")
+        # Corrupt day counts beyond +-999999999 are rejected like other fields.
+        for data in (
+            b"\x7f\xff\xff\xff\x00\x00\x00\x00\x00",
+            b"\x80\x00\x00\x00\x00\x00\x00\x00\x00",
+        ):
+            with self.assertRaisesRegex(ValueError, "days out of range"):
+                self.theclass.from_bytes(data)
+            with self.assertRaises(ValueError):
+                self.theclass.unpack_from(bytearray(9) + data, 0, 2)
@@ -0,0 +1,302 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+# pylint:disable=invalid-name, wrong-import-position, protected-access
+import copy
+import io
+import os
+import pickle
+import struct
+import sys
+import unittest
+
+# CPython standard implementation
+from datetime import datetime as cpython_datetime
+from datetime import timedelta as cpython_timedelta
+from datetime import timezone as cpython_timezone
+
+import zoneinfo
+
+# CircuitPython subset implementation
+sys.path.append("..")
+from adafruit_datetime import (
+    PosixTimeZone,
+    ZoneInfo,
+    ZoneInfoNotFoundError,
+    datetime,
+    timedelta,
+    timezone,
+)
+
+# Central European transitions of 2020 to 2022, at 01:00 UTC.
+BERLIN_TRANSITIONS = [
+    (1585443600, 1),
+    (1603587600, 0),
+    (1616893200, 1),
+    (1635642000, 0),
+    (1648342800, 1),
+    (1667091600, 0),
+]
+BERLIN_TYPES = [(3600, 0, 0), (7200, 1, 4)]
+
+
+def make_tzif(transitions, types, abbrs=b"CET\0CEST\0", footer=b"CET-1CEST,M3.5.0,M10.5.0/3"):
+    """Build a version 2 TZif file from (utc seconds, type index) transitions
+    and (utoff, isdst, abbrind) types."""
+    header = b"TZif2" + bytes(15)
+    header += struct.pack(">6l", 0, 0, 0, len(transitions), len(types), len(abbrs))
+
+    def block(code):
+        data = struct.pack(f">{len(transitions)}{code}", *[t for t, _ in transitions])
+        data += bytes(index for _, index in transitions)
+        for info in types:
+            data += struct.pack(">lBB", *info)
+        return data + abbrs
+
+    return header + block("l") + header + block("q") + b"\n" + footer + b"\n"
+
+
+class TestZoneInfo(unittest.TestCase):
+    def setUp(self):
+        data = make_tzif(BERLIN_TRANSITIONS, BERLIN_TYPES)
+        self.zone = ZoneInfo.from_bytes(data, "Test/Berlin")
+        self.zone_cpython = zoneinfo.ZoneInfo.from_file(io.BytesIO(data), key="Test/Berlin")
+
+    def local_pair(self, *args, fold=0):
+        return (
+            datetime(*args, tzinfo=self.zone, fold=fold),
+            cpython_datetime(*args, tzinfo=self.zone_cpython, fold=fold),
+        )
+
+    def test_local_times(self):
+        cases = [
+            (2020, 1, 15, 12),
+            (2020, 7, 1),
+            (2021, 3, 28, 1, 59, 59),
+            (2021, 3, 28, 2, 30),  # skipped by the clocks
+            (2021, 3, 28, 3),
+            (2021, 10, 31, 1, 59),
+            (2021, 10, 31, 2, 30),  # happens twice
+            (2021, 10, 31, 3),
+            (2022, 12, 31, 23, 59),
+            (1999, 1, 1),  # before the first transition
+        ]
+        for args in cases:
+            for fold in (0, 1):
+                ours, theirs = self.local_pair(*args, fold=fold)
+                with self.subTest(dt=theirs, fold=fold):
+                    self.assertEqual(
+                        ours.utcoffset().total_seconds(), theirs.utcoffset().total_seconds()
+                    )
+                    self.assertEqual(ours.dst().total_seconds(), theirs.dst().total_seconds())
+                    self.assertEqual(ours.tzname(), theirs.tzname())
+
+    def test_fromutc(self):
+        for transition, _ in BERLIN_TRANSITIONS:
+            for delta in range(-7200, 7201, 900):
+                utc = cpython_datetime(1970, 1, 1) + cpython_timedelta(seconds=transition + delta)
+                fields = (utc.year, utc.month, utc.day, utc.hour, utc.minute)
+                ours = self.zone.fromutc(datetime(*fields, tzinfo=self.zone))
+                theirs = self.zone_cpython.fromutc(utc.replace(tzinfo=self.zone_cpython))
+                with self.subTest(utc=utc):
+                    self.assertEqual(ours.isoformat(), theirs.isoformat())
+                    self.assertEqual(ours.fold, theirs.fold)
+                    self.assertEqual(ours.timestamp(), theirs.timestamp())
+
+        self.assertRaises(TypeError, self.zone.fromutc, None)
+        self.assertRaises(ValueError, self.zone.fromutc, datetime(2021, 1, 1))
+
+    def test_arithmetic_and_comparison(self):
+        before = datetime(2021, 3, 27, 12, tzinfo=self.zone)
+        after = datetime(2021, 3, 28, 12, tzinfo=self.zone)
+        utc = datetime(2021, 3, 28, 10, tzinfo=timezone.utc)
+        # Same zone: wall clock difference, as CPython does.
+        self.assertEqual(after - before, timedelta(days=1))
+        self.assertEqual(after - utc, timedelta(0))
+        self.assertEqual(after, utc)
+        self.assertEqual(hash(after), hash(utc))
+        self.assertLess(before, utc)
+        first = datetime(2021, 10, 31, 2, 30, tzinfo=self.zone)
+        second = datetime(2021, 10, 31, 2, 30, tzinfo=self.zone, fold=1)
+        self.assertEqual(second - utc.replace(month=10, day=31, hour=1, minute=30), timedelta(0))
+        self.assertNotEqual(first.utcoffset(), second.utcoffset())
+        self.assertEqual(hash(first), hash(second))
+
+    def test_fixed_zone(self):
+        data = make_tzif([], [(-18000, 0, 0)], abbrs=b"EST\0", footer=b"EST5")
+        zone = ZoneInfo.from_bytes(data)
+        self.assertEqual(zone.utcoffset(None), timedelta(hours=-5))
+        self.assertEqual(zone.tzname(None), "EST")
+        self.assertEqual(zone.dst(datetime(2021, 7, 1, tzinfo=zone)), timedelta(0))
+        self.assertIsNone(self.zone.utcoffset(None))
+        self.assertEqual(datetime(2021, 7, 1, tzinfo=zone).isoformat(), "2021-07-01T00:00:00-05:00")
+
+    def test_version_one(self):
+        data = make_tzif(BERLIN_TRANSITIONS, BERLIN_TYPES)
+        size = len(data) // 2
+        zone = ZoneInfo.from_bytes(b"TZif\0" + data[5:size])
+        summer = datetime(2021, 7, 1, tzinfo=zone)
+        self.assertEqual(summer.utcoffset(), timedelta(hours=2))
+        self.assertEqual(summer.tzname(), "CEST")
+
+    def test_from_buffer(self):
+        data = make_tzif(BERLIN_TRANSITIONS, BERLIN_TYPES)
+        for buffer in (bytearray(data), memoryview(data), memoryview(b"junk" + data)[4:]):
+            with self.subTest(buffer=type(buffer).__name__):
+                zone = ZoneInfo.from_bytes(buffer, "Test/Berlin")
+                for args in [(2021, 1, 1), (2021, 7, 1), (2040, 7, 1)]:
+                    ours = datetime(*args, tzinfo=zone)
+                    self.assertEqual(
+                        ours.utcoffset(), datetime(*args, tzinfo=self.zone).utcoffset()
+                    )
+                self.assertEqual(datetime(2040, 7, 1, tzinfo=zone).tzname(), "CEST")
+
+    def test_errors(self):
+        self.assertRaises(ValueError, ZoneInfo.from_bytes, b"NotTZif" + bytes(60))
+        self.assertRaises(ValueError, ZoneInfo, "../etc/passwd")
+        self.assertRaises(ValueError, ZoneInfo, "/etc/passwd")
+        with self.assertRaises(ZoneInfoNotFoundError):
+            ZoneInfo("No/Such_Zone")
+        self.assertTrue(issubclass(ZoneInfoNotFoundError, KeyError))
+
+    def test_repr(self):
+        self.assertEqual(str(self.zone), "Test/Berlin")
+        self.assertEqual(repr(self.zone), "ZoneInfo(key='Test/Berlin')")
+        self.assertEqual(self.zone.key, "Test/Berlin")
+
+    @unittest.skipUnless(
+        os.path.exists("/usr/share/zoneinfo/Europe/Berlin"), "system tzdata is not installed"
+    )
+    def test_system_zone(self):
+        zone = ZoneInfo("Europe/Berlin")
+        self.assertIs(ZoneInfo("Europe/Berlin"), zone)
+        self.assertIsNot(ZoneInfo.no_cache("Europe/Berlin"), zone)
+        ZoneInfo.clear_cache(only_keys=["Europe/Berlin"])
+        self.assertIsNot(ZoneInfo("Europe/Berlin"), zone)
+        ZoneInfo.clear_cache()
+        # Only the most recently used zones stay cached.
+        zone = ZoneInfo("Europe/Berlin")
+        for key in ["UTC", "Europe/Paris", "Europe/Rome", "Asia/Tokyo", "America/New_York"]:
+            ZoneInfo(key)
+            self.assertIs(ZoneInfo("Europe/Berlin"), zone)
+        for key in ["Europe/Madrid", "Europe/Oslo", "Asia/Seoul", "Asia/Dubai", "Africa/Cairo"]:
+            ZoneInfo(key)
+        for key in ["Europe/Vienna", "Europe/Prague", "Europe/Dublin"]:
+            ZoneInfo(key)
+        self.assertLessEqual(len(ZoneInfo._cache._entries), 8)
+        self.assertIsNot(ZoneInfo("Europe/Berlin"), zone)
+        ZoneInfo.clear_cache()
+
+        zone = ZoneInfo("Europe/Berlin")
+        theirs = zoneinfo.ZoneInfo("Europe/Berlin")
+        for timestamp in range(-1000000000, 2000000000, 9876543):
+            utc = cpython_datetime.fromtimestamp(timestamp, cpython_timezone.utc)
+            expected = utc.astimezone(theirs)
+            local = datetime(*expected.timetuple()[:6], tzinfo=zone, fold=expected.fold)
+            with self.subTest(local=expected):
+                self.assertEqual(local.timestamp(), timestamp)
+                self.assertEqual(local.tzname(), expected.tzname())
+
+    def test_footer_rule(self):
+        # Past the last transition the zone follows its footer rule string.
+        for args in [(2030, 3, 31, 2, 30), (2030, 10, 27, 2, 30), (2040, 7, 1)]:
+            for fold in (0, 1):
+                ours, theirs = self.local_pair(*args, fold=fold)
+                with self.subTest(dt=theirs, fold=fold):
+                    self.assertEqual(
+                        ours.utcoffset(), timedelta(seconds=theirs.utcoffset().seconds)
+                    )
+                    self.assertEqual(ours.tzname(), theirs.tzname())
+                    self.assertEqual(ours.timestamp(), theirs.timestamp())
+        utc = datetime(2030, 10, 27, 0, 30, tzinfo=self.zone)
+        local = self.zone.fromutc(utc + timedelta(hours=1))
+        self.assertEqual((local.hour, local.fold), (2, 1))
+
+
+class TestPosixTimeZone(unittest.TestCase):
+    RULES = [
+        "CET-1CEST,M3.5.0,M10.5.0/3",
+        "EST5EDT,M3.2.0,M11.1.0",
+        "AEST-10AEDT,M10.1.0,M4.1.0/3",
+        "IST-1GMT0,M10.5.0,M3.5.0/1",
+        "<-04>4<-03>,M9.1.6/24,M4.1.6/24",
+        "<-02>2<-01>,M3.5.0/-1,M10.5.0/0",
+        "<+1030>-10:30<+11>-11,M10.1.0,M4.1.0",
+        "NST3:30NDT,M3.2.0,M11.1.0",
+        "XXX3YYY,J60/1,J300",
+        "XXX-3YYY,59,299/26",
+        "<+0330>-3:30",
+    ]
+
+    def test_against_cpython(self):
+        for rule in self.RULES:
+            zone = PosixTimeZone(rule)
+            data = make_tzif([], [(0, 0, 0)], abbrs=b"UTC\0", footer=rule.encode())
+            theirs = zoneinfo.ZoneInfo.from_file(io.BytesIO(data))
+            for year in (2000, 2023, 2024):
+                for seconds in range(0, 366 * 86400, 86400 * 3 + 3541):
+                    utc = cpython_datetime(year, 1, 1) + cpython_timedelta(seconds=seconds)
+                    expected = utc.replace(tzinfo=cpython_timezone.utc).astimezone(theirs)
+                    fields = (utc.year, utc.month, utc.day, utc.hour, utc.minute, utc.second)
+                    local = zone.fromutc(datetime(*fields, tzinfo=zone))
+                    with self.subTest(rule=rule, utc=utc):
+                        self.assertEqual(local.isoformat(), expected.isoformat())
+                        self.assertEqual(local.fold, expected.fold)
+                        self.assertEqual(local.tzname(), expected.tzname())
+                        self.assertEqual(
+                            local.dst().total_seconds(), expected.dst().total_seconds()
+                        )
+                        self.assertEqual(local.timestamp(), expected.timestamp())
+
+    def test_gap_and_fold(self):
+        zone = PosixTimeZone("CET-1CEST,M3.5.0,M10.5.0/3")
+        skipped = datetime(2024, 3, 31, 2, 30, tzinfo=zone)
+        self.assertEqual(skipped.utcoffset(), timedelta(hours=1))
+        self.assertEqual(skipped.replace(fold=1).utcoffset(), timedelta(hours=2))
+        first = datetime(2024, 10, 27, 2, 30, tzinfo=zone)
+        second = first.replace(fold=1)
+        self.assertEqual((first.tzname(), second.tzname()), ("CEST", "CET"))
+        self.assertEqual(second.timestamp() - first.timestamp(), 3600)
+        self.assertIsNone(zone.utcoffset(None))
+        self.assertEqual(PosixTimeZone("<+0330>-3:30").utcoffset(None), timedelta(minutes=210))
+        # DST without rules follows the United States ones.
+        self.assertEqual(PosixTimeZone("EST5EDT")._bounds(2024), (1710054000, 1730613600))
+
+    def test_year_cache(self):
+        zone = PosixTimeZone("CET-1CEST,M3.5.0,M10.5.0/3")
+        self.assertIs(zone._bounds(2024), zone._bounds(2024))
+        for year in range(2000, 2010):
+            datetime(year, 6, 1, tzinfo=zone).utcoffset()
+        self.assertEqual(len(zone._years._entries), 4)
+
+    def test_invalid(self):
+        for rule in ["", "CE-1", "CET", "CETx", "CET-1CEST,M3.5.0", "CET-1CEST,M13.5.0,M10.5.0"]:
+            with self.subTest(rule=rule):
+                self.assertRaises(ValueError, PosixTimeZone, rule)
+
+    def test_equality_and_pickle(self):
+        zone = PosixTimeZone("CET-1CEST,M3.5.0,M10.5.0/3")
+        for copied in (copy.copy(zone), copy.deepcopy(zone), pickle.loads(pickle.dumps(zone))):
+            self.assertEqual(copied, zone)
+            self.assertEqual(hash(copied), hash(zone))
+        self.assertNotEqual(zone, PosixTimeZone("EST5EDT"))
+        self.assertNotEqual(zone, timezone.utc)
+        self.assertIs(PosixTimeZone("CET-1CEST,M3.5.0,M10.5.0/3"), zone)
+        # Equality does not depend on the shared instance.
+        evicted = object.__new__(PosixTimeZone)
+        evicted._rule = zone._rule
+        self.assertEqual(evicted, zone)
+        self.assertEqual(len({zone, evicted}), 1)
+        dt = datetime(2024, 10, 27, 2, 30, tzinfo=zone, fold=1)
+        restored = pickle.loads(pickle.dumps(dt))
+        self.assertIs(restored.tzinfo, zone)
+        self.assertEqual(restored.utcoffset(), timedelta(hours=1))
+        self.assertEqual(restored, dt)
+
+    def test_repr(self):
+        zone = PosixTimeZone("EST5EDT")
+        self.assertEqual(str(zone), "EST5EDT")
+        self.assertEqual(repr(zone), "PosixTimeZone('EST5EDT')")
+
+
+if __name__ == "__main__":
+    unittest.main()